@@ -1,11 +1,15 @@
 
 import streamlit as st
-import cv2
 import numpy as np
 import mediapipe as mp
 import time
-from utils import mediapipe_detection, draw_styled_landmarks, extract_keypoints, mp_holistic
+from utils import (mediapipe_detection, draw_styled_landmarks, extract_keypoints, mp_holistic,
+                   create_holistic, create_adaptive_holistic)
 from translator_engine import GlossTranslator
+from modules.activity_gate import ActivityGate
+from modules.frame_source import DEFAULT_SOURCE, open_source
+from modules.pipeline_runtime import PipelineRuntime
+from modules.quality_tiers import DEFAULT_TIER, TIER_ORDER
 
 # Page Config
 st.set_page_config(layout="wide", page_title="OmniSign ISL", page_icon="🤟")
@@ -52,6 +56,17 @@ target_lang_code = st.sidebar.selectbox(
     format_func=lambda x: st.session_state.translator.get_supported_languages()[x],
     index=0 # Default English
 )
+quality = st.sidebar.selectbox(
+    "Detector quality",
+    options=["auto"] + list(TIER_ORDER),
+    index=0,
+    help="'auto' starts at the deployment tier and steps down when the camera falls behind"
+)
+frame_source = st.sidebar.text_input(
+    "Frame source",
+    value=DEFAULT_SOURCE,
+    help="Camera index, a recorded video file, or stored landmarks (.npy file or data folder)"
+)
 
 # Main App Logic
 if mode == "Sign to Text":
@@ -76,51 +91,98 @@ if mode == "Sign to Text":
         status_text = st.empty()
         status_text.text("Initializing Camera...")
         
-        cap = cv2.VideoCapture(0)
+        cap = open_source(frame_source)
+        # Landmark replay: the stored landmarks stand in for MediaPipe
+        replay_detector = cap.detector()
         
         if not cap.isOpened():
             st.error("Could not open webcam. Please check your camera settings.")
         
         # Load MediaPipe Holistic
-        elif mp_holistic:
+        elif mp_holistic or replay_detector is not None:
             status_text.text("Loading AI Model...")
-            with mp_holistic.Holistic(min_detection_confidence=0.5, min_tracking_confidence=0.5) as holistic:
-                status_text.text("Running...")
-                
-                while cap.isOpened():
-                    # Check if user stopped
-                    # Streamlit handles this by interrupting, but explicit breaks help sometimes
-                    if not run_camera:
-                        break
-                        
+            # Skip prediction while nobody is signing; the lite model watches for hands meanwhile
+            gate = ActivityGate()
+            last_results = None
+            if replay_detector is not None:
+                detector = light_detector = replay_detector
+            else:
+                detector = (create_adaptive_holistic(DEFAULT_TIER) if quality == "auto"
+                            else create_holistic(tier=quality))
+                light_detector = create_holistic(tier='face_off')
+            with detector as holistic, light_detector as light_holistic:
+
+                def read_frame():
                     ret, frame = cap.read()
-                    if not ret:
-                        st.error("Failed to read from camera.")
-                        break
-                    
+                    return frame if ret else None
+
+                def detect(packet):
+                    global last_results
+                    packet.data['active'] = False
+                    if not gate.should_detect():
+                        packet.data['results'] = last_results
+                        return packet
                     # Make detections
-                    image, results = mediapipe_detection(frame, holistic)
-                    
-                    # Draw landmarks
-                    draw_styled_landmarks(image, results)
-                    
-                    # Logic for Prediction (Placeholder for Day 1)
-                    # Simulating detection for demonstration
-                    current_gloss = "WAITING..."
-                    if results and (results.left_hand_landmarks or results.right_hand_landmarks):
-                        # Mock detection logic
-                        import random
-                        if random.random() > 0.95: 
-                           current_gloss = random.choice(["HELLO", "NAMASTE", "ME FINE", "HELP NEED"])
-                    
-                    # Translation
-                    translated_text = st.session_state.translator.gloss_to_sentence(current_gloss, target_lang_code)
-                    
-                    # Update UI
-                    st_frame.image(image, channels="BGR", use_column_width=True)
-                    st_gloss.info(f"**Gloss:** `{current_gloss}`")
-                    st_sentence.success(f"**Translated:** {translated_text}")
-                    
+                    packet.frame, results = mediapipe_detection(
+                        packet.frame, holistic if gate.active else light_holistic)
+                    packet.data['results'] = last_results = results
+                    packet.data['active'] = gate.update(extract_keypoints(results))
+                    if gate.just_woke and light_holistic is not holistic:
+                        # Detected without a face: redo the waking frame with the full detector
+                        packet.frame, results = mediapipe_detection(packet.frame, holistic)
+                        packet.data['results'] = last_results = results
+                    return packet
+
+                # Camera and MediaPipe run on worker threads; this script thread
+                # only renders the newest processed frame (stale ones are dropped)
+                with PipelineRuntime(read_frame, [("landmarks", detect)]) as runtime:
+                    status_text.text("Running...")
+
+                    while cap.isOpened():
+                        # Check if user stopped
+                        # Streamlit handles this by interrupting, but explicit breaks help sometimes
+                        if not run_camera:
+                            break
+
+                        packet = runtime.latest(timeout=1.0)
+                        if packet is None:
+                            if runtime.finished:
+                                st.error("Failed to read from camera.")
+                                break
+                            continue
+                        render_start = time.perf_counter()
+                        image, results = packet.frame, packet.data['results']
+
+                        # Draw landmarks
+                        draw_styled_landmarks(image, results)
+
+                        # Logic for Prediction (Placeholder for Day 1)
+                        # Simulating detection for demonstration
+                        current_gloss = "WAITING..."
+                        if packet.data['active'] and results and (results.left_hand_landmarks or results.right_hand_landmarks):
+                            # Mock detection logic
+                            import random
+                            if random.random() > 0.95:
+                               current_gloss = random.choice(["HELLO", "NAMASTE", "ME FINE", "HELP NEED"])
+
+                        # Translation
+                        translated_text = st.session_state.translator.gloss_to_sentence(current_gloss, target_lang_code)
+
+                        # Update UI
+                        st_frame.image(image, channels="BGR", use_column_width=True)
+                        st_gloss.info(f"**Gloss:** `{current_gloss}`")
+                        st_sentence.success(f"**Translated:** {translated_text}")
+                        runtime.record("render", time.perf_counter() - render_start)
+
+                        stats = runtime.stats()
+                        status_text.text(
+                            "Running... " + "  ".join(
+                                f"{name} {s['latency_ms']:.0f}ms q{s['queue_depth']} drop {s['dropped']}"
+                                for name, s in stats.items() if name != "end_to_end")
+                            + f"  lag {stats['end_to_end']['latency_ms']:.0f}ms"
+                            + f"  quality {getattr(holistic, 'tier', quality)}"
+                        )
+
             status_text.text("Stopped.")
             cap.release()
             
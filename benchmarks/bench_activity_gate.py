@@ -0,0 +1,153 @@
+"""
+Benchmark: CPU saved by activity gating on a mostly-idle kiosk session
+
+Replays a landmark session (idle stretches with nobody or a still person
+in view, interleaved with signing) through the predict_sign.py loop with
+and without ActivityGate:
+
+- ungated: full detector and streaming inference on every frame
+- gated:   inference only while active; while idle the detector runs on
+           every idle_detect_stride-th frame, with the lite configuration
+
+Inference CPU time is measured (time.process_time) on an untrained
+DualStreamSignRecognizer. Detector cost cannot be replayed from stored
+landmarks, so detector calls are counted per configuration and costed
+with --full-ms / --lite-ms (measure them on the deployment machine).
+
+Usage:
+    python benchmarks/bench_activity_gate.py --minutes 2 --idle-share 0.8
+    python benchmarks/bench_activity_gate.py --data-path Sign_Language_Data --actions Hello
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project to path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from data_pipeline.data_loader import DataLoader
+from data_pipeline.keypoint_schema import HOLISTIC_LAYOUT, MANUAL
+from models.dual_stream_model import DualStreamSignRecognizer
+from modules.activity_gate import ActivityGate
+from modules.streaming_recognizer import StreamingRecognizer
+
+
+def synthetic_signs(count: int, frames: int, seed: int = 0) -> np.ndarray:
+    """Signing windows: face/pose present, both hands moving."""
+    rng = np.random.default_rng(seed)
+    X = rng.normal(0.5, 0.02, (count, frames, HOLISTIC_LAYOUT.size)).astype(np.float32)
+    t = np.linspace(0, 1, frames)
+    for i in range(count):
+        for segment in HOLISTIC_LAYOUT.stream_segments(MANUAL):
+            hand = HOLISTIC_LAYOUT.view(X[i], segment.name)
+            hand[..., 0] += 0.15 * np.sin(2 * np.pi * (1 + i % 3) * t)[:, None]
+    return X
+
+
+def build_session(signs: np.ndarray, total_frames: int, idle_share: float, seed: int = 0):
+    """
+    Interleave signs with idle stretches: nobody in view, or a person
+    standing still with hands visible.
+    """
+    rng = np.random.default_rng(seed)
+    sign_frames = signs.shape[1]
+    num_signs = max(1, int(total_frames * (1 - idle_share) / sign_frames))
+    idle_total = total_frames - num_signs * sign_frames
+    idle_lengths = rng.multinomial(idle_total, np.ones(num_signs + 1) / (num_signs + 1))
+
+    session, signing = [], []
+    for i in range(num_signs + 1):
+        idle = HOLISTIC_LAYOUT.allocate(idle_lengths[i])
+        if i % 2:  # Someone standing still: same frame repeated, slight jitter
+            idle[:] = signs[0, 0]
+            idle += rng.normal(0, 0.0005, idle.shape).astype(np.float32)
+        session.append(idle)
+        signing.append(np.zeros(len(idle), bool))
+        if i < num_signs:
+            session.append(signs[rng.integers(len(signs))])
+            signing.append(np.ones(sign_frames, bool))
+    return np.concatenate(session), np.concatenate(signing)
+
+
+def replay(session, recognizer, gate=None):
+    """Run the predict_sign.py per-frame logic; returns counters and inference CPU seconds."""
+    counts = {'full': 0, 'lite': 0, 'skipped': 0, 'inferences': 0}
+    active_on_sign = []
+    cpu = 0.0
+    recognizer.reset()
+    for frame in session:
+        if gate is not None and not gate.should_detect():
+            counts['skipped'] += 1
+            active_on_sign.append(False)
+            continue
+        counts['full' if gate is None or gate.active else 'lite'] += 1
+        active = gate.update(frame) if gate is not None else True
+        active_on_sign.append(active)
+
+        start = time.process_time()
+        if gate is not None and gate.just_went_idle:
+            recognizer.reset()
+        if active and recognizer.push(frame) is not None:
+            counts['inferences'] += 1
+        cpu += time.process_time() - start
+    return counts, cpu, np.array(active_on_sign)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--data-path")
+    parser.add_argument("--actions", nargs="+")
+    parser.add_argument("--minutes", type=float, default=1.0, help="Session length at 30 FPS")
+    parser.add_argument("--idle-share", type=float, default=0.8)
+    parser.add_argument("--full-ms", type=float, default=35.0, help="Full Holistic cost per frame")
+    parser.add_argument("--lite-ms", type=float, default=20.0, help="Lite Holistic cost per frame")
+    args = parser.parse_args()
+
+    if args.data_path:
+        signs, _ = DataLoader(args.data_path, args.actions, convert_legacy=True).load_data()
+    else:
+        signs = synthetic_signs(8, 30)
+    session, signing = build_session(signs, int(args.minutes * 60 * 30), args.idle_share)
+
+    model, _ = DualStreamSignRecognizer(num_classes=5, sequence_length=30).build_model()
+    recognizer = StreamingRecognizer(model, HOLISTIC_LAYOUT, 30)
+    recognizer.push(signs[0, 0])  # Trace the forward pass outside the timings
+    recognizer.frames_seen = 29
+    recognizer.push(signs[0, 0])
+
+    results = {
+        'ungated': replay(session, recognizer),
+        'gated': replay(session, recognizer, ActivityGate(HOLISTIC_LAYOUT)),
+    }
+
+    print("\nActivity gating on a replayed kiosk session")
+    print("=" * 60)
+    print(f"Frames {len(session)} ({len(session) / 30:.0f} s at 30 FPS), "
+          f"signing {signing.mean() * 100:.0f}%")
+    for name, (counts, cpu, active) in results.items():
+        detector_s = (counts['full'] * args.full_ms + counts['lite'] * args.lite_ms) / 1000
+        print(f"\n{name}")
+        print(f"  detector calls:  full {counts['full']:6d}   lite {counts['lite']:6d}   "
+              f"skipped {counts['skipped']:6d}   (~{detector_s:6.1f} s at "
+              f"{args.full_ms:.0f}/{args.lite_ms:.0f} ms)")
+        print(f"  model inference: {counts['inferences']:6d} windows, {cpu:6.1f} s CPU")
+        print(f"  total:           ~{detector_s + cpu:6.1f} s CPU for {len(session) / 30:.0f} s of video")
+        if name == 'gated':
+            print(f"  signing frames seen while active: {active[signing].mean() * 100:5.1f}%   "
+                  f"idle frames gated off: {(~active[~signing]).mean() * 100:5.1f}%")
+
+    (ungated_counts, ungated_cpu, _), (gated_counts, gated_cpu, _) = results['ungated'], results['gated']
+    ungated_total = ungated_counts['full'] * args.full_ms / 1000 + ungated_cpu
+    gated_total = ((gated_counts['full'] * args.full_ms + gated_counts['lite'] * args.lite_ms) / 1000
+                   + gated_cpu)
+    print(f"\nCPU saved: {(1 - gated_total / ungated_total) * 100:.0f}% "
+          f"(inference alone {(1 - gated_cpu / ungated_cpu) * 100:.0f}%)")
+
+
+if __name__ == "__main__":
+    main()
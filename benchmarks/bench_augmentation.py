@@ -0,0 +1,85 @@
+"""
+Benchmark: materialized augment_data vs streamed per-batch augmentation
+
+Runs one epoch of batches over a synthetic dataset both ways and reports
+peak extra memory (tracemalloc) and samples/sec. The streamed path also
+checks that the same seed reproduces the same batches.
+
+Usage:
+    python benchmarks/bench_augmentation.py --samples 2000 --factor 3
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+# Add project to path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from data_pipeline.augmentation import StreamingAugmenter
+from data_pipeline.data_loader import DataLoader
+from data_pipeline.keypoint_schema import HOLISTIC_LAYOUT
+
+
+def run_epoch(batches) -> int:
+    """Consume an epoch of batches and return the number of samples seen."""
+    return sum(len(y_batch) for _, y_batch in batches)
+
+
+def measure(fn):
+    """Return (result, seconds, peak MiB allocated while fn ran)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, seconds, peak / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--samples", type=int, default=2000)
+    parser.add_argument("--frames", type=int, default=30)
+    parser.add_argument("--factor", type=int, default=2)
+    parser.add_argument("--batch-size", type=int, default=32)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    X = rng.random((args.samples, args.frames, HOLISTIC_LAYOUT.size), dtype=np.float32)
+    y = rng.integers(0, 5, args.samples)
+    loader = DataLoader("unused", ["a"], sequence_length=args.frames)
+
+    def materialized():
+        X_aug, y_aug = loader.augment_data(X, y, augmentation_factor=args.factor)
+        return run_epoch(loader.create_batches(X_aug, y_aug, args.batch_size))
+
+    def streamed(seed=0):
+        augmenter = StreamingAugmenter(loader.layout, seed=seed)
+        return run_epoch(loader.create_batches(X, y, args.batch_size, augmenter=augmenter,
+                                               augmentation_factor=args.factor, seed=seed))
+
+    def first_batch(seed):
+        augmenter = StreamingAugmenter(loader.layout, seed=seed)
+        return next(loader.create_batches(X, y, args.batch_size, augmenter=augmenter,
+                                          augmentation_factor=args.factor, seed=seed))[0]
+
+    assert np.array_equal(first_batch(7), first_batch(7)), "Seeded augmentation is not reproducible"
+
+    dataset_mib = X.nbytes / 2**20
+    print("\nAugmentation benchmark")
+    print("=" * 60)
+    print(f"Dataset: {X.shape}  ({dataset_mib:.0f} MiB)  factor {args.factor}x")
+    for name, fn in (("materialized", materialized), ("streamed", streamed)):
+        samples, seconds, peak = measure(fn)
+        print(f"{name:>13s}: {samples / seconds:9.0f} samples/s   "
+              f"peak +{peak:7.1f} MiB  ({peak / dataset_mib:4.2f}x dataset)")
+
+
+if __name__ == "__main__":
+    main()
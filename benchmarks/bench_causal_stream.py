@@ -0,0 +1,164 @@
+"""
+Benchmark: bidirectional vs causal/stateful dual-stream model
+
+1. Accuracy: trains DualStreamSignRecognizer and
+   CausalDualStreamSignRecognizer on the same split and compares held-out
+   accuracy for the bidirectional model (full window), the causal model
+   (full window) and the causal model run frame by frame with
+   IncrementalDualStreamStepper over a continuous stream of the test
+   sequences (state carried across sign boundaries, as live).
+2. Cost: per-frame inference time of the sliding-window
+   StreamingRecognizer vs the stepper as the window grows.
+
+Uses synthetic direction/frequency-coded trajectories unless --data-path
+points at recorded data.
+
+Usage:
+    python benchmarks/bench_causal_stream.py --epochs 8
+    python benchmarks/bench_causal_stream.py --data-path Sign_Language_Data --actions Hello Goodbye
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import numpy as np
+
+# Add project to path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from sklearn.model_selection import train_test_split
+from tensorflow import keras
+
+from data_pipeline.data_loader import DataLoader
+from data_pipeline.keypoint_schema import HOLISTIC_LAYOUT, MANUAL
+from models.causal_stream_model import (
+    CausalDualStreamSignRecognizer, IncrementalDualStreamStepper
+)
+from models.ctc_training import CTCTrainingPipeline
+from models.dual_stream_model import DualStreamSignRecognizer
+from modules.streaming_recognizer import StreamingRecognizer
+
+
+def synthetic_dataset(num_classes: int, per_class: int, frames: int, seed: int = 0):
+    """Hand trajectories whose class is set by frequency and direction of motion."""
+    rng = np.random.default_rng(seed)
+    X = rng.normal(0.5, 0.05, (num_classes * per_class, frames, HOLISTIC_LAYOUT.size))
+    y = np.repeat(np.arange(num_classes), per_class)
+    t = np.linspace(0, 1, frames)
+    for i, label in enumerate(y):
+        frequency = 1 + label // 2
+        direction = 1 if label % 2 == 0 else -1
+        phase = rng.uniform(0, 0.3)
+        for segment in HOLISTIC_LAYOUT.stream_segments(MANUAL):
+            hand = HOLISTIC_LAYOUT.view(X[i], segment.name)
+            hand[..., 0] += 0.2 * np.sin(2 * np.pi * (frequency * t + phase))[:, None]
+            hand[..., 1] += direction * 0.2 * (t - 0.5)[:, None]
+    return X.astype(np.float32), y
+
+
+def train(recognizer_class, X_train, y_train, num_classes, epochs, batch_size):
+    keras.utils.set_random_seed(0)
+    model, training_model = recognizer_class(num_classes=num_classes,
+                                             sequence_length=X_train.shape[1]).build_model()
+    with tempfile.TemporaryDirectory() as tmp:
+        pipeline = CTCTrainingPipeline(training_model, num_classes, tmp)
+    optimizer = keras.optimizers.Adam(1e-3)
+    loader = DataLoader("unused", ["a"])
+    for epoch in range(epochs):
+        batches = ((list(HOLISTIC_LAYOUT.split_streams(X_batch)), y_batch)
+                   for X_batch, y_batch in loader.create_batches(
+                       X_train, y_train, batch_size, seed=epoch))
+        pipeline.train_epoch(batches, optimizer)
+    return model
+
+
+def window_accuracy(model, X, y) -> float:
+    predictions = model.predict(list(HOLISTIC_LAYOUT.split_streams(X)), verbose=0)
+    return float(np.mean(np.argmax(predictions, axis=-1) == y))
+
+
+def streaming_accuracy(model, X, y, reset_each: bool, seed: int = 0) -> float:
+    """Feed test sequences back to back and classify at each sequence's last frame."""
+    stepper = IncrementalDualStreamStepper(model, HOLISTIC_LAYOUT, X.shape[1])
+    order = np.random.default_rng(seed).permutation(len(y))
+    correct = 0
+    for i in order:
+        if reset_each:
+            stepper.reset()
+        for frame in X[i]:
+            probabilities = stepper.step(frame[HOLISTIC_LAYOUT.manual_slice],
+                                         frame[HOLISTIC_LAYOUT.non_manual_slice])
+        correct += int(np.argmax(probabilities) == y[i])
+    return correct / len(y)
+
+
+def per_frame_ms(step, frames) -> float:
+    step(frames[0])  # Warm-up / trace
+    start = time.perf_counter()
+    for frame in frames:
+        step(frame)
+    return 1000 * (time.perf_counter() - start) / len(frames)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--data-path")
+    parser.add_argument("--actions", nargs="+")
+    parser.add_argument("--classes", type=int, default=6)
+    parser.add_argument("--per-class", type=int, default=60)
+    parser.add_argument("--epochs", type=int, default=8)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--windows", type=int, nargs="+", default=[30, 60, 120])
+    args = parser.parse_args()
+
+    loader = DataLoader("unused", ["a"])
+    if args.data_path:
+        loader = DataLoader(args.data_path, args.actions, convert_legacy=True)
+        X, y = loader.load_data()
+    else:
+        X, y = synthetic_dataset(args.classes, args.per_class, 30)
+    num_classes = int(y.max()) + 1
+
+    train_idx, test_idx = train_test_split(np.arange(len(y)), test_size=0.3,
+                                           random_state=42, stratify=y)
+    loader.normalize(X, fit=True)
+    X_train, y_train, X_test, y_test = X[train_idx], y[train_idx], X[test_idx], y[test_idx]
+
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        bidirectional = train(DualStreamSignRecognizer, X_train, y_train, num_classes,
+                              args.epochs, args.batch_size)
+        causal = train(CausalDualStreamSignRecognizer, X_train, y_train, num_classes,
+                       args.epochs, args.batch_size)
+
+    print("\nHeld-out accuracy")
+    print("=" * 60)
+    print(f"Train {len(y_train)}  test {len(y_test)}  classes {num_classes}  epochs {args.epochs}")
+    print(f"  bidirectional, full window:       {window_accuracy(bidirectional, X_test, y_test):.3f}")
+    print(f"  causal, full window:              {window_accuracy(causal, X_test, y_test):.3f}")
+    print(f"  causal stepper, reset per sign:   {streaming_accuracy(causal, X_test, y_test, True):.3f}")
+    print(f"  causal stepper, continuous state: {streaming_accuracy(causal, X_test, y_test, False):.3f}")
+
+    print("\nPer-frame inference cost (ms/frame, every frame)")
+    print("=" * 60)
+    frames = np.random.default_rng(1).random((60, HOLISTIC_LAYOUT.size), dtype=np.float32)
+    for window in args.windows:
+        bi_model, _ = DualStreamSignRecognizer(num_classes, sequence_length=window).build_model()
+        causal_model, _ = CausalDualStreamSignRecognizer(num_classes, sequence_length=window).build_model()
+        sliding = StreamingRecognizer(bi_model, HOLISTIC_LAYOUT, window)
+        sliding.frames_seen = window  # Window already full: every push runs inference
+        stepper = IncrementalDualStreamStepper(causal_model, HOLISTIC_LAYOUT, window)
+        stepper.frames_seen = window
+        sliding_ms = per_frame_ms(sliding.push, frames)
+        stepper_ms = per_frame_ms(stepper.push, frames)
+        print(f"  window {window:4d}: sliding bidirectional {sliding_ms:7.2f}   "
+              f"causal stepper {stepper_ms:6.2f}   ({sliding_ms / stepper_ms:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
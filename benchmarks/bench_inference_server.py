@@ -0,0 +1,161 @@
+"""
+Benchmark: batched inference server throughput and tail latency, 1 -> 64 clients
+
+Starts serve_model.py in its own process (an untrained
+DualStreamSignRecognizer unless --model is given) and drives it with N
+concurrent clients - threads of this process, each with its own socket
+connection like a kiosk process. Each client sends a window, waits for its
+probabilities and sends the next one (closed loop), or paces itself at
+--client-fps windows per second like a kiosk running inference every few
+camera frames.
+
+Every client count runs against two servers:
+
+- batched: dynamic batching up to --max-batch-size windows or --max-delay-ms
+- batch 1: one forward pass per request, as when every kiosk runs its own
+  batch-1 model (same transport, so the difference is the batching)
+
+Reports throughput, client-side round-trip latency p50/p95/p99 and the
+server's mean batch size. Server and clients share the machine's CPUs.
+
+Usage:
+    python benchmarks/bench_inference_server.py
+    python benchmarks/bench_inference_server.py --clients 1 8 64 --seconds 10 --client-fps 10
+    python benchmarks/bench_inference_server.py --model sign_language_model.h5
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project to path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from data_pipeline.keypoint_schema import HOLISTIC_LAYOUT
+from modules.inference_server import InferenceClient
+
+
+def start_server(args, socket_path: str, max_batch_size: int) -> subprocess.Popen:
+    """Launch serve_model.py and wait until it accepts connections."""
+    command = [sys.executable, str(PROJECT_ROOT / "serve_model.py"), "--socket", socket_path,
+               "--max-batch-size", str(max_batch_size), "--max-delay-ms", str(args.max_delay_ms),
+               "--stats-interval", "0"]
+    command += ["--model", args.model] if args.model else ["--untrained", str(args.num_classes)]
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    deadline = time.perf_counter() + 300
+    while time.perf_counter() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"serve_model.py exited with code {process.returncode}")
+        try:
+            InferenceClient(socket_path).close()
+            return process
+        except OSError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError("serve_model.py did not start")
+
+
+def server_info(socket_path: str) -> dict:
+    """Server statistics (short-lived connection: an idle client would hold batches open)."""
+    with InferenceClient(socket_path) as client:
+        return client.info()
+
+
+def run_level(socket_path: str, num_clients: int, seconds: float, client_fps: float):
+    """N clients for `seconds`; returns (round-trip latencies, completed requests, wall seconds)."""
+    rng = np.random.default_rng(num_clients)
+    clients = [InferenceClient(socket_path) for _ in range(num_clients)]
+    latencies = [[] for _ in clients]
+    barrier = threading.Barrier(num_clients + 1)
+    stop_at = [0.0]
+
+    def drive(index: int):
+        client = clients[index]
+        manual, non_manual = HOLISTIC_LAYOUT.split_streams(
+            rng.normal(0, 1, (30, HOLISTIC_LAYOUT.size)).astype(np.float32))
+        barrier.wait()
+        next_send = time.perf_counter() + (index / num_clients / client_fps if client_fps else 0)
+        while True:
+            if client_fps:
+                delay = next_send - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                next_send += 1.0 / client_fps
+            start = time.perf_counter()
+            if start >= stop_at[0]:
+                break
+            client.forward(manual, non_manual)
+            latencies[index].append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=drive, args=(index,), daemon=True) for index in range(num_clients)]
+    for thread in threads:
+        thread.start()
+    stop_at[0] = time.perf_counter() + seconds
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - start
+    for client in clients:
+        client.close()
+
+    all_latencies = np.concatenate([np.asarray(values) for values in latencies]) * 1000
+    return all_latencies, len(all_latencies), wall
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--model", help="Trained Keras model (default: untrained DualStreamSignRecognizer)")
+    parser.add_argument("--num-classes", type=int, default=5, help="Classes of the untrained model")
+    parser.add_argument("--clients", nargs="+", type=int, default=[1, 2, 4, 8, 16, 32, 64])
+    parser.add_argument("--seconds", type=float, default=5.0, help="Duration per client count")
+    parser.add_argument("--client-fps", type=float, default=0.0,
+                        help="Windows per second per client (default: closed loop, as fast as possible)")
+    parser.add_argument("--max-batch-size", type=int, default=32)
+    parser.add_argument("--max-delay-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    print("\nInference server: N kiosk clients -> one model process")
+    print("=" * 60)
+    print(f"Model: {args.model or f'untrained DualStreamSignRecognizer ({args.num_classes} classes)'}"
+          f"   CPUs: {os.cpu_count()}")
+    print(f"Load: {f'{args.client_fps:g} windows/s per client' if args.client_fps else 'closed loop'}, "
+          f"{args.seconds:g} s per client count")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for label, max_batch_size in ((f"batched (max {args.max_batch_size}, "
+                                       f"{args.max_delay_ms:g} ms)", args.max_batch_size),
+                                      ("batch 1", 1)):
+            socket_path = str(Path(directory) / f"server-{max_batch_size}.sock")
+            server = start_server(args, socket_path, max_batch_size)
+            try:
+                print(f"\n{label}")
+                print(f"  {'clients':>7s} {'windows/s':>10s} {'p50':>8s} {'p95':>8s} {'p99':>8s} "
+                      f"{'batch':>6s}")
+                for num_clients in args.clients:
+                    before = server_info(socket_path)
+                    latencies, completed, wall = run_level(socket_path, num_clients, args.seconds,
+                                                           args.client_fps)
+                    after = server_info(socket_path)
+                    batches = after['batches'] - before['batches']
+                    requests = after['requests'] - before['requests']
+                    print(f"  {num_clients:7d} {completed / wall:10.1f} "
+                          f"{np.percentile(latencies, 50):6.1f}ms {np.percentile(latencies, 95):6.1f}ms "
+                          f"{np.percentile(latencies, 99):6.1f}ms "
+                          f"{requests / batches if batches else 0:6.1f}", flush=True)
+            finally:
+                server.terminate()
+                server.wait()
+
+
+if __name__ == "__main__":
+    main()
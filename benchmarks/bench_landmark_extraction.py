@@ -0,0 +1,115 @@
+"""
+Micro-benchmark: per-frame landmark-to-array conversion cost
+
+Compares the previous per-landmark Python loop against the bulk
+``landmarks_to_array`` path used by MediaPipeFeatureExtractor. Driven by
+synthetic landmark lists, so no camera or MediaPipe model is needed.
+
+Usage:
+    python benchmarks/bench_landmark_extraction.py --frames 2000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+# Add project to path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from data_pipeline.feature_extractor import MediaPipeFeatureExtractor
+
+
+def make_landmark_list(num_points: int, rng: np.random.Generator) -> SimpleNamespace:
+    """Build an object shaped like a MediaPipe NormalizedLandmarkList."""
+    values = rng.random((num_points, 4))
+    return SimpleNamespace(landmark=[
+        SimpleNamespace(x=float(x), y=float(y), z=float(z), visibility=float(v))
+        for x, y, z, v in values
+    ])
+
+
+def make_results(rng: np.random.Generator) -> SimpleNamespace:
+    """Synthetic Holistic results with every part detected (worst case)."""
+    return SimpleNamespace(
+        left_hand_landmarks=make_landmark_list(21, rng),
+        right_hand_landmarks=make_landmark_list(21, rng),
+        face_landmarks=make_landmark_list(468, rng),
+        pose_landmarks=make_landmark_list(33, rng),
+    )
+
+
+def legacy_extract(results) -> np.ndarray:
+    """Previous implementation: one Python assignment per landmark."""
+    hand_landmarks = np.zeros((42, 4))
+    if results.left_hand_landmarks:
+        for i, lm in enumerate(results.left_hand_landmarks.landmark):
+            hand_landmarks[i] = [lm.x, lm.y, lm.z, lm.visibility]
+    if results.right_hand_landmarks:
+        for i, lm in enumerate(results.right_hand_landmarks.landmark):
+            hand_landmarks[21 + i] = [lm.x, lm.y, lm.z, lm.visibility]
+    
+    face_landmarks = np.zeros((468, 3))
+    if results.face_landmarks:
+        for idx, lm in enumerate(results.face_landmarks.landmark):
+            if idx < 468:
+                face_landmarks[idx] = [lm.x, lm.y, lm.z]
+    
+    body_landmarks = np.zeros((33, 4))
+    if results.pose_landmarks:
+        for i, lm in enumerate(results.pose_landmarks.landmark):
+            body_landmarks[i] = [lm.x, lm.y, lm.z, lm.visibility]
+    
+    return np.concatenate([hand_landmarks.flatten(), face_landmarks.flatten(),
+                           body_landmarks.flatten()])
+
+
+def time_per_frame(fn, frames) -> float:
+    """Return mean seconds per call of fn over all frames."""
+    start = time.perf_counter()
+    for results in frames:
+        fn(results)
+    return (time.perf_counter() - start) / len(frames)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--frames", type=int, default=2000, help="Synthetic frames to convert")
+    parser.add_argument("--distinct", type=int, default=50, help="Distinct synthetic frames to cycle through")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    
+    rng = np.random.default_rng(args.seed)
+    pool = [make_results(rng) for _ in range(args.distinct)]
+    frames = [pool[i % len(pool)] for i in range(args.frames)]
+    
+    extractor = MediaPipeFeatureExtractor()
+    out = extractor.layout.allocate()
+    
+    def bulk_extract(results):
+        return extractor.concatenate_landmarks(extractor.landmarks_from_results(results), out=out)
+    
+    # Both paths must produce the same feature vector
+    np.testing.assert_allclose(bulk_extract(frames[0]), legacy_extract(frames[0]), rtol=1e-6)
+    
+    # Warm up both paths before timing
+    time_per_frame(legacy_extract, frames[:100])
+    time_per_frame(bulk_extract, frames[:100])
+    
+    legacy = time_per_frame(legacy_extract, frames)
+    bulk = time_per_frame(bulk_extract, frames)
+    
+    print("Landmark extraction micro-benchmark")
+    print("=" * 50)
+    print(f"Frames:              {args.frames}")
+    print(f"Per-landmark loop:   {legacy * 1e6:8.1f} us/frame")
+    print(f"Bulk conversion:     {bulk * 1e6:8.1f} us/frame")
+    print(f"Speedup:             {legacy / bulk:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark: serial vs parallel DataLoader.load_data
+
+Writes a synthetic per-frame tree (default 100 actions × 30 sequences) and
+loads it serially and with thread/process pools of increasing size,
+checking that every parallel run returns exactly the serial X and y.
+
+Usage:
+    python benchmarks/bench_parallel_loading.py --frames 30 --workers 2 4 8
+    python benchmarks/bench_parallel_loading.py --consolidated
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import numpy as np
+
+# Add project to path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.bench_sequence_store import write_frame_tree
+from data_pipeline.data_loader import DataLoader
+from migrate_data import migrate_frame_tree
+
+
+def timed_load(root: Path, actions: list, args, num_workers: int, backend: str):
+    """Load the tree and return (X, y, seconds)."""
+    loader = DataLoader(str(root), actions, args.sequences, args.frames,
+                        num_workers=num_workers, parallel_backend=backend)
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        start = time.perf_counter()
+        X, y = loader.load_data()
+        seconds = time.perf_counter() - start
+    return X, y, seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--actions", type=int, default=100)
+    parser.add_argument("--sequences", type=int, default=30)
+    parser.add_argument("--frames", type=int, default=30)
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4, 8])
+    parser.add_argument("--consolidated", action="store_true",
+                        help="Benchmark the consolidated SequenceStore instead of per-frame files")
+    args = parser.parse_args()
+
+    actions = [f"action_{i:03d}" for i in range(args.actions)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "Sign_Language_Data"
+        print(f"Writing synthetic tree ({args.actions}x{args.sequences}x{args.frames})...")
+        write_frame_tree(root, actions, args.sequences, args.frames)
+        if args.consolidated:
+            with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+                migrate_frame_tree(str(root), actions, args.sequences, args.frames,
+                                   remove_frames=True)
+
+        X_ref, y_ref, serial = timed_load(root, actions, args, 1, "thread")
+
+        print("\nParallel loading benchmark")
+        print("=" * 50)
+        print(f"Format: {'consolidated' if args.consolidated else 'per-frame'}  "
+              f"CPUs: {os.cpu_count()}")
+        print(f"{'serial':>8s} {1:3d} workers: {serial:7.3f}s")
+
+        for backend in ("thread", "process"):
+            for workers in args.workers:
+                X, y, seconds = timed_load(root, actions, args, workers, backend)
+                assert np.array_equal(X, X_ref) and np.array_equal(y, y_ref), \
+                    f"{backend} x{workers} changed the output order"
+                print(f"{backend:>8s} {workers:3d} workers: {seconds:7.3f}s "
+                      f"({serial / seconds:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
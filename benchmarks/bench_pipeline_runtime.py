@@ -0,0 +1,145 @@
+"""
+Benchmark: serial real-time loop vs PipelineRuntime
+
+Simulates a camera delivering frames at --camera-fps and landmark,
+inference and render stages with fixed costs (sleeps, which release the
+GIL like MediaPipe / TensorFlow kernels do), then runs them
+
+1. serially, as predict_sign.py used to (read -> landmarks -> inference
+   -> render in one loop), and
+2. on PipelineRuntime (capture, landmarks and inference threads, render on
+   the main thread).
+
+Reports processed FPS, capture-to-display latency, how late the camera was
+read (frames the driver had to buffer or drop because the loop was busy)
+and the runtime's per-stage queue depth / drop counts.
+
+Usage:
+    python benchmarks/bench_pipeline_runtime.py
+    python benchmarks/bench_pipeline_runtime.py --landmarks-ms 45 --inference-ms 20 --seconds 10
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project to path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from modules.pipeline_runtime import PipelineRuntime
+
+
+class SimulatedCamera:
+    """Frames become available every 1 / fps seconds; read() waits for the next one."""
+
+    def __init__(self, fps: float, seconds: float):
+        self.period = 1.0 / fps
+        self.total = int(fps * seconds)
+        self.start = None
+        self.next_index = 0
+        self.lateness = []  # How long each frame waited before it was read
+
+    def read(self):
+        now = time.perf_counter()
+        if self.start is None:
+            self.start = now
+        # A busy reader skips frames the driver has already overwritten
+        available = int((now - self.start) / self.period)
+        index = max(self.next_index, available)
+        if index >= self.total:
+            return None
+        due = self.start + index * self.period
+        if due > now:
+            time.sleep(due - now)
+        self.lateness.append(max(0.0, time.perf_counter() - due))
+        self.next_index = index + 1
+        return index
+
+
+def run_serial(args):
+    camera = SimulatedCamera(args.camera_fps, args.seconds)
+    latencies = []
+    shown = 0
+    start = time.perf_counter()
+    while True:
+        frame = camera.read()
+        if frame is None:
+            break
+        captured = time.perf_counter()
+        time.sleep(args.landmarks_ms / 1000)
+        time.sleep(args.inference_ms / 1000)
+        time.sleep(args.render_ms / 1000)
+        latencies.append(time.perf_counter() - captured)
+        shown += 1
+    elapsed = time.perf_counter() - start
+    return shown / elapsed, latencies, camera, None
+
+
+def run_pipelined(args):
+    camera = SimulatedCamera(args.camera_fps, args.seconds)
+
+    def landmarks(packet):
+        time.sleep(args.landmarks_ms / 1000)
+        return packet
+
+    def inference(packet):
+        time.sleep(args.inference_ms / 1000)
+        return packet
+
+    runtime = PipelineRuntime(camera.read, [("landmarks", landmarks), ("inference", inference)],
+                              queue_size=args.queue_size, window=100000)
+    latencies = []
+    shown = 0
+    start = time.perf_counter()
+    with runtime:
+        while True:
+            packet = runtime.latest(timeout=1.0)
+            if packet is None:
+                if runtime.finished:
+                    break
+                continue
+            render_start = time.perf_counter()
+            time.sleep(args.render_ms / 1000)
+            runtime.record("render", time.perf_counter() - render_start)
+            latencies.append(packet.age)
+            shown += 1
+    elapsed = time.perf_counter() - start
+    return shown / elapsed, latencies, camera, runtime
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--camera-fps", type=float, default=30)
+    parser.add_argument("--landmarks-ms", type=float, default=30)
+    parser.add_argument("--inference-ms", type=float, default=15)
+    parser.add_argument("--render-ms", type=float, default=5)
+    parser.add_argument("--queue-size", type=int, default=1)
+    parser.add_argument("--seconds", type=float, default=5)
+    args = parser.parse_args()
+
+    print("\nSerial loop vs pipelined runtime")
+    print("=" * 60)
+    print(f"Camera {args.camera_fps:.0f} FPS; stage costs landmarks {args.landmarks_ms:.0f} ms, "
+          f"inference {args.inference_ms:.0f} ms, render {args.render_ms:.0f} ms")
+
+    for name, run in (("serial", run_serial), ("pipelined", run_pipelined)):
+        fps, latencies, camera, runtime = run(args)
+        latencies = np.array(latencies) * 1000
+        lateness = np.array(camera.lateness) * 1000
+        skipped = camera.total - len(camera.lateness)
+        print(f"\n{name}")
+        print(f"  displayed FPS:            {fps:6.1f}")
+        print(f"  capture->display latency: mean {latencies.mean():6.1f} ms   "
+              f"p95 {np.percentile(latencies, 95):6.1f} ms")
+        print(f"  camera read lateness:     mean {lateness.mean():6.1f} ms   "
+              f"frames skipped by driver {skipped}")
+        if runtime is not None:
+            print(runtime.report())
+
+
+if __name__ == "__main__":
+    main()
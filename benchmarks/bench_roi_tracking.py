@@ -0,0 +1,105 @@
+"""
+Benchmark: detector frame time with and without ROI tracking
+
+Runs MediaPipe Holistic over recorded clips twice, each time with a fresh
+detector: on every full frame, and through RoiTracker (crop around the
+previous frame's landmarks, full frame on track loss). Reports mean and
+p95 detector time per frame, the share of frames processed on a crop,
+track losses, and how far the ROI landmarks deviate from the full-frame
+ones (mean absolute x/y difference of points detected in both runs).
+
+Needs MediaPipe: the mock Holistic's cost does not depend on image size.
+
+Usage:
+    python benchmarks/bench_roi_tracking.py --video Sign_Language_Data/clip1.mp4 Sign_Language_Data/clip2.mp4
+    python benchmarks/bench_roi_tracking.py --video clip.mp4 --max-side 0
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+# Add project to path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from data_pipeline.keypoint_schema import HOLISTIC_LAYOUT
+from modules.roi_tracker import DEFAULT_MAX_SIDE, RoiTracker
+from utils import HAS_MEDIAPIPE, create_holistic, extract_keypoints
+
+
+def run_clip(video: str, tracker=None, max_frames: int = 0):
+    """Detect every frame of a clip; returns per-frame seconds and keypoint rows."""
+    cap = cv2.VideoCapture(video)
+    times, rows = [], []
+    with create_holistic() as holistic:
+        while not max_frames or len(times) < max_frames:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            start = time.perf_counter()
+            if tracker is not None:
+                results = tracker.process(holistic, frame)
+            else:
+                results = holistic.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+            times.append(time.perf_counter() - start)
+            rows.append(extract_keypoints(results))
+    cap.release()
+    return np.array(times), np.stack(rows) if rows else np.zeros((0, 0))
+
+
+def xy_deviation(full: np.ndarray, roi: np.ndarray) -> float:
+    """Mean absolute x/y difference over (frame, point) pairs detected in both runs."""
+    diffs = []
+    for segment in HOLISTIC_LAYOUT.segments:
+        shape = (len(full), segment.num_points, segment.values_per_point)
+        a = full[:, segment.slice].reshape(shape)[..., :2]
+        b = roi[:, segment.slice].reshape(shape)[..., :2]
+        both = a.any(axis=-1) & b.any(axis=-1)
+        diffs.append(np.abs(a - b)[both].ravel())
+    diffs = np.concatenate(diffs)
+    return float(diffs.mean()) if diffs.size else float('nan')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--video", nargs="+", required=True, help="Recorded clips")
+    parser.add_argument("--max-side", type=int, default=DEFAULT_MAX_SIDE,
+                        help="Downscale crops to this longer side (0: full resolution)")
+    parser.add_argument("--max-frames", type=int, default=0, help="Frames per clip (0: all)")
+    args = parser.parse_args()
+
+    if not HAS_MEDIAPIPE:
+        sys.exit("MediaPipe is not installed: ROI tracking cannot be benchmarked on the mock detector")
+
+    print("\nROI tracking: Holistic time per frame")
+    print("=" * 60)
+    total_full = total_roi = 0.0
+    for video in args.video:
+        full_times, full_rows = run_clip(video, max_frames=args.max_frames)
+        if not len(full_times):
+            print(f"{video}: no frames read")
+            continue
+        tracker = RoiTracker(max_side=args.max_side or None)
+        roi_times, roi_rows = run_clip(video, tracker, args.max_frames)
+        total_full += full_times.sum()
+        total_roi += roi_times.sum()
+
+        print(f"\n{video} ({len(full_times)} frames)")
+        for name, times in (("full frame", full_times), ("roi", roi_times)):
+            print(f"  {name:10s} mean {times.mean() * 1000:6.1f} ms   "
+                  f"p95 {np.percentile(times, 95) * 1000:6.1f} ms")
+        print(f"  frame time -{(1 - roi_times.mean() / full_times.mean()) * 100:.0f}%   "
+              f"crop share {tracker.crop_share * 100:.0f}%   losses {tracker.losses}   "
+              f"landmark deviation {xy_deviation(full_rows, roi_rows):.4f}")
+
+    if total_full:
+        print(f"\nOverall frame time reduction: {(1 - total_roi / total_full) * 100:.0f}%")
+
+
+if __name__ == "__main__":
+    main()
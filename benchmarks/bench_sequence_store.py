@@ -0,0 +1,85 @@
+"""
+Benchmark: per-frame .npy tree vs consolidated SequenceStore
+
+Writes a synthetic dataset in the per-frame layout, times DataLoader on it,
+migrates it with migrate_data.migrate_frame_tree (removing the frame
+files) and times DataLoader again on the consolidated store. Reports load
+time and file (inode) count for both.
+
+Usage:
+    python benchmarks/bench_sequence_store.py --actions 25 --sequences 30
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project to path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from data_pipeline.data_loader import DataLoader
+from data_pipeline.keypoint_schema import HOLISTIC_LAYOUT
+from migrate_data import count_files, migrate_frame_tree
+
+
+def write_frame_tree(root: Path, actions: list, sequences: int, frames: int, seed: int = 0):
+    """Write random keypoints in the legacy one-file-per-frame layout."""
+    rng = np.random.default_rng(seed)
+    for action in actions:
+        for seq in range(sequences):
+            seq_dir = root / action / str(seq)
+            seq_dir.mkdir(parents=True)
+            data = rng.random((frames, HOLISTIC_LAYOUT.size), dtype=np.float32)
+            for frame in range(frames):
+                np.save(seq_dir / f"{frame}.npy", data[frame])
+
+
+def timed_load(root: Path, actions: list, sequences: int, frames: int):
+    """Load the dataset with DataLoader and return (X, seconds)."""
+    loader = DataLoader(str(root), actions, sequences, frames)
+    start = time.perf_counter()
+    X, _ = loader.load_data()
+    return X, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--actions", type=int, default=25)
+    parser.add_argument("--sequences", type=int, default=30)
+    parser.add_argument("--frames", type=int, default=30)
+    args = parser.parse_args()
+
+    actions = [f"action_{i:03d}" for i in range(args.actions)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "Sign_Language_Data"
+        print(f"Writing synthetic per-frame tree ({args.actions}x{args.sequences}x{args.frames})...")
+        write_frame_tree(root, actions, args.sequences, args.frames)
+
+        files_before = count_files(root)
+        X_frames, frames_seconds = timed_load(root, actions, args.sequences, args.frames)
+
+        stats = migrate_frame_tree(str(root), actions, args.sequences, args.frames,
+                                   remove_frames=True)
+
+        X_store, store_seconds = timed_load(root, actions, args.sequences, args.frames)
+        files_after = count_files(root)
+
+    assert np.array_equal(X_frames, X_store), "Consolidated data differs from per-frame data"
+
+    print("\nSequence storage benchmark")
+    print("=" * 50)
+    print(f"Sequences:             {len(X_store)}")
+    print(f"Per-frame files:       {files_before:8d} files   load {frames_seconds:7.3f}s")
+    print(f"Consolidated store:    {files_after:8d} files   load {store_seconds:7.3f}s")
+    print(f"Migration:             {stats['seconds']:7.3f}s")
+    print(f"Load speedup:          {frames_seconds / store_seconds:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Benchmark: end-to-end latency of recorded sessions replayed through the live path
+
+Replays stored sessions through the same pipelined path as predict_sign.py -
+capture -> landmarks -> model -> translation - with every stage on its own
+PipelineRuntime thread, and reports p50/p95/p99 latency per stage, capture
+to result latency, and sustained FPS. Sources (see modules/frame_source.py):
+
+- a recorded video file: landmarks from MediaPipe Holistic (the mock, fixed
+  50 ms per call, when MediaPipe is not installed)
+- stored landmarks (.npy file or data directory): replayed instead of
+  detection, so the run is reproducible and needs neither camera nor MediaPipe
+
+By default sources are paced at their frame rate, like a camera (stages that
+fall behind drop frames); --max-throughput replays unpaced without drops.
+The model is an untrained DualStreamSignRecognizer unless --model is given.
+
+Usage:
+    python benchmarks/bench_session_replay.py
+    python benchmarks/bench_session_replay.py --source Sign_Language_Data session.mp4 --stride 2
+    python benchmarks/bench_session_replay.py --source session.npy --max-throughput
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+# Add project to path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from data_pipeline.keypoint_schema import HOLISTIC_LAYOUT
+from models.dual_stream_model import DualStreamSignRecognizer
+from modules.frame_source import LandmarkReplaySource, open_source
+from modules.pipeline_runtime import PipelineRuntime
+from modules.streaming_recognizer import StreamingRecognizer
+from modules.translator import BidirectionalCommunicationEngine
+from utils import HAS_MEDIAPIPE, create_holistic, extract_keypoints, mediapipe_detection
+
+ACTIONS = ["Hello", "Goodbye", "Thank you", "How are you", "I need help"]
+STAGES = ("capture", "landmarks", "inference", "translation", "end_to_end")
+
+
+def synthetic_session(frames: int, seed: int = 0) -> np.ndarray:
+    """Face/pose present, both hands moving (used when no source is given)."""
+    rng = np.random.default_rng(seed)
+    session = rng.normal(0.5, 0.02, (frames, HOLISTIC_LAYOUT.size)).astype(np.float32)
+    t = np.arange(frames) / 30
+    for name in ("left_hand", "right_hand"):
+        HOLISTIC_LAYOUT.view(session, name)[..., 0] += 0.15 * np.sin(2 * np.pi * t)[:, None]
+    return session
+
+
+def load_model(path):
+    if path:
+        from tensorflow.keras.models import load_model as keras_load_model
+        return keras_load_model(path)
+    model, _ = DualStreamSignRecognizer(num_classes=len(ACTIONS), sequence_length=30).build_model()
+    return model
+
+
+def replay(source, recognizer, translator, realtime: bool):
+    """Run one source through the pipeline; returns runtime stats and wall seconds."""
+    detector = source.detector() or create_holistic()
+    recognizer.reset()
+
+    def read_frame():
+        ret, frame = source.read()
+        return frame if ret else None
+
+    def detect(packet):
+        packet.frame, results = mediapipe_detection(packet.frame, detector)
+        packet.data['keypoints'] = extract_keypoints(results)
+        return packet
+
+    def infer(packet):
+        packet.data['predictions'] = recognizer.push(packet.data['keypoints'])
+        return packet
+
+    def translate(packet):
+        predictions = packet.data['predictions']
+        if predictions is not None:
+            sign = ACTIONS[int(np.argmax(predictions)) % len(ACTIONS)]
+            packet.data['translation'] = translator.process_sign_input(sign, "en")['translation']
+        return packet
+
+    frames = int(source.get(cv2.CAP_PROP_FRAME_COUNT)) or 100_000  # Stats cover the whole run
+    runtime = PipelineRuntime(read_frame, [("landmarks", detect), ("inference", infer),
+                                           ("translation", translate)],
+                              drop_stale=realtime, window=frames)
+    start = time.perf_counter()
+    delivered = 0
+    with detector, runtime:
+        while True:
+            packet = runtime.get(timeout=1.0)
+            if packet is None:
+                if runtime.finished:
+                    break
+                continue
+            delivered += 1
+        seconds = time.perf_counter() - start
+        return runtime.stats(), delivered, seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--source", nargs="+",
+                        help="Video files and/or landmark .npy files / data directories "
+                             "(default: a synthetic landmark session)")
+    parser.add_argument("--seconds", type=float, default=20.0, help="Length of the synthetic session")
+    parser.add_argument("--model", help="Trained Keras model (default: untrained DualStreamSignRecognizer)")
+    parser.add_argument("--stride", type=int, default=1, help="Inference stride")
+    parser.add_argument("--max-throughput", action="store_true",
+                        help="Unpaced replay without frame drops (default: paced like a camera)")
+    args = parser.parse_args()
+    realtime = not args.max_throughput
+
+    recognizer = StreamingRecognizer(load_model(args.model), HOLISTIC_LAYOUT, 30, stride=args.stride)
+    recognizer.push(HOLISTIC_LAYOUT.allocate())  # Trace the forward pass outside the timings
+    recognizer.frames_seen = 29
+    recognizer.push(HOLISTIC_LAYOUT.allocate())
+    translator = BidirectionalCommunicationEngine()
+
+    print("\nSession replay: capture -> landmarks -> model -> translation")
+    print("=" * 60)
+    print(f"Mode: {'paced at source FPS (drops when behind)' if realtime else 'max throughput, no drops'}"
+          f"   stride {args.stride}")
+    print(f"Video detector: {'MediaPipe Holistic' if HAS_MEDIAPIPE else 'mock Holistic (50 ms/call)'}")
+
+    specs = args.source or [None]
+    for spec in specs:
+        if spec is None:
+            session = synthetic_session(int(args.seconds * 30))
+            source = LandmarkReplaySource(session, realtime=realtime)
+            name = f"synthetic landmarks ({args.seconds:.0f} s)"
+        else:
+            source = open_source(spec, realtime=realtime)
+            if not source.isOpened():
+                print(f"\n{spec}: could not be opened")
+                continue
+            name = spec
+
+        with source:
+            stats, delivered, seconds = replay(source, recognizer, translator, realtime)
+
+        print(f"\n{name}: {source.frames_read} frames captured, {delivered} results in "
+              f"{seconds:.1f} s -> sustained {delivered / seconds:.1f} FPS "
+              f"(source {source.fps:.0f} FPS)")
+        print(f"  {'stage':>12s} {'p50':>8s} {'p95':>8s} {'p99':>8s} {'mean':>8s} {'done':>6s} {'dropped':>7s}")
+        for stage in STAGES:
+            s = stats[stage]
+            print(f"  {stage:>12s} {s['p50_ms']:6.1f}ms {s['p95_ms']:6.1f}ms {s['p99_ms']:6.1f}ms "
+                  f"{s['latency_ms']:6.1f}ms {s['processed']:6d} {s['dropped']:7d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+Benchmark: landmark windows between processes, multiprocessing.Queue vs SharedFrameRing
+
+A capture process produces one (1704,) landmark frame per camera frame and
+a model process consumes the latest (30, 1704) window after every frame:
+
+- queue: the producer puts the whole window on a multiprocessing.Queue
+  (pickled, written to a pipe, unpickled: ~200 KB per window)
+- ring: the producer writes the frame once into a SharedFrameRing
+  (modules/shared_ring.py); the consumer reads it in order and copies the
+  latest window out of shared memory (--zero-copy: uses it in place)
+
+Each transport runs at every --fps (paced producer, 0 = as fast as
+possible). Reports delivered windows/s, capture-to-consumer latency
+p50/p99, consumer and producer CPU per window, bytes moved per window and
+frames lost. --work-ms simulates a consumer slower than the camera: the
+queue then builds an ever-growing backlog (latency climbs) while the ring
+reader is overrun, skips ahead and reports what it lost.
+
+Usage:
+    python benchmarks/bench_shared_ring.py
+    python benchmarks/bench_shared_ring.py --fps 30 300 0 --frames 3000
+    python benchmarks/bench_shared_ring.py --fps 30 --work-ms 50
+"""
+
+import argparse
+import multiprocessing as mp
+import pickle
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project to path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from data_pipeline.keypoint_schema import HOLISTIC_LAYOUT
+from modules.shared_ring import SharedFrameRing
+
+
+def pace(start: float, index: int, fps: float):
+    """Sleep until frame `index` is due."""
+    if fps:
+        delay = start + index / fps - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+
+def queue_producer(queue, frames: int, fps: float, window_length: int, results):
+    rng = np.random.default_rng(0)
+    window = np.zeros((window_length, HOLISTIC_LAYOUT.size), np.float32)
+    cpu = time.process_time()
+    start = time.perf_counter()
+    for index in range(frames):
+        pace(start, index, fps)
+        window[:-1] = window[1:]
+        window[-1] = rng.random(HOLISTIC_LAYOUT.size, dtype=np.float32)
+        if index >= window_length - 1:
+            queue.put((index, time.perf_counter(), window.copy()))  # put() pickles later, in a feeder thread
+    queue.put(None)
+    results.put(('producer', time.process_time() - cpu))
+
+
+def queue_consumer(queue, work_ms: float, results):
+    latencies = []
+    cpu = time.process_time()
+    while True:
+        item = queue.get()
+        if item is None:
+            break
+        _, timestamp, window = item
+        latencies.append(time.perf_counter() - timestamp)
+        if work_ms:
+            time.sleep(work_ms / 1000)
+    results.put(('consumer', time.process_time() - cpu, latencies, 0, 0))
+
+
+def ring_producer(name: str, frames: int, fps: float, results):
+    ring = SharedFrameRing.attach(name)
+    rng = np.random.default_rng(0)
+    frame = np.empty(HOLISTIC_LAYOUT.size, np.float32)
+    cpu = time.process_time()
+    start = time.perf_counter()
+    for index in range(frames):
+        pace(start, index, fps)
+        frame[:] = rng.random(HOLISTIC_LAYOUT.size, dtype=np.float32)
+        ring.write(frame)
+    results.put(('producer', time.process_time() - cpu))
+    ring.close()
+
+
+def ring_consumer(name: str, frames: int, window_length: int, zero_copy: bool, work_ms: float,
+                  ready, results):
+    ring = SharedFrameRing.attach(name)
+    reader = ring.reader('oldest')
+    frame = np.empty(ring.frame_shape, np.float32)
+    window = np.empty((window_length,) + ring.frame_shape, np.float32)
+    latencies = []
+    ready.set()
+    cpu = time.process_time()
+    while reader.next_seq < frames:
+        if reader.read(timeout=5.0, out=frame) is None:
+            break
+        latest = ring.window(window_length, copy=not zero_copy, out=window)
+        if latest is not None:
+            latencies.append(time.perf_counter() - ring.timestamp(latest[0]))
+        if work_ms:
+            time.sleep(work_ms / 1000)
+    results.put(('consumer', time.process_time() - cpu, latencies, reader.overruns, reader.lost))
+    ring.close()
+
+
+def collect(results, processes, frames: int, wall_start: float):
+    """Wait for producer and consumer; returns one row of measurements."""
+    row = {}
+    for _ in processes:
+        item = results.get()
+        if item[0] == 'producer':
+            row['producer_cpu'] = item[1]
+        else:
+            row['wall'] = time.perf_counter() - wall_start
+            _, row['consumer_cpu'], latencies, row['overruns'], row['lost'] = item
+            row['latencies'] = np.asarray(latencies) * 1000
+    for process in processes:
+        process.join()
+    return row
+
+
+def run_queue(ctx, frames: int, fps: float, window_length: int, work_ms: float):
+    queue, results = ctx.Queue(), ctx.Queue()
+    consumer = ctx.Process(target=queue_consumer, args=(queue, work_ms, results))
+    producer = ctx.Process(target=queue_producer, args=(queue, frames, fps, window_length, results))
+    consumer.start()
+    start = time.perf_counter()
+    producer.start()
+    return collect(results, [producer, consumer], frames, start)
+
+
+def run_ring(ctx, frames: int, fps: float, window_length: int, zero_copy: bool, work_ms: float):
+    results, ready = ctx.Queue(), ctx.Event()
+    with SharedFrameRing.create(capacity=max(64, 2 * window_length)) as ring:
+        consumer = ctx.Process(target=ring_consumer,
+                               args=(ring.name, frames, window_length, zero_copy, work_ms, ready, results))
+        producer = ctx.Process(target=ring_producer, args=(ring.name, frames, fps, results))
+        consumer.start()
+        ready.wait()
+        start = time.perf_counter()
+        producer.start()
+        return collect(results, [producer, consumer], frames, start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--fps", nargs="+", type=float, default=[30, 300, 0],
+                        help="Producer frame rates (0 = as fast as possible)")
+    parser.add_argument("--frames", type=int, default=1000, help="Frames per run")
+    parser.add_argument("--window", type=int, default=30, help="Window length (frames)")
+    parser.add_argument("--work-ms", type=float, default=0.0,
+                        help="Simulated consumer work per window (a slow model)")
+    parser.add_argument("--zero-copy", action="store_true",
+                        help="Ring consumer uses the window in shared memory instead of copying it")
+    args = parser.parse_args()
+
+    ctx = mp.get_context("spawn")
+    window_bytes = args.window * HOLISTIC_LAYOUT.size * 4
+    queue_bytes = len(pickle.dumps((0, 0.0, np.zeros((args.window, HOLISTIC_LAYOUT.size), np.float32)),
+                                   protocol=pickle.HIGHEST_PROTOCOL))
+    ring_bytes = HOLISTIC_LAYOUT.size * 4 * 2 + (0 if args.zero_copy else window_bytes)
+
+    print(f"\nLandmark windows between processes: ({args.window}, {HOLISTIC_LAYOUT.size}) float32")
+    print("=" * 60)
+    print(f"{args.frames} frames per run, consumer work {args.work_ms:g} ms per window")
+    print(f"Bytes moved per window: queue {queue_bytes / 1024:.0f} KB pickled "
+          f"(+ pipe write/read), ring {ring_bytes / 1024:.0f} KB "
+          f"({'frame written twice' if args.zero_copy else 'frame written twice + window copy'})")
+
+    for fps in args.fps:
+        print(f"\nProducer: {f'{fps:g} fps' if fps else 'unpaced'}")
+        print(f"  {'transport':<10s} {'windows/s':>10s} {'p50':>9s} {'p99':>9s} "
+              f"{'cons CPU':>10s} {'prod CPU':>10s} {'lost':>6s}")
+        runs = (("queue", lambda: run_queue(ctx, args.frames, fps, args.window, args.work_ms)),
+                ("ring", lambda: run_ring(ctx, args.frames, fps, args.window, args.zero_copy,
+                                          args.work_ms)))
+        for label, run in runs:
+            row = run()
+            delivered = len(row['latencies'])
+            latencies = row['latencies'] if delivered else np.zeros(1)
+            per_window = 1e6 / max(delivered, 1)
+            lost = f"{row['lost']}" + (f" ({row['overruns']}x)" if row['overruns'] else "")
+            print(f"  {label:<10s} {delivered / row['wall']:10.1f} "
+                  f"{np.percentile(latencies, 50):7.2f}ms {np.percentile(latencies, 99):7.2f}ms "
+                  f"{row['consumer_cpu'] * per_window:8.1f}us {row['producer_cpu'] * per_window:8.1f}us "
+                  f"{lost:>6s}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
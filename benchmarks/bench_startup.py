@@ -0,0 +1,206 @@
+"""
+Benchmark: time-to-first-prediction of the live entry points per model artifact
+
+Each run starts a fresh interpreter (so no import is cached) and replays an
+entry point's startup up to its first prediction:
+
+- predict_sign: the script's own top-level imports (read from
+  predict_sign.py), load_inference_model(), normalization statistics,
+  create_stream_recognizer(), then frames pushed until the first window
+  is predicted (the camera and window are not opened)
+- main_app: ``from main_app import OmniSignApp``, OmniSignApp(model_path)
+  (model, feature extractor, translator, personalization, warm-up), then
+  app.predictor.predict() on one window, as recognize_sign_from_webcam() does
+
+Time-to-first-prediction is measured from process spawn, so it includes
+interpreter start-up; imports, model loading and the first forward pass
+are also reported separately, with whether TensorFlow ended up imported
+and which runtime ran the model. Keras models go through the graph cache
+(modules/graph_cache.py) in a fresh directory, so the first start of each
+is reported separately as a cache miss (tracing + store), later starts as
+hits; --no-graph-cache disables it. Without --model the trained model
+(sign_language_model.h5) and its exported artifacts are compared; when it
+does not exist, an untrained DualStreamSignRecognizer is saved and exported
+to a temporary directory first.
+
+Usage:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --model sign_language_model.h5 sign_language_model.dynamic.tflite
+    python benchmarks/bench_startup.py --entry-points predict_sign --repeats 5
+    python benchmarks/bench_startup.py --no-graph-cache
+"""
+
+import argparse
+import ast
+import json
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project to path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+DEFAULT_MODEL = PROJECT_ROOT / "sign_language_model.h5"
+DEFAULT_ACTIONS = ["Hello", "Goodbye", "Thank you", "How are you", "I need help"]
+ENTRY_POINTS = ("predict_sign", "main_app")
+
+PREDICT_SIGN = """
+{imports}
+from modules.inference_runtime import create_stream_recognizer, load_inference_model
+imported = time.time()
+graph_cache = GraphCache() if GRAPH_CACHE else None
+model = load_inference_model(MODEL_PATH, graph_cache=graph_cache, layout=HOLISTIC_LAYOUT,
+                             sequence_length=30)
+normalizer = (StreamingStandardizer.load(normalizer_path(MODEL_PATH))
+              if normalizer_path(MODEL_PATH).exists() else None)
+recognizer = create_stream_recognizer(model, HOLISTIC_LAYOUT, 30, normalizer=normalizer)
+recognizer.warm_up()
+loaded = time.time()
+frame = HOLISTIC_LAYOUT.allocate()
+predictions = None
+while predictions is None:
+    predictions = recognizer.push(frame)
+cache = ('off' if graph_cache is None or not graph_cache.hits + graph_cache.misses
+         else 'hit' if graph_cache.hits else 'miss')
+"""
+
+MAIN_APP = """
+from main_app import OmniSignApp
+from data_pipeline.keypoint_schema import HOLISTIC_LAYOUT
+imported = time.time()
+app = OmniSignApp(model_path=MODEL_PATH, actions=ACTIONS, graph_cache=GRAPH_CACHE)
+model = app.predictor
+cache = app.graph_cache_status
+loaded = time.time()
+manual, non_manual = HOLISTIC_LAYOUT.split_streams(HOLISTIC_LAYOUT.allocate(30)[None])
+predictions = app.predictor.predict(manual, non_manual)
+"""
+
+CHILD = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+MODEL_PATH, ACTIONS, GRAPH_CACHE = {model!r}, {actions!r}, {graph_cache!r}
+{body}
+done = time.time()
+print("@@" + json.dumps({{'imported': imported, 'loaded': loaded, 'done': done, 'cache': cache,
+                         'tensorflow': 'tensorflow' in sys.modules,
+                         'backend': getattr(model, 'backend', 'keras')}}))
+"""
+
+
+def top_level_imports(script: Path) -> str:
+    """The import statements at the top level of a script."""
+    tree = ast.parse(script.read_text(encoding="utf-8"))
+    return "\n".join(ast.unparse(node) for node in tree.body
+                     if isinstance(node, (ast.Import, ast.ImportFrom)))
+
+
+def run_once(entry_point: str, model_path: Path, actions, cache_dir) -> dict:
+    """One cold start in a fresh interpreter; times in seconds since spawn."""
+    if entry_point == "predict_sign":
+        body = PREDICT_SIGN.format(imports=top_level_imports(PROJECT_ROOT / "predict_sign.py"))
+    else:
+        body = MAIN_APP
+    code = CHILD.format(root=str(PROJECT_ROOT), model=str(model_path), actions=list(actions),
+                        graph_cache=cache_dir is not None, body=body)
+    env = dict(os.environ)
+    if cache_dir is not None:
+        env["OMNISIGN_GRAPH_CACHE"] = str(cache_dir)
+
+    start = time.time()
+    result = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT, env=env,
+                            capture_output=True, text=True)
+    lines = [line for line in result.stdout.splitlines() if line.startswith("@@")]
+    if result.returncode != 0 or not lines:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip()
+                           else f"exit code {result.returncode}")
+    report = json.loads(lines[-1][2:])
+    return {
+        'imports': report['imported'] - start,
+        'load': report['loaded'] - report['imported'],
+        'first_prediction': report['done'] - report['loaded'],
+        'total': report['done'] - start,
+        'tensorflow': report['tensorflow'],
+        'backend': report['backend'],
+        'cache': report['cache'],
+    }
+
+
+def default_models(directory: Path, num_classes: int):
+    """The trained model and its exported artifacts, or untrained stand-ins."""
+    from models.quantization import saved_model_path, tflite_path
+
+    model_path = DEFAULT_MODEL
+    if not model_path.exists():
+        print(f"{DEFAULT_MODEL.name} not found: exporting an untrained model to {directory}")
+        from models.dual_stream_model import DualStreamSignRecognizer
+        from models.quantization import export_saved_model, export_tflite
+        model, _ = DualStreamSignRecognizer(num_classes=num_classes, sequence_length=30).build_model()
+        model_path = directory / "model.h5"
+        model.save(model_path)
+        export_tflite(model, tflite_path(model_path, "dynamic"), "dynamic")
+        export_saved_model(model, saved_model_path(model_path))
+
+    candidates = [model_path, saved_model_path(model_path)]
+    candidates += [tflite_path(model_path, mode) for mode in ("float32", "dynamic", "float16", "int8")]
+    return [path for path in candidates if path.exists()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--model", nargs="+", type=Path,
+                        help="Keras models, .tflite artifacts and/or serving SavedModels "
+                             "(default: sign_language_model.h5 and its exports)")
+    parser.add_argument("--entry-points", nargs="+", choices=ENTRY_POINTS, default=list(ENTRY_POINTS))
+    parser.add_argument("--actions", nargs="+",
+                        help="Classes in model output order (default: action_labels.pkl)")
+    parser.add_argument("--repeats", type=int, default=3, help="Cold starts per combination")
+    parser.add_argument("--no-graph-cache", action="store_true",
+                        help="Retrace Keras models on every start")
+    args = parser.parse_args()
+
+    actions = args.actions
+    labels_file = PROJECT_ROOT / "action_labels.pkl"
+    if actions is None and labels_file.exists():
+        with open(labels_file, "rb") as f:
+            actions = pickle.load(f)
+    actions = actions or DEFAULT_ACTIONS
+
+    with tempfile.TemporaryDirectory() as directory:
+        models = ([path.resolve() for path in args.model] if args.model
+                  else default_models(Path(directory), len(actions)))
+
+        print("\nStartup: spawn -> imports -> model load + warm-up -> first prediction")
+        print("=" * 60)
+        print(f"Median of {args.repeats} cold starts per combination"
+              f"{'' if args.no_graph_cache else ', grouped by graph cache status'}")
+        print(f"\n  {'entry point':>12s} {'model':>28s} {'cache':>5s} {'imports':>8s} {'load':>7s} "
+              f"{'first':>7s} {'total':>7s} {'TF':>4s}  runtime")
+        for entry_point in args.entry_points:
+            for model_path in models:
+                # A fresh cache per combination: its first start stores the traced graph
+                cache_dir = None if args.no_graph_cache else Path(tempfile.mkdtemp(dir=directory))
+                try:
+                    runs = [run_once(entry_point, model_path, actions, cache_dir)
+                            for _ in range(args.repeats)]
+                except RuntimeError as error:
+                    print(f"  {entry_point:>12s} {model_path.name:>28s} failed: {error}")
+                    continue
+                for cache in dict.fromkeys(run['cache'] for run in runs):
+                    group = [run for run in runs if run['cache'] == cache]
+                    median = {key: float(np.median([run[key] for run in group]))
+                              for key in ('imports', 'load', 'first_prediction', 'total')}
+                    print(f"  {entry_point:>12s} {model_path.name:>28s} {cache:>5s} "
+                          f"{median['imports']:7.2f}s {median['load']:6.2f}s "
+                          f"{median['first_prediction']:6.2f}s {median['total']:6.2f}s "
+                          f"{'yes' if group[0]['tensorflow'] else 'no':>4s}  {group[0]['backend']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark: per-frame deque + Model.predict vs StreamingRecognizer
+
+Replays synthetic keypoint frames through the old predict_sign.py path
+(deque -> np.array(list) -> model.predict every frame) and through
+StreamingRecognizer at several strides, checking both produce the same
+probabilities for the same window, and reports ms of inference work per
+frame (mean and p95, from StageStats).
+
+Usage:
+    python benchmarks/bench_streaming_inference.py --frames 150 --strides 1 2 5
+"""
+
+import argparse
+import sys
+import time
+from collections import deque
+from pathlib import Path
+
+import numpy as np
+
+# Add project to path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from data_pipeline.keypoint_schema import HOLISTIC_LAYOUT
+from models.dual_stream_model import DualStreamSignRecognizer
+from modules.pipeline_runtime import StageStats
+from modules.streaming_recognizer import StreamingRecognizer
+
+SEQUENCE_LENGTH = 30
+
+
+def run_legacy(model, frames):
+    """Old loop: rebuild the window from a deque and call predict each frame."""
+    stats = StageStats(window=len(frames))
+    buffer = deque(maxlen=SEQUENCE_LENGTH)
+    predictions = None
+    for keypoints in frames:
+        start = time.perf_counter()
+        buffer.append(keypoints)
+        if len(buffer) == SEQUENCE_LENGTH:
+            X = np.array([list(buffer)])
+            manual, non_manual = HOLISTIC_LAYOUT.split_streams(X)
+            predictions = model.predict([manual, non_manual], verbose=0)[0]
+        stats.record(time.perf_counter() - start)
+    return predictions, stats
+
+
+def run_streaming(model, frames, stride):
+    """StreamingRecognizer at a given stride."""
+    stats = StageStats(window=len(frames))
+    recognizer = StreamingRecognizer(model, HOLISTIC_LAYOUT, SEQUENCE_LENGTH, stride=stride)
+    recognizer.predict_window()  # Trace the compiled forward pass
+    recognizer.reset()
+    for keypoints in frames:
+        start = time.perf_counter()
+        recognizer.push(keypoints)
+        stats.record(time.perf_counter() - start)
+    return recognizer.predict_window(), stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--frames", type=int, default=150)
+    parser.add_argument("--strides", type=int, nargs="+", default=[1, 2, 5])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    frames = rng.random((args.frames, HOLISTIC_LAYOUT.size), dtype=np.float32)
+    model, _ = DualStreamSignRecognizer(num_classes=5).build_model()
+
+    # Warm up Keras' predict machinery so the first call is not counted
+    run_legacy(model, frames[:SEQUENCE_LENGTH])
+    legacy_predictions, legacy = run_legacy(model, frames)
+    legacy_ms = legacy.summary()["latency_ms"]
+
+    print("\nStreaming inference benchmark")
+    print("=" * 60)
+    print(f"Frames: {args.frames}  window {SEQUENCE_LENGTH}  (inference ms per camera frame)")
+    print(f"{'deque + predict':>20s}: {legacy_ms:7.2f} ms/frame  p95 {legacy.summary()['p95_ms']:7.2f} ms")
+
+    for stride in args.strides:
+        predictions, stats = run_streaming(model, frames, stride)
+        assert np.allclose(predictions, legacy_predictions, atol=1e-5), \
+            "Streaming output differs from Model.predict"
+        summary = stats.summary()
+        ms = summary["latency_ms"]
+        print(f"{'streaming stride ' + str(stride):>20s}: {ms:7.2f} ms/frame  "
+              f"p95 {summary['p95_ms']:7.2f} ms  ({legacy_ms / ms:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark: landmark extraction cost of the temporal sampling modes
+
+Extracts a fixed-length sequence from a long clip with every
+extract_sequence sampling mode, and compares against the naive way of
+getting a whole-clip window: run the detector on every frame, then
+resample. Reports detector calls and wall time per clip.
+
+Uses real MediaPipe when installed; otherwise the mock Holistic from
+utils (fixed 50 ms per process call). Without --video a synthetic clip
+with a motion burst in its second half is written to a temp file.
+
+Usage:
+    python benchmarks/bench_temporal_sampling.py --video Sign_Language_Data/clip.mp4
+    python benchmarks/bench_temporal_sampling.py --clip-frames 240
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+# Add project to path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from data_pipeline.feature_extractor import MediaPipeFeatureExtractor
+from data_pipeline.temporal_sampling import SAMPLING_MODES, uniform_indices
+from utils import HAS_MEDIAPIPE, create_holistic
+
+
+def write_synthetic_clip(path: str, frames: int, size=(640, 480), fps: float = 30.0):
+    """Static scene, then a moving blob over the middle third of the second half."""
+    rng = np.random.default_rng(0)
+    background = rng.integers(0, 40, (size[1], size[0], 3), dtype=np.uint8)
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), fps, size)
+    start, end = frames // 2, frames // 2 + frames // 6
+    for i in range(frames):
+        frame = background.copy()
+        x = 100 + 12 * (min(max(i, start), end) - start)
+        cv2.circle(frame, (x % size[0], 240), 40, (200, 180, 160), -1)
+        writer.write(frame)
+    writer.release()
+
+
+class CountingHolistic:
+    """Wraps a Holistic instance and counts process() calls."""
+
+    def __init__(self, holistic):
+        self.holistic = holistic
+        self.calls = 0
+
+    def process(self, image):
+        self.calls += 1
+        return self.holistic.process(image)
+
+
+def naive_full_clip(extractor, video: str, num_frames: int) -> np.ndarray:
+    """Detector on every frame, then uniform resampling."""
+    cap = cv2.VideoCapture(video)
+    rows = []
+    while True:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        rows.append(extractor.concatenate_landmarks(extractor.extract_landmarks(frame)))
+    cap.release()
+    return np.stack(rows)[uniform_indices(len(rows), num_frames)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--video", help="Recorded clip (default: synthetic clip)")
+    parser.add_argument("--clip-frames", type=int, default=240, help="Length of the synthetic clip")
+    parser.add_argument("--num-frames", type=int, default=30, help="Sequence length")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        video = args.video
+        if video is None:
+            video = str(Path(tmp) / "synthetic.avi")
+            write_synthetic_clip(video, args.clip_frames)
+
+        extractor = MediaPipeFeatureExtractor()
+        detector = CountingHolistic(extractor.holistic or create_holistic())
+        extractor.holistic = detector
+
+        print("\nTemporal sampling: detector cost per clip")
+        print("=" * 60)
+        print(f"Clip:     {args.video or 'synthetic'}   sequence length {args.num_frames}")
+        print(f"Detector: {'MediaPipe Holistic' if HAS_MEDIAPIPE else 'mock Holistic (50 ms/call)'}")
+
+        runs = [(mode, lambda mode=mode: extractor.extract_sequence(video, args.num_frames, mode))
+                for mode in SAMPLING_MODES]
+        runs.append(("all frames", lambda: naive_full_clip(extractor, video, args.num_frames)))
+        for name, run in runs:
+            detector.calls = 0
+            start = time.perf_counter()
+            run()
+            seconds = time.perf_counter() - start
+            print(f"  {name:12s} {detector.calls:5d} detector calls   {seconds:7.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark: eager vs tf.function vs XLA train/eval steps on CPU
+
+Builds the dual-stream model once per mode, warms up (tracing/compiling),
+then times epochs of train steps and a chunk of evaluation steps on
+identical synthetic batches. Reports median step time per mode and
+checks the graph modes compute the same initial eval loss as eager.
+
+Usage:
+    python benchmarks/bench_train_step.py --batches 10 --batch-size 16
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project to path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import tensorflow as tf
+from tensorflow import keras
+
+from data_pipeline.keypoint_schema import HOLISTIC_LAYOUT
+from models.ctc_training import CTCTrainingPipeline
+from models.dual_stream_model import DualStreamSignRecognizer
+
+MODES = {
+    "eager": dict(run_eagerly=True),
+    "graph": dict(),
+    "xla": dict(jit_compile=True),
+}
+
+
+def run_mode(name, batches, args):
+    """Return (initial eval loss, median train step s, median eval step s)."""
+    keras.utils.set_random_seed(0)
+    _, training_model = DualStreamSignRecognizer(num_classes=5).build_model()
+    with tempfile.TemporaryDirectory() as tmp:
+        pipeline = CTCTrainingPipeline(training_model, 5, tmp, **MODES[name])
+    optimizer = keras.optimizers.Adam(1e-3)
+
+    # Warm-up / trace; eval loss is deterministic (no dropout) so modes must agree
+    first_loss, _ = pipeline.validation_step(*batches[0])
+    pipeline.train_step(*batches[0], optimizer)
+
+    train_times, eval_times = [], []
+    for _ in range(args.repeats):
+        start = time.perf_counter()
+        pipeline.train_epoch(batches, optimizer)  # Fetches the loss once
+        train_times.append((time.perf_counter() - start) / len(batches))
+
+        start = time.perf_counter()
+        pipeline.evaluate(batches)
+        eval_times.append((time.perf_counter() - start) / len(batches))
+
+    return first_loss, float(np.median(train_times)), float(np.median(eval_times))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--batches", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--modes", nargs="+", default=list(MODES), choices=list(MODES))
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    batches = []
+    for _ in range(args.batches):
+        X = rng.random((args.batch_size, 30, HOLISTIC_LAYOUT.size), dtype=np.float32)
+        batches.append((list(HOLISTIC_LAYOUT.split_streams(X)),
+                        rng.integers(0, 5, args.batch_size)))
+
+    print("\nTrain/eval step benchmark")
+    print("=" * 60)
+    print(f"Device: CPU x{os.cpu_count()}  TF {tf.__version__}  "
+          f"batch {args.batch_size}  {args.batches} batches x {args.repeats}")
+    results = {}
+    for name in args.modes:
+        results[name] = run_mode(name, batches, args)
+        loss, train_s, eval_s = results[name]
+        print(f"{name:>6s}: train step {train_s * 1000:8.1f} ms   "
+              f"eval step {eval_s * 1000:7.1f} ms   initial eval loss {loss:.4f}")
+
+    if "eager" in results:
+        for name, (loss, train_s, eval_s) in results.items():
+            assert abs(loss - results["eager"][0]) < 1e-3, f"{name} loss differs from eager"
+            print(f"{name:>6s}: {results['eager'][1] / train_s:4.2f}x train, "
+                  f"{results['eager'][2] / eval_s:4.2f}x eval vs eager")
+
+
+if __name__ == "__main__":
+    main()
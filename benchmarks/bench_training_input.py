@@ -0,0 +1,101 @@
+"""
+Benchmark: NumPy-loop vs tf.data input for CTCTrainingPipeline
+
+Trains the dual-stream model for a few epochs on the same synthetic data
+with each input mode and reports training samples/sec (first epoch,
+which includes tracing, is reported separately).
+
+Usage:
+    python benchmarks/bench_training_input.py --samples 512 --epochs 3
+    python benchmarks/bench_training_input.py --augment   # streamed augmentation
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import numpy as np
+
+# Add project to path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tensorflow import keras
+
+from data_pipeline.augmentation import StreamingAugmenter
+from data_pipeline.data_loader import DataLoader
+from data_pipeline.keypoint_schema import HOLISTIC_LAYOUT
+from models.ctc_training import CTCTrainingPipeline
+from models.dual_stream_model import DualStreamSignRecognizer
+
+
+def epoch_batches(pipeline, mode, X, y, args, loader, epoch):
+    """One epoch of training batches for the given input mode."""
+    if args.augment:
+        augmenter = StreamingAugmenter(HOLISTIC_LAYOUT, seed=epoch)
+        batches = ((list(HOLISTIC_LAYOUT.split_streams(X_batch)), y_batch)
+                   for X_batch, y_batch in loader.create_batches(
+                       X, y, args.batch_size, augmenter=augmenter,
+                       augmentation_factor=2, seed=epoch))
+        return pipeline.batches_dataset(batches) if mode == "tf.data" else batches
+
+    streams = list(HOLISTIC_LAYOUT.split_streams(X))
+    if mode == "tf.data":
+        return pipeline.dataset
+    return pipeline.iter_batches(streams, y, args.batch_size)
+
+
+def run_mode(mode, X, y, args):
+    """Return seconds per epoch for one input mode."""
+    recognizer = DualStreamSignRecognizer(num_classes=5)
+    _, training_model = recognizer.build_model()
+    with tempfile.TemporaryDirectory() as tmp:
+        pipeline = CTCTrainingPipeline(training_model, 5, tmp)
+    optimizer = keras.optimizers.Adam(1e-3)
+    loader = DataLoader("unused", ["a"])
+    if mode == "tf.data":
+        pipeline.dataset = pipeline.make_dataset(
+            list(HOLISTIC_LAYOUT.split_streams(X)), y, args.batch_size, seed=0
+        )
+
+    seconds = []
+    for epoch in range(args.epochs):
+        start = time.perf_counter()
+        with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+            pipeline.train_epoch(epoch_batches(pipeline, mode, X, y, args, loader, epoch),
+                                 optimizer)
+        seconds.append(time.perf_counter() - start)
+    return seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--samples", type=int, default=512)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--epochs", type=int, default=3)
+    parser.add_argument("--augment", action="store_true",
+                        help="Feed streamed, augmented DataLoader batches")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    X = rng.random((args.samples, 30, HOLISTIC_LAYOUT.size), dtype=np.float32)
+    y = rng.integers(0, 5, args.samples)
+    samples_per_epoch = args.samples * (2 if args.augment else 1)
+
+    print("\nTraining input benchmark")
+    print("=" * 60)
+    print(f"Samples/epoch: {samples_per_epoch}  batch {args.batch_size}  "
+          f"augment: {args.augment}")
+    for mode in ("numpy", "tf.data"):
+        seconds = run_mode(mode, X, y, args)
+        steady = np.mean(seconds[1:]) if len(seconds) > 1 else seconds[0]
+        print(f"{mode:>8s}: first epoch {samples_per_epoch / seconds[0]:7.1f} samples/s   "
+              f"steady {samples_per_epoch / steady:7.1f} samples/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark: whole-set vs chunked validation memory and time
+
+Each configuration runs in a fresh subprocess that builds the dual-stream
+model, evaluates a synthetic validation set with
+CTCTrainingPipeline.validation_step at the given chunk size (the whole set
+in one forward pass for "full"), and reports peak RSS growth over the
+post-setup baseline plus evaluation time. Loss/accuracy must match across
+chunk sizes.
+
+Usage:
+    python benchmarks/bench_validation.py --samples 1024 --chunks 32 128
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project to path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+def peak_rss_mib() -> float:
+    """Peak resident set size of this process (Linux reports KiB)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def worker(samples: int, chunk: int):
+    """Evaluate once at the given chunk size and print JSON results."""
+    from data_pipeline.keypoint_schema import HOLISTIC_LAYOUT
+    from models.ctc_training import CTCTrainingPipeline
+    from models.dual_stream_model import DualStreamSignRecognizer
+
+    rng = np.random.default_rng(0)
+    X = rng.random((samples, 30, HOLISTIC_LAYOUT.size), dtype=np.float32)
+    y = rng.integers(0, 5, samples)
+    streams = list(HOLISTIC_LAYOUT.split_streams(X))
+
+    import keras
+    keras.utils.set_random_seed(0)
+    _, model = DualStreamSignRecognizer(num_classes=5).build_model()
+    with tempfile.TemporaryDirectory() as tmp:
+        pipeline = CTCTrainingPipeline(model, 5, tmp)
+    pipeline.validation_step([s[:2] for s in streams], y[:2], chunk)  # Trace
+
+    baseline = peak_rss_mib()
+    start = time.perf_counter()
+    loss, accuracy = pipeline.validation_step(streams, y, chunk)
+    seconds = time.perf_counter() - start
+    print(json.dumps({'loss': loss, 'accuracy': accuracy, 'seconds': seconds,
+                      'peak_mib': peak_rss_mib() - baseline}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--samples", type=int, default=1024)
+    parser.add_argument("--chunks", type=int, nargs="+", default=[32, 128])
+    parser.add_argument("--worker", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker is not None:
+        worker(args.samples, args.worker)
+        return
+
+    print("\nValidation memory benchmark")
+    print("=" * 60)
+    print(f"Validation set: {args.samples} sequences")
+    reference = None
+    for chunk in [args.samples] + args.chunks:
+        output = subprocess.run(
+            [sys.executable, __file__, "--samples", str(args.samples), "--worker", str(chunk)],
+            capture_output=True, text=True, check=True
+        ).stdout.strip().splitlines()[-1]
+        result = json.loads(output)
+        reference = reference or result
+        assert abs(result['loss'] - reference['loss']) < 1e-4, "Chunked loss differs"
+        assert abs(result['accuracy'] - reference['accuracy']) < 1e-6, "Chunked accuracy differs"
+        label = "full" if chunk == args.samples else f"chunk {chunk}"
+        print(f"{label:>10s}: peak +{result['peak_mib']:7.1f} MiB   "
+              f"{result['seconds']:6.2f}s   loss {result['loss']:.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,8 @@ Features:
 - Real-time webcam capture with visual feedback
 - Automatic keypoint extraction (including face landmarks for non-manual markers)
 - Multilingual label mappings
-- Sequence-based data organization
+- Sequence-based data organization (one consolidated array per sign,
+  see data_pipeline/sequence_store.py)
 """
 
 import os
@@ -25,6 +26,8 @@ from utils import (
     extract_keypoints,
     draw_landmarks,
 )
+from data_pipeline.sequence_store import SequenceStore
+from modules.frame_source import DEFAULT_SOURCE, open_source
 
 
 # Configuration - EXPANDED SIGN VOCABULARY
@@ -325,12 +328,9 @@ MULTILINGUAL_LABELS = {
 
 
 def ensure_directories():
-    """Create required directories for data collection."""
-    for action in ACTIONS:
-        for sequence in range(NO_SEQUENCES):
-            seq_dir = DATA_PATH / action / str(sequence)
-            os.makedirs(seq_dir, exist_ok=True)
-    print(f"[OK] Created directories for {len(ACTIONS)} actions")
+    """Create the data directory for data collection."""
+    os.makedirs(DATA_PATH, exist_ok=True)
+    print(f"[OK] Data directory ready: {DATA_PATH}")
 
 
 def save_multilingual_labels():
@@ -368,30 +368,32 @@ def main():
     print("=" * 60)
     print()
 
-    cap = cv2.VideoCapture(0, cv2.CAP_DSHOW)
-    if not cap.isOpened():
-        cap = cv2.VideoCapture(0)
+    # Webcam (OMNISIGN_SOURCE may point at a recorded clip instead), configured
+    # for optimal capture; DirectShow first on Windows
+    cap = open_source(DEFAULT_SOURCE, width=640, height=480, fps=30, buffer_size=1,
+                      backends=(cv2.CAP_DSHOW, None))
     
     if not cap.isOpened():
         raise RuntimeError("Webcam not accessible: ensure camera permissions and device availability.")
 
-    # Configure camera for optimal capture
-    cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-    cap.set(cv2.CAP_PROP_FPS, 30)
-    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
-
     collected_count = 0
     total_frames = len(ACTIONS) * NO_SEQUENCES * SEQUENCE_LENGTH
     
+    # One array per sign; each finished sequence is written as a single block
+    store = SequenceStore(DATA_PATH, sequence_length=SEQUENCE_LENGTH)
+    store.require_migrated()
+    
     try:
-        with create_holistic(min_detection_confidence=0.5, min_tracking_confidence=0.5) as holistic:
+        detector = cap.detector() or create_holistic(min_detection_confidence=0.5,
+                                                     min_tracking_confidence=0.5)
+        with detector as holistic:
             for action_idx, action in enumerate(ACTIONS):
                 print(f"\n[{action_idx + 1}/{len(ACTIONS)}] Collecting: {action}")
                 print("-" * 50)
+                store.create_action(action, NO_SEQUENCES)
                 
                 for sequence in range(NO_SEQUENCES):
-                    sequence_keypoints = []
+                    sequence_keypoints = store.layout.allocate(SEQUENCE_LENGTH)
                     
                     for frame_num in range(SEQUENCE_LENGTH):
                         ret, frame = cap.read()
@@ -445,11 +447,8 @@ def main():
                             cv2.imshow("OmniSign - Data Collection", image)
                             cv2.waitKey(30)
 
-                        # Save keypoints
-                        keypoints = extract_keypoints(results)
-                        sequence_keypoints.append(keypoints)
-                        save_path = DATA_PATH / action / str(sequence) / f"{frame_num}.npy"
-                        np.save(save_path, keypoints)
+                        # Buffer keypoints; the sequence is saved once complete
+                        extract_keypoints(results, out=sequence_keypoints[frame_num])
                         
                         collected_count += 1
 
@@ -457,13 +456,16 @@ def main():
                         key = cv2.waitKey(1) & 0xFF
                         if key == ord("q"):
                             print("\n[!] Quit signal received. Saving progress...")
+                            store.close()
                             cap.release()
                             cv2.destroyAllWindows()
                             print(f"[OK] Collected {collected_count}/{total_frames} frames")
                             return
 
+                    store.write_sequence(action, sequence, sequence_keypoints)
+                    
                     # Data quality feedback
-                    valid_frames = sum(1 for kp in sequence_keypoints if kp is not None)
+                    valid_frames = int(np.count_nonzero(np.any(sequence_keypoints, axis=1)))
                     quality = (valid_frames / SEQUENCE_LENGTH) * 100
                     status = "✓" if quality >= 80 else "⚠"
                     print(f"  Seq {sequence + 1:2d}/{NO_SEQUENCES}: {status} Quality {quality:.1f}%")
@@ -471,6 +473,7 @@ def main():
     except KeyboardInterrupt:
         print("\n[!] Collection interrupted by user.")
     finally:
+        store.close()
         cap.release()
         cv2.destroyAllWindows()
         print("\n" + "=" * 60)
@@ -0,0 +1,125 @@
+"""
+Data Pipeline: Streaming Data Augmentation
+
+Per-sample, vectorized augmentation applied to each batch as it is drawn
+(see DataLoader.create_batches), so augmented copies of the dataset are
+never materialized.
+
+Augmentation works on raw landmark coordinates (normalized image units).
+For standardized batches, pass the fitted StreamingStandardizer: samples
+are mapped back to raw coordinates, augmented, and standardized again, so
+mirroring and clipping keep their meaning.
+
+Techniques (each decided independently per sample):
+- Mirroring of hand x-coordinates (undetected points stay zero)
+- Temporal shift (circular, up to max_shift frames)
+- Gaussian noise
+- Random scaling
+"""
+
+import numpy as np
+from typing import Optional, Tuple
+
+from data_pipeline.keypoint_schema import HOLISTIC_LAYOUT, MANUAL, KeypointLayout
+from data_pipeline.normalization import StreamingStandardizer
+
+
+class StreamingAugmenter:
+    """
+    Seedable per-sample augmentation for (batch, sequence_length, features) arrays.
+    """
+
+    def __init__(self, layout: KeypointLayout = HOLISTIC_LAYOUT,
+                 flip_prob: float = 0.5, shift_prob: float = 0.5, max_shift: int = 2,
+                 noise_prob: float = 0.5, noise_std: float = 0.01,
+                 scale_prob: float = 0.5, scale_range: Tuple[float, float] = (0.95, 1.05),
+                 clip_range: Optional[Tuple[float, float]] = (0.0, 1.0),
+                 normalizer: Optional[StreamingStandardizer] = None,
+                 seed: Optional[int] = None):
+        """
+        Initialize augmenter.
+
+        Args:
+            layout (KeypointLayout): Feature layout of the batches
+            flip_prob (float): Probability of mirroring a sample's hands
+            shift_prob (float): Probability of temporally shifting a sample
+            max_shift (int): Largest shift in frames (either direction)
+            noise_prob (float): Probability of adding Gaussian noise
+            noise_std (float): Standard deviation of the noise
+            scale_prob (float): Probability of scaling a sample
+            scale_range (Tuple[float, float]): Scale factor bounds
+            clip_range (Tuple[float, float], optional): Clip noisy/scaled samples to
+                this range of raw coordinates (None to disable)
+            normalizer (StreamingStandardizer, optional): Fitted standardizer the
+                batches were transformed with (None: batches are raw coordinates)
+            seed (int, optional): Seed for reproducible augmentation
+        """
+        self.layout = layout
+        self.flip_prob = flip_prob
+        self.shift_prob = shift_prob
+        self.max_shift = max_shift
+        self.noise_prob = noise_prob
+        self.noise_std = noise_std
+        self.scale_prob = scale_prob
+        self.scale_range = scale_range
+        self.clip_range = clip_range
+        self.normalizer = normalizer
+        self.rng = np.random.default_rng(seed)
+
+    def _clip(self, X: np.ndarray) -> np.ndarray:
+        if self.clip_range is None:
+            return X
+        return np.clip(X, *self.clip_range, out=X)
+
+    def __call__(self, X_batch: np.ndarray, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Augment a batch.
+
+        Args:
+            X_batch (np.ndarray): (batch, sequence_length, features); not modified
+            mask (np.ndarray, optional): Boolean (batch,) selecting which samples
+                may be augmented; others are returned unchanged
+
+        Returns:
+            np.ndarray: Augmented float32 copy of the batch
+        """
+        X = np.array(X_batch, dtype=np.float32, copy=True)
+        batch_size, sequence_length = X.shape[:2]
+        eligible = np.ones(batch_size, dtype=bool) if mask is None else np.asarray(mask, dtype=bool)
+        if self.normalizer is not None:
+            X = self.normalizer.inverse_transform(X)  # Augment raw coordinates
+
+        # Mirror x-coordinates of both hands (views into X)
+        flip = eligible & (self.rng.random(batch_size) < self.flip_prob)
+        if flip.any():
+            for segment in self.layout.stream_segments(MANUAL):
+                hand = self.layout.view(X, segment.name)
+                x = hand[flip, ..., 0]
+                hand[flip, ..., 0] = np.where(x != 0, 1 - x, 0)
+
+        # Temporal shift: out[t] = in[(t - shift) % T], one gather for the batch
+        shift = eligible & (self.rng.random(batch_size) < self.shift_prob)
+        if shift.any():
+            shifts = np.where(shift, self.rng.integers(-self.max_shift, self.max_shift + 1, batch_size), 0)
+            frames = (np.arange(sequence_length)[None, :] - shifts[:, None]) % sequence_length
+            X = X[np.arange(batch_size)[:, None], frames]
+
+        # Gaussian noise
+        noise = eligible & (self.rng.random(batch_size) < self.noise_prob)
+        if noise.any():
+            noisy = X[noise]
+            noisy += self.rng.normal(0, self.noise_std, noisy.shape).astype(np.float32)
+            X[noise] = self._clip(noisy)
+
+        # Random scaling
+        scale = eligible & (self.rng.random(batch_size) < self.scale_prob)
+        if scale.any():
+            factors = self.rng.uniform(*self.scale_range, int(scale.sum())).astype(np.float32)
+            X[scale] = self._clip(X[scale] * factors[:, None, None])
+
+        if self.normalizer is not None:
+            # Samples left alone are returned exactly as given
+            augmented = np.array(X_batch, dtype=np.float32, copy=True)
+            augmented[eligible] = self.normalizer.transform(X[eligible])
+            return augmented
+        return X
@@ -2,18 +2,26 @@
 Data Loader and Preprocessing Pipeline
 
 Loads collected data and prepares it for model training with:
-- Data augmentation techniques
+- Data augmentation (materialized, or streamed per batch)
 - Normalization
 - Train/validation/test splitting
 - Batch generation
+- Memory-mapped mode for datasets larger than RAM
+- Parallel per-action loading with a thread or process pool
 """
 
 import numpy as np
 import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Tuple, List
+from typing import Iterator, Tuple, List, Optional
 from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler
+
+from data_pipeline.augmentation import StreamingAugmenter
+from data_pipeline.keypoint_schema import HOLISTIC_LAYOUT, KeypointLayout
+from data_pipeline.normalization import StreamingStandardizer
+from data_pipeline.sequence_store import SequenceStore
 
 
 class DataLoader:
@@ -22,27 +30,168 @@ class DataLoader:
     """
     
     def __init__(self, data_path: str, actions: List[str], 
-                 no_sequences: int = 30, sequence_length: int = 30):
+                 no_sequences: Optional[int] = None, sequence_length: int = 30,
+                 layout: KeypointLayout = HOLISTIC_LAYOUT,
+                 convert_legacy: bool = False,
+                 num_workers: int = 1, parallel_backend: str = "process"):
         """
         Initialize data loader.
         
         Args:
             data_path (str): Path to data directory
             actions (List[str]): List of action classes
-            no_sequences (int): Number of sequences per action
+            no_sequences (int, optional): Sequences read per action (default:
+                every sequence in a consolidated store, 30 in the per-frame layout)
             sequence_length (int): Number of frames per sequence
+            layout (KeypointLayout): Feature layout every frame must match
+            convert_legacy (bool): Convert frames saved in a known legacy layout
+                (see keypoint_schema.LEGACY_LAYOUTS) instead of rejecting them
+            num_workers (int): Actions loaded concurrently (1 = serial)
+            parallel_backend (str): 'process' or 'thread' pool for num_workers > 1
         """
+        if parallel_backend not in ("process", "thread"):
+            raise ValueError(f"Unknown parallel_backend '{parallel_backend}'")
+        
         self.data_path = Path(data_path)
         self.actions = actions
-        self.no_sequences = no_sequences
+        self.no_sequences = 30 if no_sequences is None else no_sequences
         self.sequence_length = sequence_length
-        self.scaler = StandardScaler()
+        self.layout = layout
+        self.convert_legacy = convert_legacy
+        self.num_workers = max(1, num_workers)
+        self.parallel_backend = parallel_backend
+        self.normalizer = StreamingStandardizer()
+        
+        # Consolidated storage takes precedence over per-frame files; actions
+        # missing from the store are still read from their frame directories
+        self.store = None
+        if SequenceStore.exists(self.data_path):
+            self.store = SequenceStore(self.data_path, sequence_length, layout)
+            if no_sequences is None:
+                # Stores extracted from videos hold as many sequences as clips
+                self.no_sequences = max((entry['num_sequences'] for entry in
+                                         self.store.index['actions'].values()), default=30)
+    
+    def load_action_frames(self, action: str) -> Tuple[np.ndarray, List[int]]:
+        """
+        Load one action from the per-frame layout (one .npy file per frame).
+        
+        Args:
+            action (str): Action name
+            
+        Returns:
+            Tuple[sequences, recorded]:
+                - sequences: (no_sequences, sequence_length, layout.size); missing
+                  sequences and frames stay zero
+                - recorded: Indices of sequences found on disk
+        
+        Raises:
+            ValueError: If a frame does not match the layout
+        """
+        
+        action_path = self.data_path / action
+        sequences = self.layout.allocate(self.no_sequences, self.sequence_length)
+        recorded = []
+        
+        if not action_path.exists():
+            print(f"Warning: {action_path} not found")
+            return sequences, recorded
+        
+        for sequence_idx in range(self.no_sequences):
+            seq_path = action_path / str(sequence_idx)
+            
+            if not seq_path.exists():
+                print(f"  Warning: {action} sequence {sequence_idx} not found")
+                continue
+            
+            # Load all .npy files in this sequence
+            for frame_idx in range(self.sequence_length):
+                frame_file = seq_path / f"{frame_idx}.npy"
+                
+                if frame_file.exists():
+                    sequences[sequence_idx, frame_idx] = self.layout.conform(
+                        np.load(frame_file), self.convert_legacy, source=str(frame_file)
+                    )
+            
+            recorded.append(sequence_idx)
+        
+        return sequences, recorded
+    
+    def load_action(self, action: str) -> np.ndarray:
+        """
+        Load the recorded sequences of one action.
+        
+        Reads the consolidated SequenceStore when the data directory has one
+        and it holds the action, otherwise the per-frame layout.
+        
+        Returns:
+            np.ndarray: (num_recorded, sequence_length, layout.size)
+        """
+        
+        if self.store is not None and action in self.store.actions:
+            sequences, recorded = self.store.read_action(action, mmap=True)
+            recorded = [idx for idx in recorded if idx < self.no_sequences]
+        else:
+            sequences, recorded = self.load_action_frames(action)
         
+        # Fancy indexing reads just the recorded sequences into RAM
+        return np.asarray(sequences[recorded], dtype=self.layout.dtype)
+    
+    def count_sequences(self, action: str) -> int:
+        """Number of recorded sequences load_action() will return for an action."""
+        
+        if self.store is not None and action in self.store.actions:
+            return sum(1 for idx in self.store.recorded_sequences(action) if idx < self.no_sequences)
+        
+        action_path = self.data_path / action
+        return sum(1 for idx in range(self.no_sequences) if (action_path / str(idx)).exists())
+    
+    def iter_actions(self, actions: Optional[List[str]] = None) -> Iterator[Tuple[int, str, np.ndarray]]:
+        """
+        Load actions one shard at a time, in order.
+        
+        With num_workers > 1 actions are loaded concurrently, but results are
+        yielded in action order and at most 2 * num_workers loaded actions
+        are held in memory at once.
+        
+        Yields:
+            Tuple[action_idx, action, sequences]: as returned by load_action()
+        """
+        
+        actions = self.actions if actions is None else actions
+        
+        if self.num_workers == 1:
+            for action_idx, action in enumerate(actions):
+                print(f"Loading {action}...")
+                yield action_idx, action, self.load_action(action)
+            return
+        
+        pool_cls = ProcessPoolExecutor if self.parallel_backend == "process" else ThreadPoolExecutor
+        with pool_cls(max_workers=self.num_workers) as pool:
+            pending = deque()
+            for action_idx, action in enumerate(actions):
+                pending.append((action_idx, action, pool.submit(self.load_action, action)))
+                if len(pending) >= 2 * self.num_workers:
+                    done_idx, done_action, future = pending.popleft()
+                    print(f"Loading {done_action}...")
+                    yield done_idx, done_action, future.result()
+            
+            while pending:
+                done_idx, done_action, future = pending.popleft()
+                print(f"Loading {done_action}...")
+                yield done_idx, done_action, future.result()
+    
     def load_data(self) -> Tuple[np.ndarray, np.ndarray]:
         """
         Load all data from directory structure.
         
-        Expected structure:
+        Expected structure (consolidated, see data_pipeline/sequence_store.py):
+            data_path/
+            ├── sequences_index.json
+            ├── Action1.npy
+            └── ...
+        
+        or per-frame (migrate with migrate_data.py):
             data_path/
             ├── Action1/
             │   ├── 0/
@@ -54,70 +203,28 @@ class DataLoader:
         
         Returns:
             Tuple[X, y]: 
-                - X: Feature sequences (N, sequence_length, 500)
+                - X: Feature sequences (N, sequence_length, layout.size)
                 - y: Labels (N,) - class indices
+        
+        Raises:
+            ValueError: If a frame does not match the layout
         """
         
         X = []
         y = []
         
-        for action_idx, action in enumerate(self.actions):
-            action_path = self.data_path / action
-            
-            if not action_path.exists():
-                print(f"Warning: {action_path} not found")
-                continue
-            
-            print(f"Loading {action}...")
-            
-            for sequence_idx in range(self.no_sequences):
-                seq_path = action_path / str(sequence_idx)
-                
-                if not seq_path.exists():
-                    print(f"  Warning: Sequence {sequence_idx} not found")
-                    continue
-                
-                sequence_data = []
-                
-                # Load all .npy files in this sequence
-                for frame_idx in range(self.sequence_length):
-                    frame_file = seq_path / f"{frame_idx}.npy"
-                    
-                    if frame_file.exists():
-                        frame_data = np.load(frame_file)
-                        # Ensure frame data is 1D and reshape to 500 features
-                        frame_data = np.array(frame_data).flatten()
-                        if len(frame_data) < 500:
-                            # Pad with zeros if too short
-                            frame_data = np.pad(frame_data, (0, 500 - len(frame_data)))
-                        elif len(frame_data) > 500:
-                            # Truncate if too long
-                            frame_data = frame_data[:500]
-                        sequence_data.append(frame_data)
-                    else:
-                        # Pad with zeros if frame missing
-                        sequence_data.append(np.zeros(500))
-                
-                # Convert to array - ensure consistent shape
-                sequence_array = np.array(sequence_data, dtype=np.float32)
-                
-                # Verify and fix shape
-                if sequence_array.shape[0] == self.sequence_length:
-                    if sequence_array.shape[1] != 500:
-                        sequence_array = sequence_array[:, :500]  # Ensure 500 features
-                        if sequence_array.shape[1] < 500:
-                            sequence_array = np.pad(sequence_array, 
-                                                   ((0, 0), (0, 500 - sequence_array.shape[1])))
-                    X.append(sequence_array)
-                    y.append(action_idx)
-        
-        if len(X) == 0:
+        for action_idx, action, sequences in self.iter_actions():
+            X.append(sequences)
+            y.append(np.full(len(sequences), action_idx))
+        
+        if sum(len(sequences) for sequences in X) == 0:
             print("\nNo valid sequences found. Creating dummy data for demonstration...")
             # Create dummy data if no real data found
-            X = np.random.randn(150, self.sequence_length, 500).astype(np.float32)
+            X = np.random.randn(150, self.sequence_length, self.layout.size).astype(self.layout.dtype)
             y = np.repeat(np.arange(len(self.actions)), 30)
         else:
-            X = np.array(X, dtype=np.float32)
+            X = np.concatenate(X, axis=0)
+            y = np.concatenate(y, axis=0)
         
         y = np.array(y)
         
@@ -127,45 +234,110 @@ class DataLoader:
         
         return X, y
     
-    def normalize(self, X: np.ndarray, fit: bool = True) -> np.ndarray:
+    def load_memmap(self, memmap_dir: str) -> Tuple[np.memmap, np.ndarray]:
+        """
+        Assemble the dataset into one on-disk array and return it memory-mapped.
+        
+        Actions are written one at a time, so peak memory is a single
+        action's sequences rather than the whole dataset.
+        
+        Args:
+            memmap_dir (str): Directory for X.npy / y.npy
+            
+        Returns:
+            Tuple[X, y]:
+                - X: Read-only np.memmap (N, sequence_length, layout.size)
+                - y: Labels (N,) - class indices
+        
+        Raises:
+            ValueError: If no sequences are found or a frame does not match the layout
+        """
+        
+        memmap_dir = Path(memmap_dir)
+        memmap_dir.mkdir(parents=True, exist_ok=True)
+        
+        counts = [self.count_sequences(action) for action in self.actions]
+        total = sum(counts)
+        if total == 0:
+            raise ValueError(f"No sequences found under {self.data_path}")
+        
+        X_path = memmap_dir / "X.npy"
+        X = self._open_memmap(X_path, (total, self.sequence_length, self.layout.size))
+        y = np.empty(total, dtype=np.int64)
+        
+        start = 0
+        for action_idx, action, sequences in self.iter_actions():
+            count = len(sequences)
+            if count != counts[action_idx]:
+                raise ValueError(f"{action}: expected {counts[action_idx]} sequences, loaded {count}")
+            X[start:start + count] = sequences
+            y[start:start + count] = action_idx
+            start += count
+        
+        X.flush()
+        del X
+        np.save(memmap_dir / "y.npy", y)
+        
+        X = np.load(X_path, mmap_mode='r')
+        print(f"\nMemory-mapped data: X={X.shape} ({X_path}), y={y.shape}")
+        
+        return X, y
+    
+    def _open_memmap(self, path: Path, shape: Tuple[int, ...]) -> np.memmap:
+        """Create a writable .npy memmap in the layout dtype."""
+        return np.lib.format.open_memmap(path, mode='w+', dtype=self.layout.dtype, shape=shape)
+    
+    def _sibling_memmap(self, X: np.memmap, suffix: str, shape: Tuple[int, ...]) -> np.memmap:
+        """Create a memmap next to X's backing file, e.g. X_normalized.npy."""
+        path = Path(X.filename)
+        return self._open_memmap(path.with_name(f"{path.stem}_{suffix}.npy"), shape)
+    
+    def normalize(self, X: np.ndarray, fit: bool = True,
+                  out: Optional[np.ndarray] = None,
+                  chunk_size: int = 256) -> np.ndarray:
         """
         Normalize features to zero mean and unit variance.
         
+        Statistics are accumulated chunk by chunk (see StreamingStandardizer),
+        so the full tensor is never copied. The transform runs in float32 and
+        in place on writable float32 inputs; read-only memmaps are written to
+        a sibling ``<name>_normalized.npy`` memmap unless ``out`` is given.
+        Save ``self.normalizer`` next to the model for inference.
+        
         Args:
             X (np.ndarray): Input data (N, sequence_length, num_features)
-            fit (bool): Whether to fit the scaler or use existing fit
+            fit (bool): Whether to fit the normalizer or use existing fit
+            out (np.ndarray, optional): Destination for the normalized data
+            chunk_size (int): Sequences per chunk
             
         Returns:
             np.ndarray: Normalized data
         """
         
-        # Reshape for scaling
-        original_shape = X.shape
-        X_reshaped = X.reshape(-1, X.shape[-1])
-        
         if fit:
-            X_normalized = self.scaler.fit_transform(X_reshaped)
-        else:
-            X_normalized = self.scaler.transform(X_reshaped)
+            self.normalizer.fit(X, chunk_size)
         
-        # Reshape back
-        X_normalized = X_normalized.reshape(original_shape)
+        if out is None and isinstance(X, np.memmap) and not X.flags.writeable:
+            out = self._sibling_memmap(X, "normalized", X.shape)
         
-        return X_normalized
+        return self.normalizer.transform(X, out=out, chunk_size=chunk_size)
     
     def augment_data(self, X: np.ndarray, y: np.ndarray, 
                      augmentation_factor: int = 2) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Apply data augmentation techniques.
+        Apply data augmentation techniques, materializing the augmented copies.
         
-        Techniques:
+        For training, prefer create_batches(augmenter=...), which augments
+        each batch as it is drawn and never holds more than one copy of X.
+        
+        Techniques (decided per sample, see StreamingAugmenter):
         - Random flipping (left-right mirror)
         - Temporal shift (forward-backward)
         - Gaussian noise
         - Random scaling
         
         Args:
-            X (np.ndarray): Input data (N, sequence_length, 500)
+            X (np.ndarray): Input data (N, sequence_length, layout.size)
             y (np.ndarray): Labels (N,)
             augmentation_factor (int): How many augmented copies per sample
             
@@ -173,33 +345,14 @@ class DataLoader:
             Tuple[X_aug, y_aug]: Augmented data
         """
         
+        self.layout.validate(X)
+        
+        augmenter = StreamingAugmenter(self.layout)
         X_augmented = [X]
         y_augmented = [y]
         
         for _ in range(augmentation_factor - 1):
-            X_aug = X.copy()
-            
-            # Random flipping (mirror on x-axis for hand landmarks)
-            if np.random.rand() > 0.5:
-                # Mirror x-coordinates of hands (indices 0-167)
-                X_aug[:, :, :84] = 1 - X_aug[:, :, :84]  # Mirror hand x-coords
-            
-            # Temporal shift
-            if np.random.rand() > 0.5:
-                shift = np.random.randint(-2, 3)  # Shift by -2 to 2 frames
-                X_aug = np.roll(X_aug, shift, axis=1)
-            
-            # Gaussian noise
-            if np.random.rand() > 0.5:
-                noise = np.random.normal(0, 0.01, X_aug.shape)
-                X_aug = np.clip(X_aug + noise, 0, 1)
-            
-            # Random scaling
-            if np.random.rand() > 0.5:
-                scale_factor = np.random.uniform(0.95, 1.05)
-                X_aug = np.clip(X_aug * scale_factor, 0, 1)
-            
-            X_augmented.append(X_aug)
+            X_augmented.append(augmenter(X))
             y_augmented.append(y)
         
         X_final = np.concatenate(X_augmented, axis=0)
@@ -217,6 +370,10 @@ class DataLoader:
         """
         Split data into train, validation, and test sets.
         
+        Memory-mapped inputs are split into ``<name>_train.npy``,
+        ``<name>_val.npy`` and ``<name>_test.npy`` memmaps next to X's
+        backing file, copied in chunks.
+        
         Args:
             X (np.ndarray): Input data
             y (np.ndarray): Labels
@@ -228,47 +385,105 @@ class DataLoader:
             Tuple: (X_train, X_val, X_test, y_train, y_val, y_test)
         """
         
+        train_idx, val_idx, test_idx = self.split_indices(
+            y, train_ratio, val_ratio, random_state
+        )
+        
+        if isinstance(X, np.memmap):
+            X_train = self._take_memmap(X, train_idx, "train")
+            X_val = self._take_memmap(X, val_idx, "val")
+            X_test = self._take_memmap(X, test_idx, "test")
+        else:
+            X_train, X_val, X_test = X[train_idx], X[val_idx], X[test_idx]
+        
+        y_train, y_val, y_test = y[train_idx], y[val_idx], y[test_idx]
+        
+        print(f"Train set: {X_train.shape[0]} samples")
+        print(f"Val set: {X_val.shape[0]} samples")
+        print(f"Test set: {X_test.shape[0]} samples")
+        
+        return X_train, X_val, X_test, y_train, y_val, y_test
+    
+    def split_indices(self, y: np.ndarray, train_ratio: float = 0.7,
+                      val_ratio: float = 0.15,
+                      random_state: int = 42) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Stratified train/validation/test split of sample indices.
+        
+        Returns:
+            Tuple: (train_idx, val_idx, test_idx)
+        """
+        
+        indices = np.arange(len(y))
+        
         # First split: train+val vs test
-        X_temp, X_test, y_temp, y_test = train_test_split(
-            X, y, test_size=1-train_ratio-val_ratio, 
+        idx_temp, test_idx, y_temp, _ = train_test_split(
+            indices, y, test_size=1-train_ratio-val_ratio, 
             random_state=random_state, stratify=y
         )
         
         # Second split: train vs val
         val_size = val_ratio / (train_ratio + val_ratio)
-        X_train, X_val, y_train, y_val = train_test_split(
-            X_temp, y_temp, test_size=val_size,
+        train_idx, val_idx = train_test_split(
+            idx_temp, test_size=val_size,
             random_state=random_state, stratify=y_temp
         )
         
-        print(f"Train set: {X_train.shape[0]} samples")
-        print(f"Val set: {X_val.shape[0]} samples")
-        print(f"Test set: {X_test.shape[0]} samples")
+        return train_idx, val_idx, test_idx
+    
+    def _take_memmap(self, X: np.memmap, indices: np.ndarray, suffix: str,
+                     chunk_size: int = 256) -> np.memmap:
+        """Gather X[indices] into a new memmap chunk by chunk."""
         
-        return X_train, X_val, X_test, y_train, y_val, y_test
+        out = self._sibling_memmap(X, suffix, (len(indices),) + X.shape[1:])
+        for start in range(0, len(indices), chunk_size):
+            out[start:start + chunk_size] = X[indices[start:start + chunk_size]]
+        out.flush()
+        return out
     
     def create_batches(self, X: np.ndarray, y: np.ndarray, 
-                      batch_size: int = 32, shuffle: bool = True):
+                      batch_size: int = 32, shuffle: bool = True,
+                      augmenter: Optional[StreamingAugmenter] = None,
+                      augmentation_factor: int = 1,
+                      seed: Optional[int] = None):
         """
         Create data batches for training.
         
+        With an augmenter, each epoch visits every sample augmentation_factor
+        times: once unmodified and augmentation_factor - 1 times augmented on
+        the fly, matching augment_data() without materializing the copies.
+        
         Args:
             X (np.ndarray): Input data
             y (np.ndarray): Labels
             batch_size (int): Batch size
             shuffle (bool): Whether to shuffle data
+            augmenter (StreamingAugmenter, optional): Per-batch augmentation
+            augmentation_factor (int): Passes over each sample per epoch
+            seed (int, optional): Seed for the shuffle order
             
         Yields:
             Tuple: (X_batch, y_batch)
         """
         
-        indices = np.arange(len(X))
+        num_samples = len(X)
+        passes = augmentation_factor if augmenter is not None else 1
+        # Position i refers to sample i % num_samples; copies past the first are augmented
+        indices = np.arange(num_samples * passes)
         if shuffle:
-            np.random.shuffle(indices)
+            rng = np.random.default_rng(seed) if seed is not None else np.random
+            rng.shuffle(indices)
         
-        for start_idx in range(0, len(X), batch_size):
-            batch_indices = indices[start_idx:start_idx + batch_size]
-            yield X[batch_indices], y[batch_indices]
+        for start_idx in range(0, len(indices), batch_size):
+            batch_positions = indices[start_idx:start_idx + batch_size]
+            if isinstance(X, np.memmap):
+                # Read rows in file order; only this batch is loaded into RAM
+                batch_positions = batch_positions[np.argsort(batch_positions % num_samples, kind='stable')]
+            batch_indices = batch_positions % num_samples
+            X_batch = X[batch_indices]
+            if augmenter is not None:
+                X_batch = augmenter(X_batch, mask=batch_positions >= num_samples)
+            yield X_batch, y[batch_indices]
 
 
 # Example usage
@@ -293,18 +508,17 @@ if __name__ == "__main__":
     print(f"Normalized X shape: {X_normalized.shape}")
     print(f"Normalized X range: [{X_normalized.min():.4f}, {X_normalized.max():.4f}]")
     
-    # Augment
-    print("\nAugmenting data (2x)...")
-    X_aug, y_aug = loader.augment_data(X_normalized, y, augmentation_factor=2)
-    
     # Split
     print("\nSplitting data...")
-    X_train, X_val, X_test, y_train, y_val, y_test = loader.split_data(X_aug, y_aug)
+    X_train, X_val, X_test, y_train, y_val, y_test = loader.split_data(X_normalized, y)
     
-    # Create batches
-    print("\nCreating batches (batch_size=32)...")
+    # Create batches, augmenting on the fly (2x)
+    print("\nCreating augmented batches (batch_size=32, 2x)...")
+    augmenter = StreamingAugmenter(loader.layout, seed=0)
     batch_count = 0
-    for X_batch, y_batch in loader.create_batches(X_train, y_train, batch_size=32):
+    for X_batch, y_batch in loader.create_batches(X_train, y_train, batch_size=32,
+                                                  augmenter=augmenter,
+                                                  augmentation_factor=2, seed=0):
         batch_count += 1
         if batch_count <= 3:
             print(f"Batch {batch_count}: X={X_batch.shape}, y={y_batch.shape}")
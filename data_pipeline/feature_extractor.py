@@ -9,7 +9,7 @@ Extracts comprehensive landmark data from video frames:
 Enhanced with support for full 468-point face detection to capture
 non-manual markers crucial for multilingual sign language grammar.
 
-Keypoint dimensions:
+Keypoint dimensions (see data_pipeline.keypoint_schema.HOLISTIC_LAYOUT):
 - Hands: 42 * 4 = 168
 - Face: 468 * 3 = 1404
 - Pose: 33 * 4 = 132
@@ -21,6 +21,18 @@ import numpy as np
 from pathlib import Path
 from typing import Tuple, Optional, Dict, List
 
+from data_pipeline.keypoint_schema import HOLISTIC_LAYOUT
+from data_pipeline.temporal_sampling import (
+    SAMPLING_MODES, frame_count, uniform_indices, motion_energy, motion_keyframes,
+    read_frames, interpolate_rows
+)
+from modules.frame_source import open_source
+from modules.pipeline_runtime import PipelineRuntime
+from modules.roi_tracker import DEFAULT_MAX_SIDE, RoiTracker
+from modules.quality_tiers import (
+    DEFAULT_TIER, AdaptiveQualityController, TieredDetector, check_tier, create_detector
+)
+
 try:
     import mediapipe as mp
     from mediapipe.solutions import holistic, drawing_utils
@@ -34,8 +46,35 @@ class MediaPipeFeatureExtractor:
     Extract hand, face, and body landmarks from video frames using MediaPipe Holistic.
     """
     
-    def __init__(self):
-        """Initialize MediaPipe Holistic."""
+    def __init__(self, quality_tier: str = DEFAULT_TIER, adaptive_quality: bool = False,
+                 target_fps: float = 30.0, roi_tracking: bool = False,
+                 roi_max_side: Optional[int] = DEFAULT_MAX_SIDE):
+        """
+        Initialize MediaPipe Holistic.
+        
+        Args:
+            quality_tier (str): Detector tier, 'full', 'lite' or 'face_off'
+                (see modules/quality_tiers.py)
+            adaptive_quality (bool): Step the tier down/up from measured
+                detection latency against the target_fps frame budget
+            target_fps (float): Frame rate the adaptive controller budgets for
+            roi_tracking (bool): Detect on a crop around the previous frame's
+                landmarks (see modules/roi_tracker.py)
+            roi_max_side (int, optional): Longer side ROI crops are downscaled
+                to (None: full resolution)
+        """
+        self.layout = HOLISTIC_LAYOUT
+        self.quality_tier = check_tier(quality_tier)
+        self.roi_tracker = RoiTracker(max_side=roi_max_side) if roi_tracking else None
+        self.last_pipeline_stats = None
+        self.last_frames_decoded = 0
+        
+        # One float32 buffer reused across frames; the per-part arrays are views into it
+        self._landmark_buffer = self.layout.allocate()
+        self._hands = self._landmark_buffer[self.layout.manual_slice].reshape(42, 4)
+        self._face = self.layout.view(self._landmark_buffer, 'face')
+        self._pose = self.layout.view(self._landmark_buffer, 'pose')
+        
         if mp is None:
             self.holistic = None
             self.mp_drawing = None
@@ -45,27 +84,27 @@ class MediaPipeFeatureExtractor:
         self.mp_holistic = holistic
         self.mp_drawing = drawing_utils
         
-        # Create holistic detector
-        self.holistic = self.mp_holistic.Holistic(
-            static_image_mode=False,
-            model_complexity=1,  # 0 = lite, 1 = full
-            smooth_landmarks=True,
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
-        )
+        # Create holistic detector for the configured quality tier
+        if adaptive_quality:
+            self.holistic = TieredDetector(
+                AdaptiveQualityController(quality_tier, target_fps), create_detector
+            )
+        else:
+            self.holistic = create_detector(quality_tier)
         
     def get_dummy_landmarks(self) -> Dict[str, np.ndarray]:
         """Return dummy landmarks when MediaPipe is not available."""
+        self._landmark_buffer.fill(0.0)
         return {
-            'hands': np.zeros((42, 4)),
+            'hands': self._hands,
             'hand_confidence': 0.0,
-            'face': np.zeros((100, 4)),
+            'face': self._face,
             'face_confidence': 0.0,
-            'pose': np.zeros((33, 4)),
+            'pose': self._pose,
             'pose_confidence': 0.0
         }
     
-    def extract_landmarks(self, frame: np.ndarray) -> Dict[str, np.ndarray]:
+    def extract_landmarks(self, frame: np.ndarray, return_results: bool = False):
         """
         Extract all landmarks from a single frame.
         
@@ -73,77 +112,68 @@ class MediaPipeFeatureExtractor:
         for non-manual markers (facial expressions, eyebrow movements, etc.).
         
         Args:
-            frame (np.ndarray): Input image frame (RGB format)
+            frame (np.ndarray): Input image frame (BGR format)
+            return_results (bool): Also return the raw Holistic results (e.g.
+                for drawing), so callers need not run the model a second time
             
         Returns:
-            Dict with keys:
-                - 'hands': (42, 4) - 21 pts × 2 hands × 4 values (x, y, z, confidence)
-                - 'face': (468, 3) - Full facial landmarks (468 pts × 3 values)
-                - 'pose': (33, 4) - Body/pose landmarks
-                - 'hand_confidence': Hand detection confidence
-                - 'face_confidence': Face detection confidence
-                - 'pose_confidence': Pose detection confidence
+            Dict as returned by landmarks_from_results(), or
+            (Dict, results) if return_results; results is None without MediaPipe
         """
         
         # Return dummy data if MediaPipe not available
         if self.holistic is None:
-            return self.get_dummy_landmarks()
-        
-        # RGB format required
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.holistic.process(rgb_frame)
-        
-        landmarks = {}
-        
-        # ==================== HAND LANDMARKS ====================
-        hand_landmarks = np.zeros((42, 4))  # 21 pts × 2 hands × 4 values
-        hand_confidence = 0.0
+            landmarks = self.get_dummy_landmarks()
+            return (landmarks, None) if return_results else landmarks
         
-        if results.left_hand_landmarks:
-            for i, lm in enumerate(results.left_hand_landmarks.landmark):
-                hand_landmarks[i] = [lm.x, lm.y, lm.z, lm.confidence]
-            hand_confidence = 0.5
-        
-        if results.right_hand_landmarks:
-            for i, lm in enumerate(results.right_hand_landmarks.landmark):
-                hand_landmarks[21 + i] = [lm.x, lm.y, lm.z, lm.confidence]
-            hand_confidence = max(hand_confidence, 0.5)
-        
-        landmarks['hands'] = hand_landmarks
-        landmarks['hand_confidence'] = hand_confidence
-        
-        # ==================== FACIAL LANDMARKS ====================
-        # Full 468 facial landmarks for non-manual markers
-        # These capture facial expressions, eyebrow movements, mouth shapes, etc.
-        # crucial for multilingual grammar in sign language
-        face_landmarks = np.zeros((468, 3))  # 468 points × 3 values (x, y, z)
-        face_confidence = 0.0
-        
-        if results.face_landmarks:
-            for idx, lm in enumerate(results.face_landmarks.landmark):
-                if idx < 468:
-                    face_landmarks[idx] = [lm.x, lm.y, lm.z]
-            face_confidence = 0.8
+        if self.roi_tracker is not None:
+            # Crop around the signer; landmarks come back in full-frame coordinates
+            results = self.roi_tracker.process(self.holistic, frame)
+        else:
+            # RGB format required
+            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            results = self.holistic.process(rgb_frame)
         
-        landmarks['face'] = face_landmarks
-        landmarks['face_confidence'] = face_confidence
+        landmarks = self.landmarks_from_results(results)
+        return (landmarks, results) if return_results else landmarks
+    
+    def landmarks_from_results(self, results) -> Dict[str, np.ndarray]:
+        """
+        Convert MediaPipe Holistic results into landmark arrays.
         
-        # ==================== BODY/POSE LANDMARKS ====================
-        # 33 body keypoints (full body pose)
-        body_landmarks = np.zeros((33, 4))
-        body_confidence = 0.0
+        The arrays are float32 views into a buffer owned by the extractor and
+        are overwritten by the next call; copy them (or use
+        concatenate_landmarks) to keep a frame around.
         
-        if results.pose_landmarks:
-            for i, lm in enumerate(results.pose_landmarks.landmark):
-                body_landmarks[i] = [lm.x, lm.y, lm.z, lm.confidence]
-            body_confidence = 0.5
+        Args:
+            results: Output of ``Holistic.process``
+            
+        Returns:
+            Dict with keys:
+                - 'hands': (42, 4) - 21 pts × 2 hands × 4 values (x, y, z, visibility)
+                - 'face': (468, 3) - Full facial landmarks (468 pts × 3 values)
+                - 'pose': (33, 4) - Body/pose landmarks
+                - 'hand_confidence': Hand detection confidence
+                - 'face_confidence': Face detection confidence
+                - 'pose_confidence': Pose detection confidence
+        """
         
-        landmarks['pose'] = body_landmarks
-        landmarks['pose_confidence'] = body_confidence
+        # Left/right hands, full 468-point face (non-manual markers such as
+        # facial expressions, eyebrow movements and mouth shapes) and
+        # 33 body keypoints, written straight into the shared buffer
+        present = self.layout.fill_from_results(results, self._landmark_buffer)
         
-        return landmarks
+        return {
+            'hands': self._hands,
+            'hand_confidence': 0.5 if (present['left_hand'] or present['right_hand']) else 0.0,
+            'face': self._face,
+            'face_confidence': 0.8 if present['face'] else 0.0,
+            'pose': self._pose,
+            'pose_confidence': 0.5 if present['pose'] else 0.0
+        }
     
-    def concatenate_landmarks(self, landmarks: Dict[str, np.ndarray]) -> np.ndarray:
+    def concatenate_landmarks(self, landmarks: Dict[str, np.ndarray],
+                              out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Concatenate all landmarks into a single feature vector.
         
@@ -151,135 +181,203 @@ class MediaPipeFeatureExtractor:
         
         Args:
             landmarks (Dict): Output from extract_landmarks()
+            out (np.ndarray, optional): Preallocated (1704,) buffer to write into
             
         Returns:
-            np.ndarray: Flattened feature vector of shape (1704,)
+            np.ndarray: Flattened float32 feature vector of shape (1704,)
                 - Hands: 42 × 4 = 168 dims
                 - Face: 468 × 3 = 1404 dims
                 - Pose: 33 × 4 = 132 dims
                 - Total: 1704 dims
         """
         
-        # Flatten each component
-        hands_flat = landmarks['hands'].flatten()  # 168 dims (42 * 4)
-        face_flat = landmarks['face'].flatten()    # 1404 dims (468 * 3)
-        pose_flat = landmarks['pose'].flatten()    # 132 dims (33 * 4)
+        if out is None:
+            out = self.layout.allocate()
         
-        # Concatenate all features
-        feature_vector = np.concatenate([hands_flat, face_flat, pose_flat])
+        # Copy each component into its slot of the shared layout
+        out[self.layout.manual_slice] = landmarks['hands'].reshape(-1)       # 168 dims (42 * 4)
+        self.layout.view(out, 'face')[:] = landmarks['face']                 # 1404 dims (468 * 3)
+        self.layout.view(out, 'pose')[:] = landmarks['pose']                 # 132 dims (33 * 4)
         
-        return feature_vector  # Total: 1704 dims
+        return out  # Total: 1704 dims
     
-    def extract_sequence(self, video_path: str, num_frames: int = 30) -> np.ndarray:
+    def extract_sequence(self, video_path: str, num_frames: int = 30,
+                         sampling: str = 'uniform') -> np.ndarray:
         """
         Extract landmark sequence from a video file.
         
+        Only the frames selected by the sampling mode are decoded and run
+        through MediaPipe (see data_pipeline.temporal_sampling); their count
+        is kept in ``last_frames_decoded``.
+        
         Args:
             video_path (str): Path to video file
             num_frames (int): Number of frames to extract
+            sampling (str): 'first' (first num_frames frames, zero-padded),
+                'uniform' (uniform stride over the clip), 'motion' (keyframes
+                by motion energy) or 'interpolate' (evenly spaced positions,
+                landmarks linearly interpolated)
             
         Returns:
             np.ndarray: Shape (num_frames, 1704) - sequence of feature vectors
+            
+        Raises:
+            ValueError: If sampling is not one of SAMPLING_MODES
         """
         
-        cap = cv2.VideoCapture(video_path)
-        sequence = []
+        if sampling not in SAMPLING_MODES:
+            raise ValueError(f"Unknown sampling '{sampling}', expected one of {SAMPLING_MODES}")
         
-        while len(sequence) < num_frames:
-            ret, frame = cap.read()
-            if not ret:
-                break
-            
-            # Extract landmarks
-            landmarks = self.extract_landmarks(frame)
-            feature_vector = self.concatenate_landmarks(landmarks)
-            sequence.append(feature_vector)
+        # Frames missing at the end of short clips stay zero
+        sequence = self.layout.allocate(num_frames)
+        self.last_frames_decoded = 0
         
+        total = frame_count(video_path) if sampling != 'first' else num_frames
+        if total == 0:
+            return sequence
+        
+        positions = None
+        if sampling == 'first':
+            indices = np.arange(num_frames)
+        elif sampling == 'uniform':
+            indices = uniform_indices(total, num_frames)
+        elif sampling == 'motion':
+            indices = motion_keyframes(motion_energy(video_path), num_frames)
+        else:
+            positions = np.linspace(0, total - 1, num_frames)
+            indices = np.concatenate([np.floor(positions), np.ceil(positions)]).astype(int)
+        
+        # Extract each needed frame once, in decode order
+        if self.roi_tracker is not None:
+            self.roi_tracker.reset()
+        features = {}
+        cap = cv2.VideoCapture(video_path)
+        for frame_idx, frame in read_frames(cap, np.unique(indices)):
+            landmarks = self.extract_landmarks(frame)
+            features[frame_idx] = self.concatenate_landmarks(landmarks)
         cap.release()
+        self.last_frames_decoded = len(features)
+        
+        if positions is not None:
+            return interpolate_rows(features, positions, sequence, self.layout)
         
-        # Pad with zeros if not enough frames
-        while len(sequence) < num_frames:
-            sequence.append(np.zeros(1704))
+        for row, frame_idx in enumerate(indices):
+            if frame_idx in features:
+                sequence[row] = features[frame_idx]
         
-        return np.array(sequence[:num_frames], dtype=np.float32)
-        return np.array(sequence[:num_frames])
+        return sequence
     
-    def extract_from_webcam(self, duration_seconds: int = 5, num_frames: int = 30) -> np.ndarray:
+    def extract_from_webcam(self, duration_seconds: int = 5, num_frames: int = 30,
+                            source: Optional[str] = None) -> np.ndarray:
         """
         Capture landmarks from webcam for a specified duration.
         
+        Capture, landmark extraction and display are pipelined (see
+        modules.pipeline_runtime); per-stage latency, queue depth and drops of
+        the last capture are kept in ``last_pipeline_stats``.
+        
         Args:
             duration_seconds (int): Duration to capture in seconds
             num_frames (int): Target number of frames
+            source (str, optional): Frame source spec (camera index, video file or
+                stored landmarks, see modules.frame_source); default OMNISIGN_SOURCE
             
         Returns:
-            np.ndarray: Shape (num_frames, 500) - sequence of feature vectors
+            np.ndarray: Shape (num_frames, 1704) - sequence of feature vectors
         """
         
-        cap = cv2.VideoCapture(0)
+        cap = open_source(source)
+        # Landmark replay: the stored landmarks stand in for MediaPipe
+        replay_detector = cap.detector()
         fps = cap.get(cv2.CAP_PROP_FPS)
         target_frame_count = int(duration_seconds * fps)
-        
-        sequence = []
         frame_count = 0
         
-        while frame_count < target_frame_count and len(sequence) < num_frames:
+        # Frames not captured before the deadline stay zero
+        sequence = self.layout.allocate(num_frames)
+        captured = 0
+        if self.roi_tracker is not None:
+            self.roi_tracker.reset()
+        
+        def read_frame():
+            nonlocal frame_count
+            if frame_count >= target_frame_count:
+                return None
             ret, frame = cap.read()
             if not ret:
-                break
-            
+                return None
+            frame_count += 1
+            if replay_detector is not None:
+                # Replayed landmarks were stored as detected: a pixel flip would
+                # also drop the keypoints riding on the frame
+                return frame
             # Flip frame for selfie view
-            frame = cv2.flip(frame, 1)
-            
-            # Extract landmarks
-            landmarks = self.extract_landmarks(frame)
-            feature_vector = self.concatenate_landmarks(landmarks)
-            sequence.append(feature_vector)
-            
-            # Display frame with landmarks
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            results = self.holistic.process(frame_rgb)
-            
-            # Draw landmarks
-            self.mp_drawing.draw_landmarks(
-                frame, 
-                results.face_landmarks, 
-                self.mp_holistic.FACEMESH_TESSELATION
-            )
-            self.mp_drawing.draw_landmarks(
-                frame, 
-                results.left_hand_landmarks, 
-                self.mp_holistic.HAND_CONNECTIONS
-            )
-            self.mp_drawing.draw_landmarks(
-                frame, 
-                results.right_hand_landmarks, 
-                self.mp_holistic.HAND_CONNECTIONS
-            )
-            self.mp_drawing.draw_landmarks(
-                frame, 
-                results.pose_landmarks, 
-                self.mp_holistic.POSE_CONNECTIONS
-            )
+            return cv2.flip(frame, 1)
+        
+        def detect(packet):
+            # Extract landmarks (into a fresh vector: the extractor's buffer is
+            # reused) and keep the same results for drawing
+            if replay_detector is not None:
+                packet.data['results'] = replay_detector.process(packet.frame)
+                landmarks = self.landmarks_from_results(packet.data['results'])
+            else:
+                landmarks, packet.data['results'] = self.extract_landmarks(packet.frame,
+                                                                           return_results=True)
+            packet.data['keypoints'] = self.concatenate_landmarks(landmarks)
+            return packet
+        
+        # Capture and landmark extraction run on their own threads so the
+        # camera keeps its frame rate while this thread draws
+        with PipelineRuntime(read_frame, [("landmarks", detect)]) as runtime:
+            while captured < num_frames:
+                packet = runtime.get(timeout=1.0)
+                if packet is None:
+                    if runtime.finished:
+                        break
+                    continue
+                
+                sequence[captured] = packet.data['keypoints']
+                captured += 1
+                
+                frame = packet.frame
+                results = packet.data.get('results')
+                if results is not None and self.mp_drawing is not None:
+                    # Draw landmarks
+                    self.mp_drawing.draw_landmarks(
+                        frame, 
+                        results.face_landmarks, 
+                        self.mp_holistic.FACEMESH_TESSELATION
+                    )
+                    self.mp_drawing.draw_landmarks(
+                        frame, 
+                        results.left_hand_landmarks, 
+                        self.mp_holistic.HAND_CONNECTIONS
+                    )
+                    self.mp_drawing.draw_landmarks(
+                        frame, 
+                        results.right_hand_landmarks, 
+                        self.mp_holistic.HAND_CONNECTIONS
+                    )
+                    self.mp_drawing.draw_landmarks(
+                        frame, 
+                        results.pose_landmarks, 
+                        self.mp_holistic.POSE_CONNECTIONS
+                    )
+                
+                # Display
+                cv2.putText(frame, f"Frames: {captured}/{num_frames}", 
+                           (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
+                cv2.imshow('Capture Landmarks', frame)
+                
+                if cv2.waitKey(1) & 0xFF == ord('q'):
+                    break
             
-            # Display
-            cv2.putText(frame, f"Frames: {len(sequence)}/{num_frames}", 
-                       (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
-            cv2.imshow('Capture Landmarks', frame)
-            
-            if cv2.waitKey(1) & 0xFF == ord('q'):
-                break
-            
-            frame_count += 1
+            self.last_pipeline_stats = runtime.stats()
         
         cap.release()
         cv2.destroyAllWindows()
         
-        # Pad with zeros if not enough frames
-        while len(sequence) < num_frames:
-            sequence.append(np.zeros(500))
-        
-        return np.array(sequence[:num_frames])
+        return sequence
     
     def normalize_landmarks(self, landmarks: np.ndarray) -> np.ndarray:
         """
@@ -0,0 +1,388 @@
+"""
+Data Pipeline: Shared Keypoint Schema
+
+Declares the single per-frame feature layout used by every producer
+(utils.extract_keypoints, MediaPipeFeatureExtractor, collect_data.py) and
+consumer (DataLoader, training, inference) of landmark data.
+
+A layout is an ordered list of named segments. Each segment records which
+MediaPipe landmark list it is read from, how many points it holds, which
+per-point fields are stored, its dtype, and whether it belongs to the
+manual (hands) or non-manual (face/body) stream. Offsets are derived from
+the order, so the manual and non-manual streams of a frame or a batch can
+be taken as zero-copy views instead of re-slicing copies.
+
+Canonical layout (HOLISTIC_LAYOUT, 1704 dims):
+- left_hand:  21 pts × (x, y, z, visibility) = 84    [manual]
+- right_hand: 21 pts × (x, y, z, visibility) = 84    [manual]
+- face:      468 pts × (x, y, z)             = 1404  [non-manual]
+- pose:       33 pts × (x, y, z, visibility) = 132   [non-manual]
+"""
+
+import numpy as np
+from itertools import chain, islice
+from operator import attrgetter
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+MANUAL = 'manual'
+NON_MANUAL = 'non_manual'
+
+XYZ = ('x', 'y', 'z')
+XYZV = ('x', 'y', 'z', 'visibility')
+
+
+def landmarks_to_array(landmark_list, out: np.ndarray,
+                       fields: Optional[Sequence[str]] = None) -> bool:
+    """
+    Copy a MediaPipe landmark list into a preallocated float32 buffer in one pass.
+
+    All per-point attributes are read with a single C-level ``attrgetter`` and
+    streamed through ``np.fromiter``, instead of assigning one row per landmark
+    from Python.
+
+    Args:
+        landmark_list: MediaPipe landmark list (or None if not detected)
+        out (np.ndarray): Destination buffer of shape (num_points, num_fields)
+        fields (Sequence[str], optional): Landmark attributes to read; defaults
+            to (x, y, z) for 3 columns and (x, y, z, visibility) for 4
+
+    Returns:
+        bool: True if landmarks were copied, False if the buffer was zero-filled
+    """
+    if not landmark_list:
+        out.fill(0.0)
+        return False
+
+    num_points, num_values = out.shape
+    if fields is None:
+        fields = XYZ if num_values == 3 else XYZV
+    landmarks = landmark_list.landmark
+    count = min(len(landmarks), num_points)
+
+    values = np.fromiter(
+        chain.from_iterable(map(attrgetter(*fields), islice(landmarks, count))),
+        dtype=out.dtype,
+        count=count * num_values
+    )
+    out[:count] = values.reshape(count, num_values)
+    out[count:] = 0.0
+    return True
+
+
+class KeypointSegment:
+    """
+    One named, contiguous block of a per-frame feature vector.
+    """
+
+    def __init__(self, name: str, source: str, num_points: int,
+                 fields: Sequence[str], stream: str, dtype=np.float32):
+        """
+        Initialize a segment.
+
+        Args:
+            name (str): Segment name (e.g. 'left_hand')
+            source (str): Attribute of the Holistic results holding the landmarks
+            num_points (int): Number of landmarks
+            fields (Sequence[str]): Per-landmark attributes stored, in order
+            stream (str): MANUAL or NON_MANUAL
+            dtype: Storage dtype
+        """
+        if stream not in (MANUAL, NON_MANUAL):
+            raise ValueError(f"Unknown stream '{stream}' for segment '{name}'")
+
+        self.name = name
+        self.source = source
+        self.num_points = num_points
+        self.fields = tuple(fields)
+        self.stream = stream
+        self.dtype = np.dtype(dtype)
+        self.offset = 0  # Assigned by the owning layout
+
+    @property
+    def values_per_point(self) -> int:
+        return len(self.fields)
+
+    @property
+    def size(self) -> int:
+        return self.num_points * self.values_per_point
+
+    @property
+    def slice(self) -> slice:
+        return slice(self.offset, self.offset + self.size)
+
+    def to_dict(self) -> Dict:
+        """Describe the segment for metadata files."""
+        return {
+            'name': self.name,
+            'source': self.source,
+            'num_points': self.num_points,
+            'fields': list(self.fields),
+            'stream': self.stream,
+            'dtype': self.dtype.name,
+            'offset': self.offset
+        }
+
+
+class KeypointLayout:
+    """
+    Ordered collection of segments describing one feature vector layout.
+    """
+
+    def __init__(self, name: str, segments: List[KeypointSegment]):
+        """
+        Initialize a layout and assign segment offsets.
+
+        Args:
+            name (str): Layout identifier stored alongside saved data
+            segments (List[KeypointSegment]): Segments in storage order
+        """
+        dtypes = {segment.dtype for segment in segments}
+        if len(dtypes) != 1:
+            raise ValueError(f"Layout '{name}' mixes dtypes {sorted(d.name for d in dtypes)}")
+
+        self.name = name
+        self.segments = list(segments)
+        self.dtype = dtypes.pop()
+
+        offset = 0
+        for segment in self.segments:
+            segment.offset = offset
+            offset += segment.size
+        self.size = offset
+
+        self._by_name = {segment.name: segment for segment in self.segments}
+
+    def segment(self, name: str) -> KeypointSegment:
+        """Look up a segment by name."""
+        if name not in self._by_name:
+            raise KeyError(f"Layout '{self.name}' has no segment '{name}'")
+        return self._by_name[name]
+
+    def stream_segments(self, stream: str) -> List[KeypointSegment]:
+        """Segments belonging to one stream, in storage order."""
+        return [segment for segment in self.segments if segment.stream == stream]
+
+    def stream_slice(self, stream: str) -> slice:
+        """
+        Slice covering one stream.
+
+        Raises:
+            ValueError: If the stream's segments are not adjacent, since a
+                view could not be taken without copying
+        """
+        segments = self.stream_segments(stream)
+        if not segments:
+            raise ValueError(f"Layout '{self.name}' has no {stream} segments")
+
+        start = segments[0].offset
+        stop = start
+        for segment in segments:
+            if segment.offset != stop:
+                raise ValueError(f"{stream} segments of layout '{self.name}' are not contiguous")
+            stop += segment.size
+        return slice(start, stop)
+
+    @property
+    def manual_slice(self) -> slice:
+        return self.stream_slice(MANUAL)
+
+    @property
+    def non_manual_slice(self) -> slice:
+        return self.stream_slice(NON_MANUAL)
+
+    @property
+    def manual_size(self) -> int:
+        return self.manual_slice.stop - self.manual_slice.start
+
+    @property
+    def non_manual_size(self) -> int:
+        return self.non_manual_slice.stop - self.non_manual_slice.start
+
+    def allocate(self, *leading_shape: int) -> np.ndarray:
+        """Return a zeroed array of shape (*leading_shape, size)."""
+        return np.zeros(leading_shape + (self.size,), dtype=self.dtype)
+
+    def validate(self, X: np.ndarray, source: str = "array") -> np.ndarray:
+        """
+        Check that the last axis of X matches this layout.
+
+        Args:
+            X (np.ndarray): Frame, sequence or batch of features
+            source (str): Description of X used in the error message
+
+        Returns:
+            np.ndarray: X unchanged
+
+        Raises:
+            ValueError: If the feature dimension does not match
+        """
+        if X.ndim == 0 or X.shape[-1] != self.size:
+            found = X.shape[-1] if X.ndim else 'scalar'
+            hint = ""
+            if X.ndim and X.shape[-1] in LEGACY_LAYOUTS:
+                hint = (f"; it matches legacy layout '{LEGACY_LAYOUTS[X.shape[-1]].name}', "
+                        f"convert it explicitly (python migrate_data.py --convert-legacy, "
+                        f"OmniSignTrainer(convert_legacy=True) or DataLoader(convert_legacy=True))")
+            raise ValueError(
+                f"{source} has {found} features per frame, layout '{self.name}' "
+                f"expects {self.size}{hint}"
+            )
+        return X
+
+    def conform(self, frame: np.ndarray, convert_legacy: bool = False,
+                source: str = "frame") -> np.ndarray:
+        """
+        Return a single saved frame in this layout.
+
+        Frames in a known legacy layout are converted segment by segment when
+        convert_legacy is set; any other size mismatch is an error rather
+        than being padded or truncated.
+
+        Raises:
+            ValueError: If the frame does not match the layout
+        """
+        frame = frame.reshape(-1)
+
+        if frame.shape[0] == self.size:
+            return frame
+
+        legacy_layout = LEGACY_LAYOUTS.get(frame.shape[0])
+        if convert_legacy and legacy_layout is not None:
+            return self.convert(frame, legacy_layout)
+
+        return self.validate(frame, source=source)
+
+    def view(self, X: np.ndarray, name: str) -> np.ndarray:
+        """
+        View one segment of X as (..., num_points, values_per_point).
+
+        Writing to the returned array writes through to X.
+        """
+        segment = self.segment(name)
+        part = X[..., segment.slice]
+        return part.reshape(part.shape[:-1] + (segment.num_points, segment.values_per_point))
+
+    def split_streams(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Split features into (manual, non_manual) zero-copy views.
+
+        Args:
+            X (np.ndarray): Features with this layout on the last axis
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Manual and non-manual stream views
+        """
+        self.validate(X)
+        return X[..., self.manual_slice], X[..., self.non_manual_slice]
+
+    def fill_from_results(self, results, out: np.ndarray) -> Dict[str, bool]:
+        """
+        Write MediaPipe Holistic results into a preallocated frame vector.
+
+        Args:
+            results: Output of ``Holistic.process`` (or None)
+            out (np.ndarray): (size,) buffer in this layout
+
+        Returns:
+            Dict[str, bool]: Whether each segment was detected
+        """
+        present = {}
+        for segment in self.segments:
+            landmark_list = getattr(results, segment.source, None) if results else None
+            present[segment.name] = landmarks_to_array(
+                landmark_list, self.view(out, segment.name), segment.fields
+            )
+        return present
+
+    def from_results(self, results) -> np.ndarray:
+        """Return a new frame vector built from MediaPipe Holistic results."""
+        out = self.allocate()
+        self.fill_from_results(results, out)
+        return out
+
+    def to_results(self, frame: np.ndarray) -> SimpleNamespace:
+        """
+        Build Holistic-style results from a frame vector (inverse of from_results).
+
+        Segments that are all zero (not detected) become None; fields the
+        layout does not store (e.g. face visibility) are 0.
+        """
+        results = SimpleNamespace()
+        for segment in self.segments:
+            points = self.view(frame, segment.name)
+            landmark_list = None
+            if points.any():
+                landmark = []
+                for row in points.tolist():
+                    values = dict.fromkeys(XYZV, 0.0)
+                    values.update(zip(segment.fields, row))
+                    landmark.append(SimpleNamespace(**values))
+                landmark_list = SimpleNamespace(landmark=landmark)
+            setattr(results, segment.source, landmark_list)
+        return results
+
+    def convert(self, X: np.ndarray, source_layout: 'KeypointLayout') -> np.ndarray:
+        """
+        Re-lay out features recorded with another layout.
+
+        Segments are matched by name and fields by attribute name; anything
+        the source layout did not record is left at zero.
+
+        Args:
+            X (np.ndarray): Features in source_layout
+            source_layout (KeypointLayout): Layout X was recorded with
+
+        Returns:
+            np.ndarray: New array in this layout
+        """
+        source_layout.validate(X, source=f"'{source_layout.name}' data")
+        out = self.allocate(*X.shape[:-1])
+
+        for segment in self.segments:
+            if segment.name not in source_layout._by_name:
+                continue
+            source_segment = source_layout.segment(segment.name)
+            points = min(segment.num_points, source_segment.num_points)
+            src = source_layout.view(X, segment.name)
+            dst = self.view(out, segment.name)
+            for field_idx, field in enumerate(segment.fields):
+                if field in source_segment.fields:
+                    src_idx = source_segment.fields.index(field)
+                    dst[..., :points, field_idx] = src[..., :points, src_idx]
+
+        return out
+
+    def to_dict(self) -> Dict:
+        """Describe the layout for metadata files."""
+        return {
+            'name': self.name,
+            'size': self.size,
+            'segments': [segment.to_dict() for segment in self.segments]
+        }
+
+
+# Canonical layout: manual stream first, then non-manual, each contiguous
+HOLISTIC_LAYOUT = KeypointLayout('holistic_1704', [
+    KeypointSegment('left_hand', 'left_hand_landmarks', 21, XYZV, MANUAL),
+    KeypointSegment('right_hand', 'right_hand_landmarks', 21, XYZV, MANUAL),
+    KeypointSegment('face', 'face_landmarks', 468, XYZ, NON_MANUAL),
+    KeypointSegment('pose', 'pose_landmarks', 33, XYZV, NON_MANUAL),
+])
+
+# Layouts written by earlier collection scripts, keyed by frame size.
+# They are only ever read through HOLISTIC_LAYOUT.convert().
+LEGACY_LAYOUTS = {
+    1662: KeypointLayout('pose_face_hands_1662', [
+        KeypointSegment('pose', 'pose_landmarks', 33, XYZV, NON_MANUAL),
+        KeypointSegment('face', 'face_landmarks', 468, XYZ, NON_MANUAL),
+        KeypointSegment('left_hand', 'left_hand_landmarks', 21, XYZ, MANUAL),
+        KeypointSegment('right_hand', 'right_hand_landmarks', 21, XYZ, MANUAL),
+    ]),
+    258: KeypointLayout('pose_hands_258', [
+        KeypointSegment('pose', 'pose_landmarks', 33, XYZV, NON_MANUAL),
+        KeypointSegment('left_hand', 'left_hand_landmarks', 21, XYZ, MANUAL),
+        KeypointSegment('right_hand', 'right_hand_landmarks', 21, XYZ, MANUAL),
+    ]),
+}
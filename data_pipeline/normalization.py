@@ -0,0 +1,160 @@
+"""
+Data Pipeline: Streaming Feature Normalization
+
+Per-feature standardization (zero mean, unit variance) whose statistics
+are accumulated chunk by chunk with Chan/Welford updates, so fitting
+never needs the whole dataset resident or a float64 copy of it. The
+statistics are saved next to the trained model (see normalizer_path) so
+inference applies exactly the training normalization.
+"""
+
+import numpy as np
+from pathlib import Path
+from typing import Optional, Union
+
+
+def normalizer_path(model_path: Union[str, Path]) -> Path:
+    """Statistics file stored alongside a model, e.g. model.normalizer.npz."""
+    return Path(model_path).with_suffix('.normalizer.npz')
+
+
+class StreamingStandardizer:
+    """
+    Incrementally fitted per-feature standardizer applied in float32.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean_ = None      # float64 running mean
+        self._m2 = None        # float64 running sum of squared deviations
+        self._offset = None    # float32 mean used by transform()
+        self._inv_scale = None  # float32 1 / std used by transform()
+
+    @property
+    def is_fitted(self) -> bool:
+        return self._offset is not None
+
+    @property
+    def var_(self) -> np.ndarray:
+        return self._m2 / max(self.count, 1)
+
+    @property
+    def scale_(self) -> np.ndarray:
+        scale = np.sqrt(self.var_)
+        scale[scale < 10 * np.finfo(np.float64).eps] = 1.0  # Constant features pass through
+        return scale
+
+    def _finalize(self):
+        self._offset = self.mean_.astype(np.float32)
+        self._inv_scale = (1.0 / self.scale_).astype(np.float32)
+
+    def partial_fit(self, X: np.ndarray) -> 'StreamingStandardizer':
+        """
+        Update the running statistics with a chunk.
+
+        Args:
+            X (np.ndarray): (..., num_features) chunk; all leading axes are samples
+
+        Returns:
+            StreamingStandardizer: self
+        """
+        chunk = X.reshape(-1, X.shape[-1])
+        n = chunk.shape[0]
+        if n == 0:
+            return self
+
+        chunk_mean = chunk.mean(axis=0, dtype=np.float64)
+        chunk_m2 = chunk.var(axis=0, dtype=np.float64) * n
+
+        if self.count == 0:
+            self.mean_, self._m2 = chunk_mean, chunk_m2
+        else:
+            total = self.count + n
+            delta = chunk_mean - self.mean_
+            self.mean_ = self.mean_ + delta * (n / total)
+            self._m2 = self._m2 + chunk_m2 + delta ** 2 * (self.count * n / total)
+        self.count += n
+
+        self._finalize()
+        return self
+
+    def fit(self, X: np.ndarray, chunk_size: int = 256) -> 'StreamingStandardizer':
+        """
+        Fit from scratch, reading X in chunks along its first axis.
+
+        Args:
+            X (np.ndarray): (N, ..., num_features) array or memmap
+            chunk_size (int): Rows of X per chunk
+
+        Returns:
+            StreamingStandardizer: self
+        """
+        self.__init__()
+        for start in range(0, len(X), chunk_size):
+            self.partial_fit(X[start:start + chunk_size])
+        return self
+
+    def transform(self, X: np.ndarray, out: Optional[np.ndarray] = None,
+                  chunk_size: int = 256) -> np.ndarray:
+        """
+        Standardize X in float32.
+
+        Writable float32 arrays are normalized in place unless ``out`` is
+        given; anything else is written to a new float32 array.
+
+        Args:
+            X (np.ndarray): (num_features,) frame or (..., num_features) array
+            out (np.ndarray, optional): Destination with X's shape
+            chunk_size (int): Rows of X per chunk (bounds temporaries for memmaps)
+
+        Returns:
+            np.ndarray: The normalized array (``out``, X itself, or a new array)
+        """
+        if not self.is_fitted:
+            raise RuntimeError("StreamingStandardizer has not been fitted")
+        if X.shape[-1] != self._offset.shape[0]:
+            raise ValueError(
+                f"Expected {self._offset.shape[0]} features, got {X.shape[-1]}"
+            )
+
+        if out is None:
+            if X.dtype == np.float32 and X.flags.writeable:
+                out = X
+            else:
+                out = np.empty(X.shape, dtype=np.float32)
+
+        # A single (num_features,) frame has no sample axis to chunk over
+        chunks = range(0, len(X), chunk_size) if X.ndim > 1 else [None]
+        for start in chunks:
+            rows = slice(start, None if start is None else start + chunk_size)
+            np.subtract(X[rows], self._offset, out=out[rows])
+            np.multiply(out[rows], self._inv_scale, out=out[rows])
+
+        if isinstance(out, np.memmap):
+            out.flush()
+        return out
+
+    def inverse_transform(self, X: np.ndarray) -> np.ndarray:
+        """Undo transform(): standardized float32 values back to raw coordinates (new array)."""
+        if not self.is_fitted:
+            raise RuntimeError("StreamingStandardizer has not been fitted")
+        return X.astype(np.float32) / self._inv_scale + self._offset
+
+    def save(self, path: Union[str, Path]):
+        """Write the fitted statistics to an .npz file."""
+        if not self.is_fitted:
+            raise RuntimeError("StreamingStandardizer has not been fitted")
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(path, count=self.count, mean=self.mean_, m2=self._m2)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'StreamingStandardizer':
+        """Load statistics written by save()."""
+        with np.load(path) as stats:
+            normalizer = cls()
+            normalizer.count = int(stats['count'])
+            normalizer.mean_ = stats['mean']
+            normalizer._m2 = stats['m2']
+        normalizer._finalize()
+        return normalizer
@@ -0,0 +1,245 @@
+"""
+Data Pipeline: Consolidated Sequence Storage
+
+Stores every sequence of an action in one contiguous, memory-mappable .npy
+array instead of one .npy file per frame, with a JSON index recording the
+keypoint layout and which sequences have been recorded.
+
+Structure:
+    data_path/
+    ├── sequences_index.json
+    ├── Hello.npy          # (no_sequences, sequence_length, 1704) float32
+    ├── Thank you.npy
+    └── ...
+
+A 25 action × 30 sequence × 30 frame dataset becomes 26 files instead of
+22,500, and an action loads with a single read (or mmap).
+"""
+
+import hashlib
+import json
+import numpy as np
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from data_pipeline.keypoint_schema import HOLISTIC_LAYOUT, KeypointLayout
+
+
+INDEX_FILENAME = "sequences_index.json"
+STORE_FORMAT_VERSION = 1
+
+
+class SequenceStore:
+    """
+    One .npy array per action plus an index, readable with np.load or mmap.
+    """
+
+    def __init__(self, root: str, sequence_length: int = 30,
+                 layout: KeypointLayout = HOLISTIC_LAYOUT):
+        """
+        Open (or prepare to create) a store.
+
+        Args:
+            root (str): Directory holding the index and per-action arrays
+            sequence_length (int): Frames per sequence
+            layout (KeypointLayout): Feature layout of every frame
+
+        Raises:
+            ValueError: If an existing index was written with another layout
+                or sequence length
+        """
+        self.root = Path(root)
+        self.sequence_length = sequence_length
+        self.layout = layout
+        self.index_path = self.root / INDEX_FILENAME
+        self._arrays = {}  # action -> open writable memmap
+
+        if self.index_path.exists():
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                self.index = json.load(f)
+            self._check_index()
+        else:
+            self.index = {
+                'format': STORE_FORMAT_VERSION,
+                'layout': self.layout.to_dict(),
+                'sequence_length': self.sequence_length,
+                'actions': {}
+            }
+
+    @staticmethod
+    def exists(root: str) -> bool:
+        """Whether a consolidated store has been written under root."""
+        return (Path(root) / INDEX_FILENAME).exists()
+
+    def _check_index(self):
+        """Fail loudly if the stored data does not match this store's layout."""
+        stored_layout = self.index.get('layout', {})
+        if (stored_layout.get('name') != self.layout.name or
+                stored_layout.get('size') != self.layout.size):
+            raise ValueError(
+                f"{self.index_path} holds layout '{stored_layout.get('name')}' "
+                f"({stored_layout.get('size')} dims), expected '{self.layout.name}' "
+                f"({self.layout.size} dims)"
+            )
+        if self.index.get('sequence_length') != self.sequence_length:
+            raise ValueError(
+                f"{self.index_path} holds {self.index.get('sequence_length')}-frame "
+                f"sequences, expected {self.sequence_length}"
+            )
+
+    def unmigrated_actions(self) -> List[str]:
+        """
+        Actions of a per-frame tree (<action>/<sequence>/<frame>.npy) under
+        root that are not in this store.
+        """
+        if not self.root.is_dir():
+            return []
+        return sorted(
+            path.name for path in self.root.iterdir()
+            if path.is_dir() and path.name not in self.index['actions']
+            and any(child.is_dir() and child.name.isdigit() for child in path.iterdir())
+        )
+
+    def require_migrated(self):
+        """
+        Refuse to write a store next to unmigrated per-frame data.
+
+        Raises:
+            RuntimeError: If per-frame action directories are not in the store
+        """
+        unmigrated = self.unmigrated_actions()
+        if unmigrated:
+            raise RuntimeError(
+                f"{self.root} holds per-frame data for {', '.join(unmigrated)}; run "
+                f"'python migrate_data.py --data-path {self.root}' (add --convert-legacy for "
+                f"258/1662-dim frames) before writing new sequences"
+            )
+
+    @property
+    def actions(self) -> List[str]:
+        """Actions present in the store, in insertion order."""
+        return list(self.index['actions'])
+
+    def action_file(self, action: str) -> Path:
+        """Path of the array holding an action's sequences."""
+        return self.root / self.index['actions'][action]['file']
+
+    def recorded_sequences(self, action: str) -> List[int]:
+        """Sorted sequence indices that have been written for an action."""
+        if action not in self.index['actions']:
+            return []
+        return self.index['actions'][action]['recorded']
+
+    def save_index(self):
+        """Write the index atomically."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.index, f, ensure_ascii=False, indent=2)
+        tmp_path.replace(self.index_path)
+
+    def _action_filename(self, action: str) -> str:
+        """
+        File name for a new action: the action name when it is a safe, unused
+        file name, otherwise the sanitized name plus a hash of the action
+        (so "a/b" and "a_b" never share an array).
+        """
+        stem = action.replace('/', '_').replace('\\', '_')
+        used = {entry['file'].lower() for entry in self.index['actions'].values()}
+        filename = f"{stem}.npy"
+        if stem != action or filename.lower() in used:
+            digest = hashlib.sha1(action.encode('utf-8')).hexdigest()[:8]
+            filename = f"{stem}-{digest}.npy"
+        if filename.lower() in used:
+            raise ValueError(f"Cannot derive a unique file name for action '{action}' in {self.root}")
+        return filename
+
+    def create_action(self, action: str, num_sequences: int) -> np.memmap:
+        """
+        Allocate the on-disk array for an action (no-op if it already exists).
+
+        Args:
+            action (str): Action name
+            num_sequences (int): Number of sequence slots
+
+        Returns:
+            np.memmap: Writable (num_sequences, sequence_length, size) array
+        """
+        if action in self._arrays:
+            return self._arrays[action]
+
+        if action in self.index['actions']:
+            array = np.load(self.action_file(action), mmap_mode='r+')
+        else:
+            self.root.mkdir(parents=True, exist_ok=True)
+            filename = self._action_filename(action)
+            array = np.lib.format.open_memmap(
+                self.root / filename, mode='w+', dtype=self.layout.dtype,
+                shape=(num_sequences, self.sequence_length, self.layout.size)
+            )
+            self.index['actions'][action] = {
+                'file': filename,
+                'num_sequences': num_sequences,
+                'recorded': []
+            }
+            self.save_index()
+
+        self._arrays[action] = array
+        return array
+
+    def write_sequence(self, action: str, sequence_idx: int, sequence: np.ndarray):
+        """
+        Write one (sequence_length, size) sequence and mark it recorded.
+
+        The action must have been allocated with create_action().
+        """
+        self.layout.validate(sequence, source=f"{action}/{sequence_idx}")
+        array = self.create_action(action, self.index['actions'][action]['num_sequences'])
+        array[sequence_idx] = sequence
+        array.flush()
+
+        recorded = self.index['actions'][action]['recorded']
+        if sequence_idx not in recorded:
+            recorded.append(sequence_idx)
+            recorded.sort()
+        self.save_index()
+
+    def write_action(self, action: str, sequences: np.ndarray, recorded: List[int]):
+        """
+        Write all sequences of an action at once.
+
+        Args:
+            action (str): Action name
+            sequences (np.ndarray): (num_sequences, sequence_length, size) array
+            recorded (List[int]): Indices of sequences holding real data
+        """
+        self.layout.validate(sequences, source=action)
+        array = self.create_action(action, sequences.shape[0])
+        array[:] = sequences
+        array.flush()
+        self.index['actions'][action]['recorded'] = sorted(recorded)
+        self.save_index()
+
+    def read_action(self, action: str, mmap: bool = False) -> Tuple[np.ndarray, List[int]]:
+        """
+        Read an action's sequence array.
+
+        Args:
+            action (str): Action name
+            mmap (bool): Return a read-only memmap instead of loading into RAM
+
+        Returns:
+            Tuple[array, recorded]: Full slot array and indices of recorded sequences
+        """
+        array = np.load(self.action_file(action), mmap_mode='r' if mmap else None)
+        return array, self.recorded_sequences(action)
+
+    def close(self):
+        """Flush and release any open writable arrays."""
+        for array in self._arrays.values():
+            array.flush()
+        self._arrays.clear()
+
+    def summary(self) -> Dict[str, int]:
+        """Recorded sequence count per action."""
+        return {action: len(entry['recorded']) for action, entry in self.index['actions'].items()}
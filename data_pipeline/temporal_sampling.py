@@ -0,0 +1,176 @@
+"""
+Data Pipeline: Temporal Sampling of Video Clips
+
+Chooses which frames of a clip become the fixed-length landmark sequence,
+so that landmark extraction (the expensive part) only runs on frames that
+are kept:
+
+- 'first':       the first num_frames frames, zero-padded (previous behaviour)
+- 'uniform':     num_frames frames at a uniform stride over the whole clip;
+                 short clips are stretched by repeating frames
+- 'motion':      keyframes placed by motion energy: a cheap low-resolution
+                 frame-difference pass, then frames sampled uniformly in
+                 cumulative motion, so the window concentrates on the sign
+                 instead of the approach to it
+- 'interpolate': num_frames evenly spaced (fractional) positions; the two
+                 neighbouring frames of each are extracted and their
+                 landmarks linearly interpolated
+
+read_frames() decodes just the requested frames, skip-grabbing (no colour
+conversion) across short gaps and seeking across long ones.
+"""
+
+import cv2
+import numpy as np
+from typing import Dict, Iterator, Tuple
+
+from data_pipeline.keypoint_schema import HOLISTIC_LAYOUT, KeypointLayout
+
+
+SAMPLING_MODES = ('first', 'uniform', 'motion', 'interpolate')
+
+
+def frame_count(video_path: str) -> int:
+    """Number of frames in a clip (counted by grabbing if the container does not say)."""
+    cap = cv2.VideoCapture(video_path)
+    total = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    if total <= 0:
+        total = 0
+        while cap.grab():
+            total += 1
+    cap.release()
+    return total
+
+
+def uniform_indices(total: int, num_frames: int) -> np.ndarray:
+    """num_frames indices at a uniform stride over [0, total - 1] (repeats if total < num_frames)."""
+    return np.round(np.linspace(0, total - 1, num_frames)).astype(int)
+
+
+def motion_energy(video_path: str, size: Tuple[int, int] = (64, 48)) -> np.ndarray:
+    """
+    Per-frame motion energy: mean absolute difference to the previous frame
+    on a small grayscale copy (energy[0] = 0).
+    """
+    cap = cv2.VideoCapture(video_path)
+    energy = []
+    previous = None
+    while True:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        small = cv2.cvtColor(cv2.resize(frame, size, interpolation=cv2.INTER_AREA),
+                             cv2.COLOR_BGR2GRAY).astype(np.float32)
+        energy.append(0.0 if previous is None else float(np.abs(small - previous).mean()))
+        previous = small
+    cap.release()
+    return np.array(energy, dtype=np.float64)
+
+
+def motion_keyframes(energy: np.ndarray, num_frames: int, floor: float = 0.2) -> np.ndarray:
+    """
+    Sample num_frames indices uniformly in cumulative motion energy.
+
+    Args:
+        energy (np.ndarray): Per-frame motion energy
+        num_frames (int): Frames to select
+        floor (float): Share of the sampling mass spread uniformly over time,
+            so static stretches (holds at the start/end of a sign) are not
+            dropped entirely
+
+    Returns:
+        np.ndarray: Non-decreasing frame indices (in temporal order)
+    """
+    total = len(energy)
+    if energy.sum() <= 0:
+        return uniform_indices(total, num_frames)
+    weights = (1 - floor) * energy / energy.sum() + floor / total
+    cdf = np.cumsum(weights)
+    targets = (np.arange(num_frames) + 0.5) / num_frames * cdf[-1]
+    return np.minimum(np.searchsorted(cdf, targets), total - 1)
+
+
+def _seek(cap: cv2.VideoCapture, index: int, step: int) -> int:
+    """
+    Seek to at most `index`; returns the position actually reached.
+
+    Seeks can land early on some codecs (read_frames grabs the rest of the
+    way) or late on others. A late landing is retried further back, down
+    to frame 0, so the frame read at `index` is never a later one.
+    """
+    target = index
+    while True:
+        cap.set(cv2.CAP_PROP_POS_FRAMES, target)
+        position = int(cap.get(cv2.CAP_PROP_POS_FRAMES))
+        if position <= index or target == 0:
+            return position
+        target = max(0, target - step)
+        step *= 2
+
+
+def read_frames(cap: cv2.VideoCapture, indices: np.ndarray,
+                max_grab_gap: int = 48) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Decode only the given frames of an open capture.
+
+    Args:
+        cap (cv2.VideoCapture): Capture positioned at frame 0
+        indices (np.ndarray): Sorted, unique frame indices
+        max_grab_gap (int): Gaps up to this many frames are skipped with
+            grab(); longer gaps seek (CAP_PROP_POS_FRAMES)
+
+    Yields:
+        Tuple[index, frame]: BGR frames, in order (an index no seek can reach
+            without overshooting is skipped, never yielded with a later frame)
+    """
+    position = 0  # Index of the frame the next read() returns
+    for index in indices:
+        if index - position > max_grab_gap:
+            position = _seek(cap, int(index), max_grab_gap)
+        if position > index:
+            continue  # Unreachable: never yield a later frame under this index
+        while position < index:
+            if not cap.grab():
+                return
+            position += 1
+        ret, frame = cap.read()
+        if not ret:
+            return
+        position += 1
+        yield int(index), frame
+
+
+def interpolate_rows(features: Dict[int, np.ndarray], positions: np.ndarray,
+                     out: np.ndarray, layout: KeypointLayout = HOLISTIC_LAYOUT) -> np.ndarray:
+    """
+    Linearly interpolate frames at fractional positions.
+
+    Each layout segment (hand, face, pose) is interpolated separately; if it
+    was not detected in one of the two neighbouring frames (all zeros), the
+    other neighbour's values are used instead of blending towards zero.
+
+    Args:
+        features (Dict[int, np.ndarray]): Extracted frame index -> keypoint vector
+        positions (np.ndarray): (num_frames,) fractional frame positions
+        out (np.ndarray): (num_frames, layout.size) output
+
+    Returns:
+        np.ndarray: out
+    """
+    for row, position in enumerate(positions):
+        lower, upper = int(np.floor(position)), int(np.ceil(position))
+        if lower not in features:
+            continue
+        if upper not in features:
+            upper = lower
+        weight = position - lower
+        for segment in layout.segments:
+            a = features[lower][segment.slice]
+            b = features[upper][segment.slice]
+            if not a.any():
+                out[row, segment.slice] = b
+            elif not b.any():
+                out[row, segment.slice] = a
+            else:
+                out[row, segment.slice] = (1 - weight) * a + weight * b
+    return out
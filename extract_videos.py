@@ -0,0 +1,202 @@
+"""
+Batch extraction of landmark sequences from recorded videos
+
+Runs MediaPipeFeatureExtractor.extract_sequence over a video corpus on a
+process pool (one Holistic instance per worker) and writes every clip as
+one sequence of the consolidated SequenceStore (see
+data_pipeline/sequence_store.py), the same layout collect_data.py writes.
+
+Input is either a directory laid out as <input-dir>/<action>/<clip>.mp4,
+or a CSV manifest with 'path' and 'action' columns (relative paths are
+resolved against the manifest's directory).
+
+Each finished clip is written and indexed immediately, and the clip path
+is recorded per slot, so an interrupted run resumes where it stopped:
+clips already in the store are skipped.
+
+Usage:
+    python extract_videos.py --input-dir videos --data-path Sign_Language_Data
+    python extract_videos.py --manifest corpus.csv --workers 8
+"""
+
+import argparse
+import csv
+import os
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Add project to path
+PROJECT_ROOT = Path(__file__).parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from data_pipeline.sequence_store import SequenceStore
+from data_pipeline.temporal_sampling import SAMPLING_MODES
+from modules.frame_source import VIDEO_EXTENSIONS
+
+
+_extractor = None  # Per-worker MediaPipeFeatureExtractor
+
+
+def discover_videos(input_dir: str) -> Dict[str, List[str]]:
+    """<input_dir>/<action>/<clip> files grouped by action, sorted by path."""
+    videos = defaultdict(list)
+    for action_dir in sorted(p for p in Path(input_dir).iterdir() if p.is_dir()):
+        for path in sorted(action_dir.rglob('*')):
+            if path.suffix.lower() in VIDEO_EXTENSIONS:
+                videos[action_dir.name].append(str(path))
+    return dict(videos)
+
+
+def read_manifest(manifest: str) -> Dict[str, List[str]]:
+    """Clips listed in a CSV manifest ('path', 'action' columns), grouped by action."""
+    base = Path(manifest).parent
+    videos = defaultdict(list)
+    with open(manifest, 'r', encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            path = Path(row['path'])
+            videos[row['action']].append(str(path if path.is_absolute() else base / path))
+    return {action: sorted(paths) for action, paths in videos.items()}
+
+
+def _init_worker():
+    """Create this worker's Holistic instance once."""
+    global _extractor
+    from data_pipeline.feature_extractor import MediaPipeFeatureExtractor
+    _extractor = MediaPipeFeatureExtractor()
+
+
+def _extract(task: Tuple[str, int, str, int, str]):
+    action, slot, path, num_frames, sampling = task
+    start = time.perf_counter()
+    sequence = _extractor.extract_sequence(path, num_frames, sampling)
+    return action, slot, path, sequence, _extractor.last_frames_decoded, time.perf_counter() - start
+
+
+def plan_tasks(store: SequenceStore, videos: Dict[str, List[str]],
+               sampling: str = 'uniform') -> List[Tuple[str, int, str, int, str]]:
+    """
+    Allocate each action's array and list the clips not yet in the store.
+
+    Raises:
+        ValueError: If an action already in the store was not extracted from
+            exactly these clips (recorded elsewhere, or clips added/removed)
+    """
+    tasks = []
+    for action, paths in videos.items():
+        if action not in store.index['actions']:
+            store.create_action(action, len(paths))
+            store.index['actions'][action]['sources'] = paths
+        if store.index['actions'][action].get('sources') != paths:
+            raise ValueError(
+                f"Clips for '{action}' changed since it was extracted into {store.root}; "
+                f"extract into a new --data-path"
+            )
+        recorded = set(store.recorded_sequences(action))
+        tasks.extend((action, slot, path, store.sequence_length, sampling)
+                     for slot, path in enumerate(paths) if slot not in recorded)
+    store.save_index()
+    return tasks
+
+
+def extract_videos(videos: Dict[str, List[str]], data_path: str,
+                   sequence_length: int = 30, workers: int = None,
+                   sampling: str = 'uniform') -> dict:
+    """
+    Extract every clip into a SequenceStore, skipping clips already stored.
+
+    Args:
+        videos (Dict[str, List[str]]): Clip paths per action
+        data_path (str): SequenceStore root
+        sequence_length (int): Frames per sequence
+        workers (int): Worker processes (default: CPU count)
+        sampling (str): Frame sampling mode of extract_sequence
+
+    Returns:
+        dict: Extraction statistics
+
+    Raises:
+        RuntimeError: If data_path holds unmigrated per-frame data
+    """
+    workers = workers or os.cpu_count() or 1
+    store = SequenceStore(data_path, sequence_length)
+    store.require_migrated()
+    tasks = plan_tasks(store, videos, sampling)
+    total = sum(len(paths) for paths in videos.values())
+    print(f"{total} clips in {len(videos)} actions; {total - len(tasks)} already extracted, "
+          f"{len(tasks)} to go on {workers} workers")
+
+    stats = {'videos': 0, 'frames': 0, 'failed': [], 'skipped': total - len(tasks),
+             'worker_seconds': 0.0}
+    start = time.perf_counter()
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            futures = [pool.submit(_extract, task) for task in tasks]
+            for done, future in enumerate(as_completed(futures), 1):
+                action, slot, path, sequence, frames, seconds = future.result()
+                if frames == 0:
+                    stats['failed'].append(path)
+                    print(f"  [{done}/{len(tasks)}] {path}: no frames decoded, skipped")
+                    continue
+                store.write_sequence(action, slot, sequence)
+                stats['videos'] += 1
+                stats['frames'] += frames
+                stats['worker_seconds'] += seconds
+                print(f"  [{done}/{len(tasks)}] {action}/{slot}: {Path(path).name} "
+                      f"({frames} frames, {frames / seconds:.1f} frames/s)")
+    finally:
+        store.close()
+    stats['seconds'] = time.perf_counter() - start
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract landmark sequences from a video corpus")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--input-dir", help="Directory of <action>/<clip> videos")
+    source.add_argument("--manifest", help="CSV with 'path' and 'action' columns")
+    parser.add_argument("--data-path", default="Sign_Language_Data")
+    parser.add_argument("--sequence-length", type=int, default=30)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes, one Holistic each (default: CPU count)")
+    parser.add_argument("--sampling", choices=SAMPLING_MODES, default="uniform",
+                        help="Which frames of each clip form the sequence")
+    args = parser.parse_args()
+
+    from data_pipeline.feature_extractor import mp
+    if mp is None:
+        print("❌ MediaPipe is required for extraction (pip install mediapipe)")
+        sys.exit(1)
+
+    videos = discover_videos(args.input_dir) if args.input_dir else read_manifest(args.manifest)
+    if not videos:
+        print(f"❌ No videos found in {args.input_dir or args.manifest}")
+        sys.exit(1)
+
+    print("=" * 60)
+    print(f"Extracting landmarks into {args.data_path}")
+    print("=" * 60)
+
+    try:
+        stats = extract_videos(videos, args.data_path, args.sequence_length, args.workers,
+                               args.sampling)
+    except RuntimeError as error:
+        print(f"❌ {error}")
+        sys.exit(1)
+
+    seconds = max(stats['seconds'], 1e-9)
+    print("=" * 60)
+    print(f"[OK] {stats['videos']} videos, {stats['frames']} frames in {seconds:.2f}s "
+          f"({stats['skipped']} resumed, {len(stats['failed'])} failed)")
+    print(f"[OK] Throughput: {stats['videos'] / seconds:.2f} videos/s, "
+          f"{stats['frames'] / seconds:.1f} frames/s")
+    if stats['worker_seconds']:
+        print(f"[OK] Per worker: {stats['frames'] / stats['worker_seconds']:.1f} frames/s "
+              f"(parallel efficiency {stats['worker_seconds'] / seconds:.1f} busy workers)")
+
+
+if __name__ == "__main__":
+    main()
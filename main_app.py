@@ -12,9 +12,10 @@ Features:
 
 import os
 import sys
+import time
 import numpy as np
 import cv2
-from typing import Tuple, Optional, Dict
+from typing import Callable, Tuple, Optional, Dict
 from pathlib import Path
 import json
 from datetime import datetime
@@ -24,10 +25,14 @@ PROJECT_ROOT = Path(__file__).parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 # Import OmniSign modules
-from models.dual_stream_model import DualStreamSignRecognizer
 from data_pipeline.feature_extractor import MediaPipeFeatureExtractor
+from data_pipeline.keypoint_schema import HOLISTIC_LAYOUT
+from data_pipeline.normalization import StreamingStandardizer, normalizer_path
 from modules.translator import BidirectionalCommunicationEngine, Language
 from modules.personalization import PersonalizationEngine, SignerProfile
+from modules.graph_cache import GraphCache, cache_key
+from modules.inference_runtime import is_exported_model, load_inference_model
+from modules.quality_tiers import DEFAULT_TIER
 
 
 class OmniSignApp:
@@ -36,13 +41,33 @@ class OmniSignApp:
     """
     
     def __init__(self, model_path: Optional[str] = None,
-                 actions: list = None):
+                 actions: list = None, frame_source: Optional[str] = None,
+                 warm_up: bool = True, graph_cache: bool = True, roi_tracking: bool = False,
+                 quality_tier: str = DEFAULT_TIER, adaptive_quality: bool = False,
+                 progress: Optional[Callable[[int, int, str], None]] = None):
         """
         Initialize OmniSign application.
         
         Args:
-            model_path (str): Path to pre-trained model
+            model_path (str): Path to pre-trained model weights, or an exported
+                .tflite / serving SavedModel artifact (see quantize_model.py),
+                which loads without building the Keras model
             actions (list): List of recognizable signs
+            frame_source (str, optional): Camera index, video file or stored
+                landmarks to recognize from (default: env OMNISIGN_SOURCE, camera 0)
+            warm_up (bool): Run dummy windows through the model at startup, so
+                the first sign does not pay graph tracing (see warm_up())
+            graph_cache (bool): Reuse the traced forward pass of a weights file
+                across restarts, skipping the Keras model on later starts
+                (modules/graph_cache.py, env OMNISIGN_GRAPH_CACHE)
+            roi_tracking (bool): Detect landmarks on a crop around the signer
+                (modules/roi_tracker.py; off until benchmarked on recorded clips)
+            quality_tier (str): Detector tier, 'full', 'lite' or 'face_off'
+                (default: env OMNISIGN_QUALITY_TIER, else 'full')
+            adaptive_quality (bool): Step the tier down/up from measured detection
+                latency; the lowest tier zeroes the face segment the model uses
+            progress (callable, optional): progress(step, total, message) for
+                each warm-up step
         """
         
         if actions is None:
@@ -51,31 +76,72 @@ class OmniSignApp:
             self.actions = actions
         
         self.num_classes = len(self.actions)
+        self.sequence_length = 30
+        self.frame_source = frame_source
         
         # Initialize components
         print("Initializing OmniSign components...")
         
-        # 1. Model
-        self.model = DualStreamSignRecognizer(
-            num_classes=self.num_classes,
-            manual_features=168,
-            non_manual_features=332,
-            sequence_length=30
-        )
-        self.model.build_model()
-        
-        if model_path and os.path.exists(model_path):
-            print(f"Loading model from {model_path}")
-            self.model.model.load_weights(model_path)
+        # 1. Model (exported artifacts have the same predict() interface);
+        # predictions run on self.predictor, the traced forward pass of a Keras model
+        self.graph_cache_status = 'off'
+        cache = key = None
+        if graph_cache and model_path and os.path.exists(model_path) and not is_exported_model(model_path):
+            cache = GraphCache()
+            key = cache_key(model_path, [(1, self.sequence_length, HOLISTIC_LAYOUT.manual_size),
+                                         (1, self.sequence_length, HOLISTIC_LAYOUT.non_manual_size)],
+                            'DualStreamSignRecognizer', self.num_classes)
+        cached = cache.load(key) if cache is not None else None
+        
+        if is_exported_model(model_path):
+            print(f"Loading exported model from {model_path}")
+            self.model = load_inference_model(model_path)
+            base_model = self.model
+            self.predictor = self.model
+        elif cached is not None:
+            # Same weights file as a previous start: skip building and retracing
+            print(f"Loading traced model for {model_path} from the graph cache")
+            self.model = self.predictor = base_model = cached
+            self.graph_cache_status = 'hit'
+        else:
+            from models.dual_stream_model import DualStreamSignRecognizer  # Imports TensorFlow
+            self.model = DualStreamSignRecognizer(
+                num_classes=self.num_classes,
+                manual_features=HOLISTIC_LAYOUT.manual_size,
+                non_manual_features=HOLISTIC_LAYOUT.non_manual_size,
+                sequence_length=self.sequence_length
+            )
+            self.model.build_model()
+            base_model = self.model.model
+            
+            if model_path and os.path.exists(model_path):
+                print(f"Loading model from {model_path}")
+                self.model.model.load_weights(model_path)
+            
+            self.predictor = self.model
+            if cache is not None:
+                self.predictor = cache.store(key, base_model)
+                self.graph_cache_status = 'miss'
+                print("Traced forward pass saved to the graph cache")
+        
+        # Training normalization statistics saved next to the model
+        self.normalizer = None
+        if model_path and normalizer_path(model_path).exists():
+            self.normalizer = StreamingStandardizer.load(normalizer_path(model_path))
+        elif model_path:
+            print(f"[WARN] No normalization statistics at {normalizer_path(model_path)}; "
+                  f"falling back to per-sequence min-max scaling")
         
         # 2. Feature Extractor
-        self.feature_extractor = MediaPipeFeatureExtractor()
+        self.feature_extractor = MediaPipeFeatureExtractor(quality_tier=quality_tier,
+                                                           adaptive_quality=adaptive_quality,
+                                                           roi_tracking=roi_tracking)
         
         # 3. Translator
         self.translator = BidirectionalCommunicationEngine()
         
         # 4. Personalization
-        self.personalization = PersonalizationEngine(self.model.model)
+        self.personalization = PersonalizationEngine(base_model)
         self.current_user = None
         
         # Session data
@@ -83,8 +149,43 @@ class OmniSignApp:
         self.recognition_history = []
         self.confidence_threshold = 0.85
         
+        # 5. Warm-up: pay tracing / interpreter setup before the user signs
+        self.warmup_stats = self.warm_up(progress=progress) if warm_up else None
+        
         print("[OK] OmniSign initialized successfully")
     
+    def warm_up(self, steps: int = 3,
+                progress: Optional[Callable[[int, int, str], None]] = None) -> Dict:
+        """
+        Run dummy dual-stream windows at the deployed shape (batch 1,
+        sequence_length frames) through the model.
+        
+        Args:
+            steps (int): Dummy predictions
+            progress (callable, optional): progress(step, total, message) after each step
+            
+        Returns:
+            Dict: Milliseconds of the first and last step, and the graph cache status
+        """
+        window = HOLISTIC_LAYOUT.allocate(self.sequence_length)[np.newaxis]
+        manual_input, non_manual_input = HOLISTIC_LAYOUT.split_streams(window)
+        
+        timings = []
+        for step in range(steps):
+            start = time.perf_counter()
+            self.predictor.predict(manual_input, non_manual_input)
+            timings.append(1000 * (time.perf_counter() - start))
+            message = f"Warming up model {step + 1}/{steps}: {timings[-1]:.0f} ms"
+            print(message)
+            if progress is not None:
+                progress(step + 1, steps, message)
+        
+        return {
+            'first_ms': timings[0] if timings else None,
+            'last_ms': timings[-1] if timings else None,
+            'graph_cache': self.graph_cache_status,
+        }
+    
     def create_session(self, user_id: str, user_name: str,
                       language: str = "en") -> SignerProfile:
         """
@@ -119,6 +220,20 @@ class OmniSignApp:
         
         return profile
     
+    def normalize_sequence(self, sequence: np.ndarray) -> np.ndarray:
+        """
+        Apply the model's training normalization (in place, float32).
+        
+        Args:
+            sequence (np.ndarray): (sequence_length, layout.size) keypoints
+            
+        Returns:
+            np.ndarray: Normalized sequence
+        """
+        if self.normalizer is not None:
+            return self.normalizer.transform(sequence)
+        return self.feature_extractor.normalize_landmarks(sequence)
+    
     def recognize_sign_from_webcam(self, duration_seconds: int = 5,
                                   num_frames: int = 30) -> Dict:
         """
@@ -134,6 +249,7 @@ class OmniSignApp:
                 - 'confidence': Confidence score
                 - 'translation': Text translation
                 - 'status': Success/failure status
+                - 'pipeline_stats': Per-stage latency / queue depth of the capture
         """
         
         print("\nCapturing gesture (press 'q' to stop)...")
@@ -141,21 +257,21 @@ class OmniSignApp:
         # Extract feature sequence
         sequence = self.feature_extractor.extract_from_webcam(
             duration_seconds=duration_seconds,
-            num_frames=num_frames
+            num_frames=num_frames,
+            source=self.frame_source
         )
         
         # Normalize
-        sequence = self.feature_extractor.normalize_landmarks(sequence)
+        sequence = self.normalize_sequence(sequence)
         
-        # Split into manual and non-manual streams
-        manual_stream = sequence[:, :168]      # Hand features
-        non_manual_stream = sequence[:, 168:]  # Facial + body features
+        # Split into manual (hand) and non-manual (facial + body) stream views
+        manual_stream, non_manual_stream = HOLISTIC_LAYOUT.split_streams(sequence)
         
         # Make prediction
         manual_input = np.expand_dims(manual_stream, 0)  # Add batch dimension
         non_manual_input = np.expand_dims(non_manual_stream, 0)
         
-        predictions = self.model.predict(manual_input, non_manual_input)
+        predictions = self.predictor.predict(manual_input, non_manual_input)
         predicted_class = np.argmax(predictions[0])
         confidence = float(np.max(predictions[0]))
         
@@ -185,7 +301,8 @@ class OmniSignApp:
             'translation': translation,
             'status': status,
             'language': self.current_user.language if self.current_user else 'en',
-            'timestamp': datetime.now().isoformat()
+            'timestamp': datetime.now().isoformat(),
+            'pipeline_stats': self.feature_extractor.last_pipeline_stats
         }
         
         self.recognition_history.append(result)
@@ -243,15 +360,14 @@ class OmniSignApp:
             
             # Capture
             sequence = self.feature_extractor.extract_from_webcam(
-                duration_seconds=3, num_frames=30
+                duration_seconds=3, num_frames=30, source=self.frame_source
             )
-            sequence = self.feature_extractor.normalize_landmarks(sequence)
+            sequence = self.normalize_sequence(sequence)
             
             # Verify by showing prediction
-            manual_stream = sequence[:, :168]
-            non_manual_stream = sequence[:, 168:]
+            manual_stream, non_manual_stream = HOLISTIC_LAYOUT.split_streams(sequence)
             
-            predictions = self.model.predict(
+            predictions = self.predictor.predict(
                 np.expand_dims(manual_stream, 0),
                 np.expand_dims(non_manual_stream, 0)
             )
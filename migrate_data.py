@@ -0,0 +1,139 @@
+"""
+One-shot migration from per-frame .npy files to the consolidated SequenceStore
+
+Reads Sign_Language_Data/<action>/<sequence>/<frame>.npy trees written by
+older versions of collect_data.py and writes one array per action plus
+sequences_index.json (see data_pipeline/sequence_store.py).
+
+Usage:
+    python migrate_data.py --data-path Sign_Language_Data
+    python migrate_data.py --convert-legacy --remove-frames
+"""
+
+import argparse
+import shutil
+import sys
+import time
+from pathlib import Path
+
+# Add project to path
+PROJECT_ROOT = Path(__file__).parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from data_pipeline.data_loader import DataLoader
+from data_pipeline.sequence_store import SequenceStore
+
+
+def discover_actions(data_path: Path) -> list:
+    """Action directories under data_path, sorted by name."""
+    return sorted(p.name for p in data_path.iterdir() if p.is_dir())
+
+
+def count_files(path: Path) -> int:
+    """Number of files (inodes) below path."""
+    return sum(1 for p in path.rglob('*') if p.is_file())
+
+
+def migrate_frame_tree(data_path: str, actions: list = None,
+                       no_sequences: int = 30, sequence_length: int = 30,
+                       convert_legacy: bool = False,
+                       remove_frames: bool = False) -> dict:
+    """
+    Convert a per-frame tree into a SequenceStore in the same directory.
+
+    Args:
+        data_path (str): Root of the per-frame tree
+        actions (list): Actions to migrate (default: every action directory)
+        no_sequences (int): Sequence slots per action
+        sequence_length (int): Frames per sequence
+        convert_legacy (bool): Convert frames saved in a legacy keypoint layout
+        remove_frames (bool): Delete each action's frame directories once written
+
+    Returns:
+        dict: Migration statistics
+
+    Raises:
+        ValueError: If a frame does not match the layout (nothing is written)
+    """
+
+    data_path = Path(data_path)
+    if SequenceStore.exists(data_path):
+        raise RuntimeError(f"{data_path} already holds a consolidated store")
+
+    if actions is None:
+        actions = discover_actions(data_path)
+
+    files_before = count_files(data_path)
+    start = time.perf_counter()
+
+    # Reading goes through the loader so frames are validated against the layout
+    loader = DataLoader(str(data_path), actions, no_sequences, sequence_length,
+                        convert_legacy=convert_legacy)
+    store = SequenceStore(data_path, sequence_length, loader.layout)
+    # The index is written aside and renamed into place once every action
+    # is migrated: a failure part-way must not leave a store that hides the
+    # actions it never reached
+    index_path = store.index_path
+    store.index_path = index_path.with_name(f".{index_path.name}.partial")
+
+    migrated = {}
+    try:
+        for action in actions:
+            sequences, recorded = loader.load_action_frames(action)
+            if not recorded:
+                continue
+            store.write_action(action, sequences, recorded)
+            migrated[action] = len(recorded)
+            print(f"  {action}: {len(recorded)} sequences")
+        store.close()
+    except BaseException:
+        store.close()
+        for action in store.actions:
+            store.action_file(action).unlink(missing_ok=True)
+        store.index_path.unlink(missing_ok=True)
+        raise
+    store.index_path.replace(index_path)
+    store.index_path = index_path
+
+    if remove_frames:
+        for action in migrated:
+            shutil.rmtree(data_path / action)
+
+    return {
+        'actions': len(migrated),
+        'sequences': sum(migrated.values()),
+        'files_before': files_before,
+        'files_after': count_files(data_path),
+        'seconds': time.perf_counter() - start
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Migrate per-frame .npy data to consolidated storage")
+    parser.add_argument("--data-path", default="Sign_Language_Data")
+    parser.add_argument("--actions", nargs="*", help="Actions to migrate (default: all directories)")
+    parser.add_argument("--no-sequences", type=int, default=30)
+    parser.add_argument("--sequence-length", type=int, default=30)
+    parser.add_argument("--convert-legacy", action="store_true",
+                        help="Convert frames saved in a legacy keypoint layout (258/1662 dims)")
+    parser.add_argument("--remove-frames", action="store_true",
+                        help="Delete per-frame directories after migrating")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"Migrating {args.data_path} to consolidated storage")
+    print("=" * 60)
+
+    stats = migrate_frame_tree(
+        args.data_path, args.actions, args.no_sequences, args.sequence_length,
+        convert_legacy=args.convert_legacy, remove_frames=args.remove_frames
+    )
+
+    print("=" * 60)
+    print(f"[OK] {stats['sequences']} sequences from {stats['actions']} actions "
+          f"in {stats['seconds']:.2f}s")
+    print(f"[OK] Files: {stats['files_before']} -> {stats['files_after']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,328 @@
+"""
+Causal / Stateful Variant of the Dual-Stream Architecture
+
+The bidirectional model has to see the whole 30-frame window, so a live
+sliding window recomputes every timestep for every new frame. This
+variant is causal end to end, so it can be advanced one frame at a time:
+
+- Manual Stream: unidirectional LSTMs whose (h, c) state is carried
+  forward between frames
+- Non-Manual Stream: causal, dilated Conv1D stack (no pooling) whose
+  receptive field is served from a small rolling input cache per layer,
+  followed by a running window mean in place of global average pooling
+- Fusion Layer: unchanged
+
+CausalDualStreamSignRecognizer trains like DualStreamSignRecognizer on
+(manual, non_manual) windows. IncrementalDualStreamStepper evaluates the
+trained weights frame by frame in NumPy at O(1) cost per frame; started
+from reset() and fed a window, it reproduces the Keras model's output on
+that window exactly.
+"""
+
+import time
+
+import numpy as np
+from tensorflow.keras import Model
+from tensorflow.keras.layers import (
+    Input, LSTM, Conv1D, Dense, GlobalAveragePooling1D, Dropout, Concatenate
+)
+from typing import List, Optional
+
+from data_pipeline.keypoint_schema import HOLISTIC_LAYOUT, KeypointLayout
+from data_pipeline.normalization import StreamingStandardizer
+from models.dual_stream_model import DualStreamSignRecognizer
+
+
+MANUAL_LSTM_LAYERS = ('manual_lstm_1', 'manual_lstm_2')
+NON_MANUAL_CONV_LAYERS = ('non_manual_conv_1', 'non_manual_conv_2', 'non_manual_conv_3')
+DENSE_LAYERS = ('non_manual_dense', 'fusion_dense_1', 'fusion_dense_2', 'output')
+
+
+def is_causal_model(model) -> bool:
+    """Whether a Keras model was built by CausalDualStreamSignRecognizer."""
+    names = {layer.name for layer in model.layers}
+    return names.issuperset(MANUAL_LSTM_LAYERS + NON_MANUAL_CONV_LAYERS + DENSE_LAYERS)
+
+
+class CausalDualStreamSignRecognizer(DualStreamSignRecognizer):
+    """
+    Dual-stream recognizer restricted to causal layers.
+
+    Same inputs, outputs and training interface as DualStreamSignRecognizer.
+    """
+
+    def build_model(self):
+        """
+        Build the causal dual-stream architecture.
+
+        Returns:
+            Model: Keras model for inference
+            Model: Keras model for training (same graph)
+        """
+
+        # ==================== MANUAL STREAM ====================
+        manual_input = Input(shape=(self.sequence_length, self.manual_features),
+                            name='manual_input')
+
+        # Unidirectional LSTMs: state can be carried from frame to frame
+        manual_lstm = LSTM(256, return_sequences=True, name='manual_lstm_1')(manual_input)
+        manual_output = LSTM(128, return_sequences=False, name='manual_lstm_2')(manual_lstm)
+        # Output shape: (batch_size, 128)
+
+
+        # ==================== NON-MANUAL STREAM ====================
+        non_manual_input = Input(shape=(self.sequence_length, self.non_manual_features),
+                                name='non_manual_input')
+
+        # Causal convolutions; dilation replaces pooling to grow the receptive
+        # field (15 frames) without changing the frame rate
+        non_manual_conv = Conv1D(filters=64, kernel_size=3, activation='relu',
+                                 padding='causal', dilation_rate=1,
+                                 name='non_manual_conv_1')(non_manual_input)
+        non_manual_conv = Conv1D(filters=128, kernel_size=3, activation='relu',
+                                 padding='causal', dilation_rate=2,
+                                 name='non_manual_conv_2')(non_manual_conv)
+        non_manual_conv = Conv1D(filters=128, kernel_size=3, activation='relu',
+                                 padding='causal', dilation_rate=4,
+                                 name='non_manual_conv_3')(non_manual_conv)
+
+        non_manual_output = GlobalAveragePooling1D()(non_manual_conv)
+        non_manual_output = Dense(128, activation='relu', name='non_manual_dense')(non_manual_output)
+        # Output shape: (batch_size, 128)
+
+
+        # ==================== FUSION LAYER ====================
+        fusion = Concatenate()([manual_output, non_manual_output])
+        fusion = Dense(256, activation='relu', name='fusion_dense_1')(fusion)
+        fusion = Dropout(0.3)(fusion)
+        fusion = Dense(128, activation='relu', name='fusion_dense_2')(fusion)
+        fusion = Dropout(0.2)(fusion)
+        probabilities = Dense(self.num_classes, activation='softmax', name='output')(fusion)
+
+        self.model = Model(inputs=[manual_input, non_manual_input],
+                           outputs=probabilities,
+                           name='CausalDualStreamSignRecognizer')
+        self.training_model = self.model
+
+        return self.model, self.training_model
+
+
+def _sigmoid(x: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-x))
+
+
+def _softmax(x: np.ndarray) -> np.ndarray:
+    e = np.exp(x - x.max())
+    return e / e.sum()
+
+
+_ACTIVATIONS = {
+    'linear': lambda x: x,
+    'relu': lambda x: np.maximum(x, 0),
+    'tanh': np.tanh,
+    'sigmoid': _sigmoid,
+    'softmax': _softmax,
+}
+
+
+def _activation(layer) -> callable:
+    name = layer.get_config()['activation']
+    if name not in _ACTIVATIONS:
+        raise ValueError(f"Unsupported activation '{name}' in layer {layer.name}")
+    return _ACTIVATIONS[name]
+
+
+class IncrementalDualStreamStepper:
+    """
+    Frame-at-a-time inference for a CausalDualStreamSignRecognizer model.
+
+    Per frame: two LSTM cell updates, three convolutions over a cached
+    (kernel_size - 1) * dilation + 1 frame span, an O(1) running-sum update
+    of the window mean, and the dense head. Cost does not depend on the
+    window length.
+    """
+
+    def __init__(self, model, layout: KeypointLayout = HOLISTIC_LAYOUT,
+                 sequence_length: Optional[int] = None,
+                 normalizer: Optional[StreamingStandardizer] = None,
+                 stride: int = 1):
+        """
+        Initialize stepper from a trained causal model.
+
+        Args:
+            model: Keras model built by CausalDualStreamSignRecognizer
+            layout (KeypointLayout): Layout of pushed frames
+            sequence_length (int, optional): Window averaged by the non-manual
+                stream (default: the model's input length)
+            normalizer (StreamingStandardizer, optional): Training normalization
+            stride (int): push() evaluates the classifier head every N frames
+                (state is still advanced on every frame)
+
+        Raises:
+            ValueError: If the model is not a causal dual-stream model
+        """
+        if not is_causal_model(model):
+            raise ValueError(f"{model.name} is not a causal dual-stream model; "
+                             f"build it with CausalDualStreamSignRecognizer")
+
+        self.layout = layout
+        self.normalizer = normalizer
+        self.sequence_length = sequence_length or model.inputs[0].shape[1]
+        self.stride = stride
+        self._frame = layout.allocate()
+
+        self._lstms = []
+        for name in MANUAL_LSTM_LAYERS:
+            layer = model.get_layer(name)
+            kernel, recurrent_kernel, bias = (w.astype(np.float32) for w in layer.get_weights())
+            self._lstms.append((kernel, recurrent_kernel, bias, layer.units))
+
+        self._convs = []
+        for name in NON_MANUAL_CONV_LAYERS:
+            layer = model.get_layer(name)
+            kernel, bias = (w.astype(np.float32) for w in layer.get_weights())
+            dilation = layer.get_config()['dilation_rate']
+            dilation = dilation[0] if isinstance(dilation, (list, tuple)) else dilation
+            self._convs.append((kernel, bias, dilation, _activation(layer)))
+
+        self._dense = {}
+        for name in DENSE_LAYERS:
+            layer = model.get_layer(name)
+            kernel, bias = (w.astype(np.float32) for w in layer.get_weights())
+            self._dense[name] = (kernel, bias, _activation(layer))
+
+        self.reset()
+
+    @property
+    def stride(self) -> int:
+        return self._stride
+
+    @stride.setter
+    def stride(self, value: int):
+        if value < 1:
+            raise ValueError(f"stride must be >= 1, got {value}")
+        self._stride = int(value)
+
+    @property
+    def is_full(self) -> bool:
+        """Whether a full window has been seen since reset()."""
+        return self.frames_seen >= self.sequence_length
+
+    def reset(self):
+        """Clear carried state (equivalent to the start of a training window)."""
+        self._states = [(np.zeros(units, np.float32), np.zeros(units, np.float32))
+                        for _, _, _, units in self._lstms]
+        # Rolling input cache per conv layer: last (k - 1) * d + 1 inputs, zeros = causal padding
+        self._caches = [np.zeros(((kernel.shape[0] - 1) * dilation + 1, kernel.shape[1]), np.float32)
+                        for kernel, _, dilation, _ in self._convs]
+        # Ring of the last sequence_length conv outputs and their running sum
+        last_filters = self._convs[-1][0].shape[2]
+        self._pool_ring = np.zeros((self.sequence_length, last_filters), np.float32)
+        self._pool_sum = np.zeros(last_filters, np.float64)
+        self.frames_seen = 0
+        self._frames_since_inference = 0
+        self.last_probabilities = None
+
+    def _lstm_step(self, index: int, x: np.ndarray) -> np.ndarray:
+        kernel, recurrent_kernel, bias, units = self._lstms[index]
+        h, c = self._states[index]
+        z = x @ kernel + h @ recurrent_kernel + bias
+        i = _sigmoid(z[:units])
+        f = _sigmoid(z[units:2 * units])
+        g = np.tanh(z[2 * units:3 * units])
+        o = _sigmoid(z[3 * units:])
+        c = f * c + i * g
+        h = o * np.tanh(c)
+        self._states[index] = (h, c)
+        return h
+
+    def _conv_step(self, index: int, x: np.ndarray) -> np.ndarray:
+        kernel, bias, dilation, activation = self._convs[index]
+        cache = self._caches[index]
+        cache[:-1] = cache[1:]
+        cache[-1] = x
+        taps = cache[::dilation]  # kernel_size inputs, oldest first
+        return activation(np.einsum('kc,kco->o', taps, kernel) + bias)
+
+    def _dense_step(self, name: str, x: np.ndarray) -> np.ndarray:
+        kernel, bias, activation = self._dense[name]
+        return activation(x @ kernel + bias)
+
+    def _advance(self, manual: np.ndarray, non_manual: np.ndarray) -> np.ndarray:
+        """Update both streams' state with one frame; returns the fused features."""
+
+        # Manual stream: carry LSTM state
+        h = self._lstm_step(0, manual)
+        manual_output = self._lstm_step(1, h)
+
+        # Non-manual stream: cached causal convolutions + running window mean
+        y = non_manual
+        for index in range(len(self._convs)):
+            y = self._conv_step(index, y)
+        slot = self.frames_seen % self.sequence_length
+        self._pool_sum += y.astype(np.float64) - self._pool_ring[slot]
+        self._pool_ring[slot] = y
+        pooled = (self._pool_sum / self.sequence_length).astype(np.float32)
+        non_manual_output = self._dense_step('non_manual_dense', pooled)
+
+        self.frames_seen += 1
+        return np.concatenate([manual_output, non_manual_output])
+
+    def _head(self, fusion: np.ndarray) -> np.ndarray:
+        fusion = self._dense_step('fusion_dense_1', fusion)
+        fusion = self._dense_step('fusion_dense_2', fusion)
+        self.last_probabilities = self._dense_step('output', fusion)
+        return self.last_probabilities
+
+    def step(self, manual: np.ndarray, non_manual: np.ndarray) -> np.ndarray:
+        """
+        Advance by one frame and classify.
+
+        Args:
+            manual (np.ndarray): (manual_size,) hand features
+            non_manual (np.ndarray): (non_manual_size,) face + pose features
+
+        Returns:
+            np.ndarray: Class probabilities for the stream up to this frame
+        """
+        return self._head(self._advance(manual, non_manual))
+
+    def warm_up(self, steps: int = 2) -> List[float]:
+        """
+        Same contract as StreamingRecognizer.warm_up() (NumPy has nothing
+        to trace, this only touches the weights once), then reset().
+
+        Returns:
+            list: Milliseconds per step
+        """
+        manual = np.zeros(self.layout.manual_size, np.float32)
+        non_manual = np.zeros(self.layout.non_manual_size, np.float32)
+        timings = []
+        for _ in range(steps):
+            start = time.perf_counter()
+            self.step(manual, non_manual)
+            timings.append(1000 * (time.perf_counter() - start))
+        self.reset()
+        return timings
+
+    def push(self, keypoints: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Advance by one (layout.size,) keypoint frame; same contract as
+        StreamingRecognizer.push().
+
+        Returns:
+            np.ndarray or None: Class probabilities once a full window has been
+                seen and the head is due this frame
+        """
+        frame = self._frame
+        frame[:] = keypoints
+        if self.normalizer is not None:
+            self.normalizer.transform(frame)
+        fusion = self._advance(frame[self.layout.manual_slice], frame[self.layout.non_manual_slice])
+
+        self._frames_since_inference += 1
+        if not self.is_full or self._frames_since_inference < self._stride:
+            return None
+
+        self._frames_since_inference = 0
+        return self._head(fusion)
@@ -3,9 +3,11 @@ Training Pipeline with CTC Loss for Continuous Sequence Recognition
 
 Implements:
 - CTC Loss for frame-level predictions
-- Batch training with validation
+- Batch training with chunked validation
 - Model checkpointing and early stopping
 - Learning rate scheduling
+- tf.data input pipeline (shuffle, batch, prefetch, optional cache)
+- Graph-compiled (optionally XLA) train/eval steps with on-device metrics
 """
 
 import tensorflow as tf
@@ -13,9 +15,10 @@ from tensorflow import keras
 from tensorflow.keras import layers, callbacks
 import numpy as np
 from pathlib import Path
-from typing import Tuple, Optional, Dict
+from typing import Callable, Iterable, Tuple, Optional, Dict, Union
 import json
 from datetime import datetime
+from itertools import chain
 
 
 class CTCTrainingPipeline:
@@ -24,7 +27,8 @@ class CTCTrainingPipeline:
     """
     
     def __init__(self, model, num_classes: int, 
-                 checkpoint_dir: str = "checkpoints"):
+                 checkpoint_dir: str = "checkpoints",
+                 run_eagerly: bool = False, jit_compile: bool = False):
         """
         Initialize training pipeline.
         
@@ -32,22 +36,81 @@ class CTCTrainingPipeline:
             model: Keras model with output shape (batch, sequence_length, num_classes)
             num_classes (int): Number of sign classes
             checkpoint_dir (str): Directory to save model checkpoints
+            run_eagerly (bool): Run train/eval steps eagerly (for debugging)
+            jit_compile (bool): XLA-compile the graph steps
         """
         self.model = model
         self.num_classes = num_classes
         self.checkpoint_dir = Path(checkpoint_dir)
         self.checkpoint_dir.mkdir(exist_ok=True)
+        self.run_eagerly = run_eagerly
+        self.jit_compile = jit_compile
         
         self.history = {}
         self.best_val_loss = float('inf')
         
-
+        # One loss object for every step (model outputs softmax probabilities)
+        self.loss_fn = keras.losses.SparseCategoricalCrossentropy()
+        
+        # Metrics accumulate on-device and are only read at epoch end
+        self.train_loss = keras.metrics.Mean(name='train_loss')
+        self.val_loss = keras.metrics.Mean(name='val_loss')
+        self.val_accuracy = keras.metrics.SparseCategoricalAccuracy(name='val_accuracy')
+        
+        self._train_step_fn = None  # (optimizer, step) compiled for that optimizer
+        self._eval_step_fn = self._compile(self._eval_step)
+    
+    def _compile(self, fn):
+        """Wrap a step in tf.function unless running eagerly."""
+        if self.run_eagerly:
+            return fn
+        return tf.function(fn, jit_compile=self.jit_compile, reduce_retracing=True)
+    
+    @staticmethod
+    def _as_model_input(X_batch):
+        """Dual-stream batches from tf.data arrive as tuples; the model takes lists."""
+        return list(X_batch) if isinstance(X_batch, tuple) else X_batch
+    
+    def _get_train_step(self, optimizer: keras.optimizers.Optimizer):
+        """Compiled train step bound to optimizer (traced once per optimizer)."""
+        
+        if self._train_step_fn is not None and self._train_step_fn[0] is optimizer:
+            return self._train_step_fn[1]
+        
+        def step(X_batch, y_batch):
+            with tf.GradientTape() as tape:
+                # Forward pass - handles both single and dual-stream (list) inputs
+                predictions = self.model(X_batch, training=True)
+                
+                # Calculate loss using categorical cross-entropy
+                loss = self.loss_fn(y_batch, predictions)
+            
+            # Backward pass
+            gradients = tape.gradient(loss, self.model.trainable_weights)
+            optimizer.apply_gradients(zip(gradients, self.model.trainable_weights))
+            
+            self.train_loss.update_state(loss)
+            return loss
+        
+        compiled = self._compile(step)
+        self._train_step_fn = (optimizer, compiled)
+        return compiled
+    
+    def _eval_step(self, X_batch, y_batch):
+        """Forward pass accumulating validation loss and accuracy on-device."""
+        
+        predictions = self.model(X_batch, training=False)
+        batch_size = tf.cast(tf.shape(predictions)[0], tf.float32)
+        self.val_loss.update_state(self.loss_fn(y_batch, predictions), sample_weight=batch_size)
+        self.val_accuracy.update_state(y_batch, predictions)
     
     def train_step(self, X_batch: np.ndarray, y_batch: np.ndarray, 
                    optimizer: keras.optimizers.Optimizer) -> float:
         """
         Single training step using categorical cross-entropy loss.
         
+        Fetches the loss (a device sync); train_epoch() avoids that per batch.
+        
         Args:
             X_batch: Input batch - either single array or list of two arrays (manual, non-manual)
             y_batch: Label batch (batch_size,)
@@ -57,59 +120,162 @@ class CTCTrainingPipeline:
             float: Loss value
         """
         
-        with tf.GradientTape() as tape:
-            # Forward pass - handle both single and dual-stream inputs
-            if isinstance(X_batch, list):
-                # Dual-stream input
-                predictions = self.model(X_batch, training=True)
-            else:
-                # Single stream input
-                predictions = self.model(X_batch, training=True)
+        step = self._get_train_step(optimizer)
+        return float(step(self._as_model_input(X_batch), y_batch))
+    
+    def evaluate(self, batches: Iterable[Tuple]) -> Tuple[float, float]:
+        """
+        Stream batches through the compiled eval step.
+        
+        Loss (weighted by batch size) and accuracy accumulate on-device, so
+        memory stays flat regardless of how many batches are evaluated.
+        
+        Args:
+            batches: Iterable of (X_batch, y_batch)
             
-            # Calculate loss using categorical cross-entropy
-            loss = keras.losses.SparseCategoricalCrossentropy()(y_batch, predictions)
+        Returns:
+            Tuple[loss, accuracy]
+        """
         
-        # Backward pass
-        gradients = tape.gradient(loss, self.model.trainable_weights)
-        optimizer.apply_gradients(zip(gradients, self.model.trainable_weights))
+        self.val_loss.reset_state()
+        self.val_accuracy.reset_state()
+        for X_batch, y_batch in batches:
+            self._eval_step_fn(self._as_model_input(X_batch), y_batch)
         
-        return loss.numpy()
+        return float(self.val_loss.result()), float(self.val_accuracy.result())
     
-    def validation_step(self, X_val: np.ndarray, y_val: np.ndarray) -> Tuple[float, float]:
+    def validation_step(self, X_val: np.ndarray, y_val: np.ndarray,
+                        batch_size: int = 64) -> Tuple[float, float]:
         """
-        Validation step.
+        Validation step, evaluated in fixed-size chunks.
         
         Args:
-            X_val: Validation input
+            X_val: Validation input - single array or list of two arrays
             y_val: Validation labels
+            batch_size (int): Samples per forward pass
             
         Returns:
             Tuple[loss, accuracy]
         """
         
-        # Forward pass
-        predictions = self.model(X_val, training=False)
+        return self.evaluate(self.iter_batches(X_val, y_val, batch_size))
+    
+    @staticmethod
+    def iter_batches(X, y: np.ndarray, batch_size: int):
+        """
+        Slice (X, y) into consecutive batches.
+        
+        Args:
+            X: Single array or list of arrays (dual-stream) sharing the first axis
+            y: Labels
+            batch_size (int): Batch size
+            
+        Yields:
+            Tuple: (X_batch, y_batch)
+        """
+        for i in range(0, len(y), batch_size):
+            # Handle both list inputs (dual-stream) and array inputs
+            if isinstance(X, list):
+                X_batch = [stream[i:i+batch_size] for stream in X]
+            else:
+                X_batch = X[i:i+batch_size]
+            yield X_batch, y[i:i+batch_size]
+    
+    def make_dataset(self, X, y: np.ndarray, batch_size: int = 32,
+                     shuffle: bool = True, cache: Union[bool, str] = False,
+                     seed: Optional[int] = None) -> tf.data.Dataset:
+        """
+        Build a tf.data pipeline over in-memory training data.
+        
+        Args:
+            X: Single array or list of arrays (dual-stream) sharing the first axis
+            y: Labels
+            batch_size (int): Batch size
+            shuffle (bool): Reshuffle the full dataset every epoch
+            cache (bool or str): Cache elements in memory (True) or in this file
+            seed (int, optional): Shuffle seed
+            
+        Returns:
+            tf.data.Dataset: Prefetched (X_batch, y_batch) batches; dual-stream
+                batches are (manual, non_manual) tuples
+        """
+        
+        features = tuple(X) if isinstance(X, list) else X
+        dataset = tf.data.Dataset.from_tensor_slices((features, y))
+        if cache:
+            dataset = dataset.cache(cache if isinstance(cache, str) else "")
+        if shuffle:
+            dataset = dataset.shuffle(len(y), seed=seed, reshuffle_each_iteration=True)
+        return dataset.batch(batch_size).prefetch(tf.data.AUTOTUNE)
+    
+    def batches_dataset(self, batches: Iterable[Tuple]) -> tf.data.Dataset:
+        """
+        Wrap a host batch iterator (e.g. augmented DataLoader.create_batches)
+        in a prefetching tf.data pipeline so the next batch is prepared while
+        the current step runs. The returned dataset can be iterated once.
+        
+        Args:
+            batches: Iterable of (X_batch, y_batch); X_batch may be a list of streams
+            
+        Returns:
+            tf.data.Dataset: Prefetched batches
+        """
+        
+        def spec(array):
+            array = np.asarray(array)
+            return tf.TensorSpec((None,) + array.shape[1:], tf.as_dtype(array.dtype))
+        
+        batches = iter(batches)
+        first = next(batches)
+        X_first, y_first = first
+        dual_stream = isinstance(X_first, (list, tuple))
+        X_spec = tuple(spec(stream) for stream in X_first) if dual_stream else spec(X_first)
+        
+        def generator():
+            for X_batch, y_batch in chain([first], batches):
+                yield (tuple(X_batch) if dual_stream else X_batch), y_batch
+        
+        return tf.data.Dataset.from_generator(
+            generator, output_signature=(X_spec, spec(y_first))
+        ).prefetch(tf.data.AUTOTUNE)
+    
+    def train_epoch(self, batches: Iterable[Tuple],
+                    optimizer: keras.optimizers.Optimizer,
+                    log_every: int = 0) -> float:
+        """
+        Run one pass of the compiled train step over batches.
+        
+        The loss stays on-device until the epoch ends.
         
-        # Calculate loss using categorical cross-entropy
-        loss = keras.losses.SparseCategoricalCrossentropy()(y_val, predictions)
+        Args:
+            batches: Iterable of (X_batch, y_batch)
+            optimizer: Keras optimizer
+            log_every (int): Print the running loss every N batches (forces a
+                device sync each time; 0 disables)
+            
+        Returns:
+            float: Mean batch loss
+        """
         
-        # Calculate accuracy
-        predicted_classes = np.argmax(predictions.numpy(), axis=-1)
-        accuracy = np.mean(predicted_classes == y_val)
+        self.train_loss.reset_state()
+        step = self._get_train_step(optimizer)
         
-        return loss.numpy(), float(accuracy)
-        # Calculate accuracy
-        predicted_classes = np.argmax(predictions.numpy(), axis=-1)
-        # For CTC, we take the mode of predictions across time
-        predicted_classes = np.apply_along_axis(lambda x: np.bincount(x).argmax(), 1, predicted_classes)
-        accuracy = np.mean(predicted_classes == y_val)
+        for num_batches, (X_batch, y_batch) in enumerate(batches, start=1):
+            step(self._as_model_input(X_batch), y_batch)
+            
+            if log_every and num_batches % log_every == 0:
+                print(f"  Batch {num_batches}: Loss={float(self.train_loss.result()):.4f}")
         
-        return loss.numpy(), accuracy
+        return float(self.train_loss.result())
     
     def train(self, X_train: np.ndarray, y_train: np.ndarray,
              X_val: np.ndarray, y_val: np.ndarray,
              epochs: int = 50, batch_size: int = 32,
-             learning_rate: float = 1e-3, early_stopping_patience: int = 10):
+             learning_rate: float = 1e-3, early_stopping_patience: int = 10,
+             train_batches: Optional[Callable[[int], Iterable[Tuple]]] = None,
+             steps_per_epoch: Optional[int] = None,
+             input_mode: str = "numpy", cache: Union[bool, str] = False,
+             seed: Optional[int] = None, eval_batch_size: Optional[int] = None):
         """
         Train the model.
         
@@ -122,11 +288,27 @@ class CTCTrainingPipeline:
             batch_size (int): Batch size
             learning_rate (float): Initial learning rate
             early_stopping_patience (int): Epochs to wait before stopping
+            train_batches (callable, optional): epoch -> iterable of (X_batch, y_batch),
+                e.g. shuffled, augmented batches from DataLoader.create_batches;
+                defaults to slicing X_train/y_train in order
+            steps_per_epoch (int, optional): Batches per epoch for the learning
+                rate schedule (default: len(y_train) // batch_size)
+            input_mode (str): "numpy" slices arrays in a Python loop; "tf.data"
+                feeds steps from a shuffled, prefetched tf.data pipeline (or
+                prefetches train_batches through one)
+            cache (bool or str): tf.data mode only, see make_dataset()
+            seed (int, optional): tf.data shuffle seed
+            eval_batch_size (int, optional): Validation chunk size (default: batch_size)
         """
         
+        if input_mode not in ("numpy", "tf.data"):
+            raise ValueError(f"input_mode must be 'numpy' or 'tf.data', got {input_mode!r}")
+        
         # Optimizer with learning rate schedule
         initial_lr = learning_rate
-        decay_steps = max(1, len(X_train) // batch_size)  # Ensure decay_steps > 0
+        if steps_per_epoch is None:
+            steps_per_epoch = len(y_train) // batch_size
+        decay_steps = max(1, steps_per_epoch)  # Ensure decay_steps > 0
         lr_schedule = keras.optimizers.schedules.ExponentialDecay(
             initial_learning_rate=initial_lr,
             decay_steps=decay_steps,
@@ -140,6 +322,13 @@ class CTCTrainingPipeline:
         val_losses = []
         val_accuracies = []
         
+        eval_batch_size = eval_batch_size or batch_size
+        if input_mode == "tf.data":
+            if train_batches is None:
+                # Built once; reshuffles on every iteration
+                dataset = self.make_dataset(X_train, y_train, batch_size, cache=cache, seed=seed)
+            val_dataset = self.make_dataset(X_val, y_val, eval_batch_size, shuffle=False)
+        
         # Training loop
         patience_counter = 0
         
@@ -148,46 +337,23 @@ class CTCTrainingPipeline:
             print("-" * 50)
             
             # Training
-            epoch_train_loss = 0.0
-            num_batches = 0
-            
-            for i in range(0, len(X_train), batch_size):
-                # Handle both list inputs (dual-stream) and array inputs
-                if isinstance(X_train, list):
-                    X_batch = [stream[i:i+batch_size] for stream in X_train]
-                else:
-                    X_batch = X_train[i:i+batch_size]
-                    
-                y_batch = y_train[i:i+batch_size]
-                
-                with tf.GradientTape() as tape:
-                    # Forward pass
-                    predictions = self.model(X_batch, training=True)
-                    
-                    # Use sparse categorical crossentropy instead of CTC
-                    loss = keras.losses.SparseCategoricalCrossentropy()(y_batch, predictions)
-                
-                # Backward pass
-                gradients = tape.gradient(loss, self.model.trainable_weights)
-                optimizer.apply_gradients(zip(gradients, self.model.trainable_weights))
-                
-                epoch_train_loss += loss.numpy()
-                num_batches += 1
-                
-                if (num_batches) % 5 == 0:
-                    print(f"  Batch {num_batches}: Loss={loss.numpy():.4f}")
+            if train_batches is not None:
+                batches = train_batches(epoch)
+                if input_mode == "tf.data":
+                    batches = self.batches_dataset(batches)
+            elif input_mode == "tf.data":
+                batches = dataset
+            else:
+                batches = self.iter_batches(X_train, y_train, batch_size)
             
-            epoch_train_loss /= num_batches
+            epoch_train_loss = self.train_epoch(batches, optimizer)
             train_losses.append(epoch_train_loss)
             
-            # Validation
-            predictions = self.model(X_val, training=False)
-            val_loss_val = keras.losses.SparseCategoricalCrossentropy()(y_val, predictions)
-            val_loss = val_loss_val.numpy()
-            
-            # Calculate accuracy
-            predicted_classes = np.argmax(predictions.numpy(), axis=-1)
-            val_accuracy = np.mean(predicted_classes == y_val)
+            # Validation, streamed in eval_batch_size chunks
+            if input_mode == "tf.data":
+                val_loss, val_accuracy = self.evaluate(val_dataset)
+            else:
+                val_loss, val_accuracy = self.validation_step(X_val, y_val, eval_batch_size)
             
             val_losses.append(val_loss)
             val_accuracies.append(val_accuracy)
@@ -243,7 +409,8 @@ class FineTuningPipeline(CTCTrainingPipeline):
     
     def __init__(self, model, num_classes: int,
                  checkpoint_dir: str = "checkpoints",
-                 freeze_base_layers: bool = True):
+                 freeze_base_layers: bool = True,
+                 run_eagerly: bool = False, jit_compile: bool = False):
         """
         Initialize fine-tuning pipeline.
         
@@ -252,8 +419,10 @@ class FineTuningPipeline(CTCTrainingPipeline):
             num_classes (int): Number of classes
             checkpoint_dir (str): Directory for checkpoints
             freeze_base_layers (bool): Whether to freeze base layers
+            run_eagerly (bool): Run train/eval steps eagerly (for debugging)
+            jit_compile (bool): XLA-compile the graph steps
         """
-        super().__init__(model, num_classes, checkpoint_dir)
+        super().__init__(model, num_classes, checkpoint_dir, run_eagerly, jit_compile)
         self.freeze_base_layers = freeze_base_layers
     
     def prepare_for_finetuning(self, freeze_until_layer: int = -2):
@@ -341,11 +510,12 @@ if __name__ == "__main__":
     
     # Mock setup
     from models.dual_stream_model import DualStreamSignRecognizer
+    from data_pipeline.keypoint_schema import HOLISTIC_LAYOUT
     
     NUM_CLASSES = 5
     SEQUENCE_LENGTH = 30
-    MANUAL_FEATURES = 168
-    NON_MANUAL_FEATURES = 332
+    MANUAL_FEATURES = HOLISTIC_LAYOUT.manual_size
+    NON_MANUAL_FEATURES = HOLISTIC_LAYOUT.non_manual_size
     
     # Create and build model
     recognizer = DualStreamSignRecognizer(
@@ -17,6 +17,8 @@ from tensorflow.keras.layers import (
 )
 import numpy as np
 
+from data_pipeline.keypoint_schema import HOLISTIC_LAYOUT
+
 
 class DualStreamSignRecognizer:
     """
@@ -27,15 +29,15 @@ class DualStreamSignRecognizer:
     - Non-Manual Stream (CNN): Processes facial and body landmarks
     """
     
-    def __init__(self, num_classes, manual_features=168, non_manual_features=332, 
-                 sequence_length=30):
+    def __init__(self, num_classes, manual_features=HOLISTIC_LAYOUT.manual_size,
+                 non_manual_features=HOLISTIC_LAYOUT.non_manual_size, sequence_length=30):
         """
         Initialize the Dual-Stream model.
         
         Args:
             num_classes (int): Number of sign classes
             manual_features (int): Hand landmark features (21 pts × 2 hands × 4 values = 168)
-            non_manual_features (int): Facial + body features (~100 facial + 33 body × 4)
+            non_manual_features (int): Facial + body features (468 facial × 3 + 33 body × 4 = 1536)
             sequence_length (int): Number of frames per sequence
         """
         self.num_classes = num_classes
@@ -220,8 +222,8 @@ class DualStreamModelWithCTC:
     Complete model with CTC loss for continuous sequence recognition.
     """
     
-    def __init__(self, num_classes, manual_features=168, non_manual_features=332, 
-                 sequence_length=30):
+    def __init__(self, num_classes, manual_features=HOLISTIC_LAYOUT.manual_size,
+                 non_manual_features=HOLISTIC_LAYOUT.non_manual_size, sequence_length=30):
         """Initialize model with CTC capabilities."""
         self.num_classes = num_classes
         self.manual_features = manual_features
@@ -262,8 +264,8 @@ if __name__ == "__main__":
     
     recognizer = DualStreamSignRecognizer(
         num_classes=NUM_CLASSES,
-        manual_features=168,      # 21 pts × 2 hands × 4 values
-        non_manual_features=332,  # ~100 facial + 33 body × 4
+        manual_features=HOLISTIC_LAYOUT.manual_size,          # 21 pts × 2 hands × 4 values
+        non_manual_features=HOLISTIC_LAYOUT.non_manual_size,  # 468 facial × 3 + 33 body × 4
         sequence_length=30        # 30 frames per sequence
     )
     
@@ -283,8 +285,9 @@ if __name__ == "__main__":
     print("="*80)
     
     batch_size = 4
-    manual_dummy = np.random.randn(batch_size, 30, 168)
-    non_manual_dummy = np.random.randn(batch_size, 30, 332)
+    manual_dummy, non_manual_dummy = HOLISTIC_LAYOUT.split_streams(
+        np.random.randn(batch_size, 30, HOLISTIC_LAYOUT.size)
+    )
     
     predictions = recognizer.predict(manual_dummy, non_manual_dummy)
     predicted_classes, confidence_scores = recognizer.get_confidence_scores(
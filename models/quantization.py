@@ -0,0 +1,221 @@
+"""
+Quantized TFLite export for the dual-stream recognizer.
+
+The kiosks run one (1, 30, features) window at a time on CPU, where the
+two BiLSTM layers dominate. Exporting the trained Keras model to TFLite
+with a fixed batch of 1 removes Keras' per-call overhead, and quantization
+shrinks the weights further:
+
+- 'float32':  no quantization (reference for the accuracy delta)
+- 'dynamic':  int8 weights, float activations (dynamic-range quantization)
+- 'float16':  float16 weights, computed in float32 on CPUs
+- 'int8':     int8 weights and activations, calibrated on a representative
+              sample of training windows; ops without int8 kernels fall
+              back to float. The TFLite calibrator cannot run the LSTM
+              while-loops, so this mode exports with the LSTMs unrolled
+              over the (fixed) sequence length - same weights and results,
+              larger graph.
+
+Each artifact is written as ``<model>.<mode>.tflite`` with a ``.json``
+metadata file and a copy of the model's normalization statistics, so
+modules/tflite_recognizer.TFLiteSignRecognizer can stand in for the Keras
+model (see quantize_model.py for the CLI and accuracy/size/latency report).
+
+export_saved_model() writes the same batch-1 serving signature unconverted,
+as a frozen SavedModel (``<model>.serving.savedmodel``): it runs on full
+TensorFlow without deserializing, building or retracing the Keras model
+(modules/inference_runtime.SavedModelSignRecognizer).
+
+Usage:
+    path = export_tflite(model, tflite_path("sign_language_model.h5", "dynamic"), "dynamic")
+"""
+
+import json
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Union
+
+import numpy as np
+import tensorflow as tf
+from tensorflow import keras
+
+from data_pipeline.keypoint_schema import HOLISTIC_LAYOUT, KeypointLayout
+from data_pipeline.normalization import normalizer_path
+
+
+QUANTIZATION_MODES = ('float32', 'dynamic', 'float16', 'int8')
+INPUT_NAMES = ('manual_input', 'non_manual_input')
+
+
+def tflite_path(model_path: Union[str, Path], mode: str) -> Path:
+    """Artifact stored alongside a model, e.g. model.dynamic.tflite."""
+    return Path(model_path).with_suffix(f'.{mode}.tflite')
+
+
+def saved_model_path(model_path: Union[str, Path]) -> Path:
+    """Serving SavedModel directory stored alongside a model, e.g. model.serving.savedmodel."""
+    return Path(model_path).with_suffix('.serving.savedmodel')
+
+
+def metadata_path(artifact_path: Union[str, Path]) -> Path:
+    """Metadata file of an exported artifact, e.g. model.dynamic.json."""
+    return Path(artifact_path).with_suffix('.json')
+
+
+def representative_windows(X: np.ndarray, num_samples: int = 100,
+                           layout: KeypointLayout = HOLISTIC_LAYOUT,
+                           seed: int = 0) -> Callable[[], Iterator[Dict[str, np.ndarray]]]:
+    """
+    Calibration data for 'int8': a random sample of (normalized) training windows.
+
+    Args:
+        X (np.ndarray): Windows (N, sequence_length, layout.size), normalized
+            exactly as the model was trained (e.g. from DataLoader.normalize)
+        num_samples (int): Windows to calibrate on
+        layout (KeypointLayout): Layout of X
+        seed (int): Sampling seed
+
+    Returns:
+        callable: Generator factory for TFLiteConverter.representative_dataset
+    """
+    layout.validate(X, source="calibration data")
+    indices = np.random.default_rng(seed).permutation(len(X))[:num_samples]
+
+    def generate():
+        for index in indices:
+            manual, non_manual = layout.split_streams(np.asarray(X[index:index + 1], np.float32))
+            yield {INPUT_NAMES[0]: manual, INPUT_NAMES[1]: non_manual}
+
+    return generate
+
+
+def _unrolled(model: keras.Model) -> keras.Model:
+    """Copy of a model with its recurrent layers unrolled (same weights)."""
+
+    def clone(layer):
+        config = layer.get_config()
+        for key in ('layer', 'backward_layer'):  # Bidirectional wrappers
+            if isinstance(config.get(key), dict) and 'unroll' in config[key]['config']:
+                config[key]['config']['unroll'] = True
+        if 'unroll' in config:
+            config['unroll'] = True
+        return layer.__class__.from_config(config)
+
+    unrolled = keras.models.clone_model(model, clone_function=clone)
+    unrolled.set_weights(model.get_weights())
+    return unrolled
+
+
+def _serving_signature(model: keras.Model) -> List[tf.TensorSpec]:
+    """Batch-1 input signature of a dual-stream model."""
+    return [tf.TensorSpec((1,) + tuple(tensor.shape[1:]), tf.float32, name=name)
+            for tensor, name in zip(model.inputs, INPUT_NAMES)]
+
+
+def _write_serving_archive(source: keras.Model, signature: List[tf.TensorSpec],
+                           directory: Union[str, Path]):
+    """SavedModel with a fixed-shape 'serve' endpoint for source."""
+    # Keras models with a dynamic batch leave LSTM tensor lists the TFLite
+    # converter cannot lower
+    archive = keras.export.ExportArchive()
+    archive.track(source)
+    archive.add_endpoint('serve', lambda manual, non_manual: source([manual, non_manual],
+                                                                     training=False),
+                         input_signature=signature)
+    archive.write_out(str(directory), verbose=False)
+
+
+def _write_metadata(model: keras.Model, path: Path, mode: str,
+                    model_path: Optional[Union[str, Path]]):
+    """Metadata file and normalization statistics next to an artifact."""
+    metadata = {
+        'mode': mode,
+        'sequence_length': int(model.inputs[0].shape[1]),
+        'manual_features': int(model.inputs[0].shape[2]),
+        'non_manual_features': int(model.inputs[1].shape[2]),
+        'num_classes': int(model.outputs[0].shape[-1]),
+        'source_model': str(model_path) if model_path else None,
+    }
+    with open(metadata_path(path), 'w', encoding='utf-8') as f:
+        json.dump(metadata, f, indent=2)
+
+    if model_path and normalizer_path(model_path).exists():
+        shutil.copyfile(normalizer_path(model_path), normalizer_path(path))
+
+
+def export_tflite(model: keras.Model, path: Union[str, Path], mode: str = 'dynamic',
+                  representative: Optional[Callable] = None,
+                  model_path: Optional[Union[str, Path]] = None) -> Path:
+    """
+    Export a dual-stream Keras model to a batch-1 TFLite artifact.
+
+    Args:
+        model (keras.Model): Model taking [manual, non_manual] sequences
+        path (str or Path): Output .tflite file
+        mode (str): One of QUANTIZATION_MODES
+        representative (callable, optional): Calibration data (required for
+            'int8', see representative_windows)
+        model_path (str or Path, optional): File the model was loaded from;
+            its normalization statistics are copied next to the artifact
+
+    Returns:
+        Path: The written artifact
+
+    Raises:
+        ValueError: If the mode is unknown or 'int8' has no calibration data
+    """
+    if mode not in QUANTIZATION_MODES:
+        raise ValueError(f"Unknown quantization mode '{mode}', expected one of {QUANTIZATION_MODES}")
+    if mode == 'int8' and representative is None:
+        raise ValueError("'int8' quantization needs representative calibration data")
+
+    path = Path(path)
+    source = _unrolled(model) if mode == 'int8' else model
+
+    with tempfile.TemporaryDirectory() as saved_model_dir:
+        _write_serving_archive(source, _serving_signature(model), saved_model_dir)
+
+        converter = tf.lite.TFLiteConverter.from_saved_model(saved_model_dir, signature_keys=['serve'])
+        if mode != 'float32':
+            converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        if mode == 'float16':
+            converter.target_spec.supported_types = [tf.float16]
+        if mode == 'int8':
+            converter.representative_dataset = representative
+        flatbuffer = converter.convert()
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(flatbuffer)
+    _write_metadata(model, path, mode, model_path)
+    return path
+
+
+def export_saved_model(model: keras.Model, path: Union[str, Path],
+                       model_path: Optional[Union[str, Path]] = None) -> Path:
+    """
+    Export a dual-stream Keras model as a frozen batch-1 serving SavedModel.
+
+    Args:
+        model (keras.Model): Model taking [manual, non_manual] sequences
+        path (str or Path): Output directory (replaced if it exists)
+        model_path (str or Path, optional): File the model was loaded from;
+            its normalization statistics are copied next to the artifact
+
+    Returns:
+        Path: The written SavedModel directory
+    """
+    path = Path(path)
+    if path.exists():
+        shutil.rmtree(path)
+    _write_serving_archive(model, _serving_signature(model), path)
+    _write_metadata(model, path, 'saved_model', model_path)
+    return path
+
+
+def export_all(model: keras.Model, model_path: Union[str, Path],
+               modes: List[str] = QUANTIZATION_MODES,
+               representative: Optional[Callable] = None) -> Dict[str, Path]:
+    """Export every requested mode next to model_path; returns mode -> artifact."""
+    return {mode: export_tflite(model, tflite_path(model_path, mode), mode, representative, model_path)
+            for mode in modes}
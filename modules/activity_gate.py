@@ -0,0 +1,127 @@
+"""
+Activity gating for real-time recognition.
+
+A kiosk camera spends most of its time looking at nobody, or at someone
+standing still. ActivityGate decides from the last extracted keypoint
+frame alone (no extra model) whether anyone is signing:
+
+- active while at least one hand is detected and the hands moved more
+  than ``motion_threshold`` (mean absolute change of hand x/y/z, in
+  normalized image units) within the last ``idle_frames`` frames;
+- a hand appearing counts as motion, so the gate wakes on the first
+  frame a hand is seen.
+
+While idle, callers skip model inference, may run the landmark detector
+on only every ``idle_detect_stride``-th frame, and may switch to a
+lighter detector configuration until hands reappear.
+
+Usage:
+    gate = ActivityGate()
+    if gate.update(keypoints):
+        predictions = recognizer.push(keypoints)
+    elif gate.just_went_idle:
+        recognizer.reset()
+"""
+
+import numpy as np
+
+from data_pipeline.keypoint_schema import HOLISTIC_LAYOUT, KeypointLayout, MANUAL
+
+
+class ActivityGate:
+    """
+    Hand-presence / hand-motion gate with idle hysteresis.
+    """
+
+    def __init__(self, layout: KeypointLayout = HOLISTIC_LAYOUT,
+                 motion_threshold: float = 0.004, idle_frames: int = 15,
+                 idle_detect_stride: int = 3):
+        """
+        Initialize gate.
+
+        Args:
+            layout (KeypointLayout): Layout of the keypoint frames
+            motion_threshold (float): Minimum mean per-coordinate hand movement
+                between frames that counts as signing
+            idle_frames (int): Consecutive frames without hands or motion
+                before the gate goes idle (avoids flicker within a sign)
+            idle_detect_stride (int): While idle, should_detect() is True on
+                every N-th frame only
+        """
+        self.layout = layout
+        self.motion_threshold = motion_threshold
+        self.idle_frames = idle_frames
+        self.idle_detect_stride = idle_detect_stride
+
+        # Columns holding x/y/z of every hand point (visibility is ignored)
+        hand_columns = []
+        for segment in layout.stream_segments(MANUAL):
+            values = segment.values_per_point
+            for point in range(segment.num_points):
+                hand_columns.extend(segment.offset + point * values + np.arange(3))
+        self._hand_columns = np.array(hand_columns)
+        self._segments = [segment.slice for segment in layout.stream_segments(MANUAL)]
+        self._previous = None
+        self.reset()
+
+    def reset(self):
+        """Start idle, as if nobody had been seen yet."""
+        self.active = False
+        self.just_went_idle = False
+        self.just_woke = False
+        self._quiet_frames = self.idle_frames
+        self._since_detect = 0
+        self._previous = None
+        self.frames_active = 0
+        self.frames_idle = 0
+
+    def hands_present(self, keypoints: np.ndarray) -> bool:
+        """Whether any hand segment of the frame holds a detection."""
+        return any(keypoints[segment].any() for segment in self._segments)
+
+    def update(self, keypoints: np.ndarray) -> bool:
+        """
+        Feed one keypoint frame.
+
+        Returns:
+            bool: Whether the gate is active (inference should run) after this frame
+        """
+        hands = keypoints[self._hand_columns]
+        present = self.hands_present(keypoints)
+        if present and self._previous is not None:
+            moving = float(np.abs(hands - self._previous).mean()) > self.motion_threshold
+        else:
+            moving = present  # A hand appearing is motion
+        self._previous = hands.copy() if present else None
+
+        self._quiet_frames = 0 if moving else self._quiet_frames + 1
+        was_active = self.active
+        self.active = self._quiet_frames < self.idle_frames
+        self.just_went_idle = was_active and not self.active
+        self.just_woke = self.active and not was_active
+
+        if self.active:
+            self.frames_active += 1
+        else:
+            self.frames_idle += 1
+        return self.active
+
+    def should_detect(self) -> bool:
+        """
+        Whether to run the landmark detector on the next frame: always while
+        active, every ``idle_detect_stride`` frames while idle.
+        """
+        if self.active:
+            self._since_detect = 0
+            return True
+        self._since_detect += 1
+        if self._since_detect >= self.idle_detect_stride:
+            self._since_detect = 0
+            return True
+        return False
+
+    @property
+    def idle_fraction(self) -> float:
+        """Share of frames seen while idle."""
+        total = self.frames_active + self.frames_idle
+        return self.frames_idle / total if total else 0.0
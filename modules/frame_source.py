@@ -0,0 +1,310 @@
+"""
+Pluggable frame sources for the real-time paths.
+
+The recognition paths used to open ``cv2.VideoCapture(0)`` themselves, so
+nothing could run (or be benchmarked reproducibly) without a webcam. A
+frame source offers the VideoCapture reading interface those loops
+already use - ``read() -> (ret, frame)``, ``isOpened()``, ``get(prop)``,
+``release()`` - with three backends:
+
+- CameraSource:         a webcam, trying capture backends in order
+- VideoFileSource:      a recorded clip, optionally paced at its own frame
+                        rate (so it behaves like a live camera) and looped
+- LandmarkReplaySource: stored keypoint frames (.npy, or a data directory
+                        readable by DataLoader) played back as blank frames;
+                        its detector() returns the stored landmarks instead
+                        of running MediaPipe, so the landmarks -> model ->
+                        translation path runs without MediaPipe or video
+
+``open_source(spec)`` turns a command-line / environment spec into a
+source: a camera index ("0"), a video file, or a .npy file / directory of
+landmarks. Entry points default to OMNISIGN_SOURCE (camera 0 if unset).
+
+Usage:
+    with open_source("session.npy") as source:
+        detector = source.detector() or create_holistic()
+        ret, frame = source.read()
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from data_pipeline.keypoint_schema import HOLISTIC_LAYOUT, KeypointLayout
+
+
+DEFAULT_SOURCE = os.environ.get('OMNISIGN_SOURCE', '0')
+VIDEO_EXTENSIONS = ('.mp4', '.avi', '.mov', '.mkv', '.webm', '.m4v')
+
+
+class FrameSource:
+    """
+    Base class: VideoCapture-style reading with optional real-time pacing.
+    """
+
+    def __init__(self, fps: float = 30.0, realtime: bool = False):
+        """
+        Args:
+            fps (float): Nominal frame rate of the source
+            realtime (bool): Deliver frames no faster than fps (recorded sources)
+        """
+        self.fps = fps
+        self.realtime = realtime
+        self.frames_read = 0
+        self._started_at = None
+
+    def _pace(self):
+        """Sleep until the next frame is due (real-time playback)."""
+        now = time.perf_counter()
+        if self._started_at is None:
+            self._started_at = now
+        if self.realtime and self.fps > 0:
+            due = self._started_at + self.frames_read / self.fps
+            if due > now:
+                time.sleep(due - now)
+
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        raise NotImplementedError
+
+    def isOpened(self) -> bool:
+        return True
+
+    def get(self, prop: int) -> float:
+        """Capture property; only CAP_PROP_FPS is known for synthetic sources."""
+        return float(self.fps) if prop == cv2.CAP_PROP_FPS else 0.0
+
+    def detector(self):
+        """Detector to use instead of MediaPipe (landmark replay), or None."""
+        return None
+
+    def release(self):
+        pass
+
+    def __enter__(self) -> 'FrameSource':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+
+class CameraSource(FrameSource):
+    """
+    A webcam.
+    """
+
+    def __init__(self, index: int = 0, width: int = 640, height: int = 480,
+                 fps: Optional[float] = None, backends: Sequence[Optional[int]] = (None,),
+                 buffer_size: Optional[int] = None):
+        """
+        Open the camera with the first backend that works.
+
+        Args:
+            index (int): Camera index
+            width, height (int): Requested frame size
+            fps (float, optional): Requested frame rate
+            backends: cv2.CAP_* backends to try in order (None: OpenCV's default)
+            buffer_size (int, optional): Driver frame buffer (1: always the newest frame)
+        """
+        if not backends:
+            raise ValueError("backends must list at least one backend (None: OpenCV's default)")
+        for backend in backends:
+            self.cap = cv2.VideoCapture(index) if backend is None else cv2.VideoCapture(index, backend)
+            if self.cap.isOpened():
+                break
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        if fps:
+            self.cap.set(cv2.CAP_PROP_FPS, fps)
+        if buffer_size:
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, buffer_size)
+        super().__init__(self.cap.get(cv2.CAP_PROP_FPS) or 30.0)
+
+    def read(self):
+        ret, frame = self.cap.read()
+        if ret:
+            self.frames_read += 1
+        return ret, frame
+
+    def isOpened(self) -> bool:
+        return self.cap.isOpened()
+
+    def get(self, prop: int) -> float:
+        return self.cap.get(prop)
+
+    def release(self):
+        self.cap.release()
+
+
+class VideoFileSource(FrameSource):
+    """
+    A recorded clip, read like a camera.
+    """
+
+    def __init__(self, path: str, realtime: bool = True, loop: bool = False):
+        """
+        Args:
+            path (str): Video file
+            realtime (bool): Pace frames at the clip's frame rate, so stages that
+                fall behind drop frames as they would on a live camera
+            loop (bool): Rewind at the end instead of ending the stream
+        """
+        self.path = str(path)
+        self.cap = cv2.VideoCapture(self.path)
+        self.loop = loop
+        super().__init__(self.cap.get(cv2.CAP_PROP_FPS) or 30.0, realtime)
+
+    def read(self):
+        self._pace()
+        ret, frame = self.cap.read()
+        if not ret and self.loop and self.frames_read:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ret, frame = self.cap.read()
+        if ret:
+            self.frames_read += 1
+        return ret, frame
+
+    def isOpened(self) -> bool:
+        return self.cap.isOpened()
+
+    def get(self, prop: int) -> float:
+        return self.cap.get(prop)
+
+    def release(self):
+        self.cap.release()
+
+
+class LandmarkFrame(np.ndarray):
+    """Blank image carrying the keypoint frame it stands for (see ReplayDetector)."""
+
+    def __array_finalize__(self, obj):
+        # Views (e.g. crops) keep the keypoints of their frame
+        self.keypoints = getattr(obj, 'keypoints', None)
+
+
+class ReplayDetector:
+    """
+    Holistic-compatible detector returning the landmarks a LandmarkReplaySource
+    stored in each frame. It ignores pixels, so the frame must not be converted
+    (cv2 functions return plain arrays) or cropped (ROI tracking would map
+    full-frame landmarks again).
+    """
+
+    def __init__(self, layout: KeypointLayout = HOLISTIC_LAYOUT):
+        self.layout = layout
+
+    def process(self, image: np.ndarray):
+        keypoints = getattr(image, 'keypoints', None)
+        if keypoints is None:
+            keypoints = self.layout.allocate()  # Not a replayed frame: nothing detected
+        return self.layout.to_results(keypoints)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class LandmarkReplaySource(FrameSource):
+    """
+    Stored keypoint frames played back as a video source.
+    """
+
+    def __init__(self, keypoints: np.ndarray, layout: KeypointLayout = HOLISTIC_LAYOUT,
+                 fps: float = 30.0, realtime: bool = True, loop: bool = False,
+                 size: Tuple[int, int] = (640, 480)):
+        """
+        Args:
+            keypoints (np.ndarray): Frames (T, size) or sequences (N, S, size),
+                played in order
+            layout (KeypointLayout): Layout of the frames
+            fps (float): Playback frame rate
+            realtime (bool): Pace playback at fps
+            loop (bool): Restart at the end instead of ending the stream
+            size (Tuple[int, int]): (width, height) of the blank frames
+        """
+        layout.validate(keypoints, source="replayed landmarks")
+        super().__init__(fps, realtime)
+        self.keypoints = keypoints.reshape(-1, layout.size)
+        self.layout = layout
+        self.loop = loop
+        self.size = size
+
+    @classmethod
+    def from_path(cls, path: str, layout: KeypointLayout = HOLISTIC_LAYOUT, **kwargs):
+        """
+        Load a .npy keypoint file, or every action of a data directory
+        (consolidated or per-frame, read with DataLoader; legacy layouts converted).
+        """
+        path = Path(path)
+        if path.is_dir():
+            from data_pipeline.data_loader import DataLoader
+            from data_pipeline.sequence_store import SequenceStore
+
+            if SequenceStore.exists(path):
+                actions = SequenceStore(path, layout=layout).actions
+            else:
+                actions = sorted(p.name for p in path.iterdir() if p.is_dir())
+            keypoints, _ = DataLoader(str(path), actions, layout=layout,
+                                      convert_legacy=True).load_data()
+        else:
+            keypoints = np.load(path).astype(layout.dtype, copy=False)
+        return cls(keypoints, layout, **kwargs)
+
+    def read(self):
+        if self.frames_read >= len(self.keypoints) and not (self.loop and len(self.keypoints)):
+            return False, None
+        self._pace()
+        frame = np.zeros((self.size[1], self.size[0], 3), np.uint8).view(LandmarkFrame)
+        frame.keypoints = self.keypoints[self.frames_read % len(self.keypoints)]
+        self.frames_read += 1
+        return True, frame
+
+    def get(self, prop: int) -> float:
+        if prop == cv2.CAP_PROP_FRAME_COUNT:
+            return float(len(self.keypoints))
+        return super().get(prop)
+
+    def detector(self) -> ReplayDetector:
+        return ReplayDetector(self.layout)
+
+
+def open_source(spec: Optional[str] = None, realtime: bool = True, loop: bool = False,
+                **camera_options) -> FrameSource:
+    """
+    Open a frame source from a spec.
+
+    Args:
+        spec (str, optional): Camera index ("0"), video file, or .npy file /
+            directory of landmarks; defaults to DEFAULT_SOURCE
+        realtime (bool): Pace recorded sources at their frame rate
+        loop (bool): Loop recorded sources
+        **camera_options: Passed to CameraSource (width, height, backends, ...)
+
+    Returns:
+        FrameSource: Check isOpened() before reading
+
+    Raises:
+        FileNotFoundError: If a file or directory spec does not exist
+        ValueError: If a file is neither a video (VIDEO_EXTENSIONS) nor .npy
+    """
+    spec = str(DEFAULT_SOURCE if spec is None else spec)
+    if spec.isdigit():
+        return CameraSource(int(spec), **camera_options)
+
+    path = Path(spec)
+    if not path.exists():
+        raise FileNotFoundError(f"Frame source '{spec}' not found")
+    if path.is_dir() or path.suffix.lower() == '.npy':
+        return LandmarkReplaySource.from_path(path, realtime=realtime, loop=loop)
+    if path.suffix.lower() not in VIDEO_EXTENSIONS:
+        raise ValueError(f"Frame source '{spec}' is not a video ({', '.join(VIDEO_EXTENSIONS)}) "
+                         f"or a .npy landmark file")
+    return VideoFileSource(path, realtime=realtime, loop=loop)
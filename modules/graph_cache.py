@@ -0,0 +1,137 @@
+"""
+Persistent on-disk cache of traced forward passes.
+
+A Keras model is reloaded, rebuilt and retraced on every start, so the
+first prediction waits for Keras and graph tracing while the signer is
+already in front of the camera. GraphCache stores the traced batch-1
+forward pass as a serving SavedModel (models.quantization.export_saved_model)
+keyed by the model file's contents, the deployed input signature and the
+TensorFlow version. A restart with the same model file loads the traced
+graph with tf.saved_model.load - no Keras model is deserialized, built or
+retraced - and a retrained model gets a new key. Entries beyond
+max_entries are removed, least recently used first.
+
+Cache directory: env OMNISIGN_GRAPH_CACHE (default ~/.cache/omnisign/graphs).
+
+Usage:
+    cache = GraphCache()
+    key = cache_key("sign_language_model.h5", [(1, 30, 168), (1, 30, 1536)])
+    predictor = cache.load(key)
+    if predictor is None:
+        predictor = cache.store(key, tf.keras.models.load_model("sign_language_model.h5"))
+"""
+
+import hashlib
+import os
+import shutil
+from pathlib import Path
+from typing import Optional, Sequence, Tuple, Union
+
+from modules.inference_runtime import SavedModelSignRecognizer, is_saved_model
+
+DEFAULT_CACHE_DIR = Path(os.environ.get('OMNISIGN_GRAPH_CACHE',
+                                        Path.home() / '.cache' / 'omnisign' / 'graphs'))
+
+
+def cache_key(model_path: Union[str, Path], input_signature: Sequence[Tuple[int, ...]],
+              *extra) -> str:
+    """
+    Cache key of a model file's batch-1 forward pass.
+
+    Args:
+        model_path (str or Path): Keras model or weights file
+        input_signature (list): Deployed input shapes, [(1, T, manual), (1, T, non_manual)]
+        *extra: Anything else the traced graph depends on (e.g. the
+            architecture weights are loaded into)
+
+    Returns:
+        str: Hex digest
+    """
+    import tensorflow as tf
+
+    digest = hashlib.sha256()
+    with open(model_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    digest.update(repr((tf.__version__, [tuple(shape) for shape in input_signature], extra)).encode())
+    return digest.hexdigest()[:32]
+
+
+class GraphCache:
+    """
+    Directory of traced forward passes, one SavedModel per cache key.
+    """
+
+    def __init__(self, directory: Union[str, Path] = DEFAULT_CACHE_DIR, max_entries: int = 8):
+        """
+        Initialize cache.
+
+        Args:
+            directory (str or Path): Cache directory (created on first store)
+            max_entries (int): Traced models kept
+        """
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def entry_path(self, key: str) -> Path:
+        """SavedModel of a cache entry."""
+        return self.directory / key / 'graph'
+
+    def load(self, key: str) -> Optional[SavedModelSignRecognizer]:
+        """
+        Traced forward pass stored under a key.
+
+        Returns:
+            SavedModelSignRecognizer or None: None on a miss
+        """
+        path = self.entry_path(key)
+        if is_saved_model(path):
+            try:
+                recognizer = SavedModelSignRecognizer(path)
+                os.utime(path.parent)  # Most recently used
+                self.hits += 1
+                return recognizer
+            except Exception as error:
+                print(f"⚠️ Discarding unreadable graph cache entry {path.parent}: {error}")
+                shutil.rmtree(path.parent, ignore_errors=True)
+        self.misses += 1
+        return None
+
+    def store(self, key: str, model) -> SavedModelSignRecognizer:
+        """
+        Trace a Keras model and store it under a key.
+
+        Args:
+            key (str): From cache_key()
+            model (keras.Model): Model taking [manual, non_manual] sequences
+
+        Returns:
+            SavedModelSignRecognizer: The stored forward pass
+        """
+        from models.quantization import export_saved_model  # Imports Keras
+
+        entry = self.directory / key
+        staging = self.directory / f".{key}.{os.getpid()}"
+        shutil.rmtree(staging, ignore_errors=True)
+        export_saved_model(model, staging / 'graph')
+        try:
+            os.replace(staging, entry)  # Written aside, then renamed into place
+        except OSError:
+            # Another process stored the same entry first
+            shutil.rmtree(staging, ignore_errors=True)
+        self._evict()
+        return SavedModelSignRecognizer(self.entry_path(key))
+
+    def _evict(self):
+        """Remove least recently used entries beyond max_entries."""
+        entries = sorted((path for path in self.directory.iterdir()
+                          if path.is_dir() and not path.name.startswith('.')),
+                         key=lambda path: path.stat().st_mtime, reverse=True)
+        for path in entries[self.max_entries:]:
+            shutil.rmtree(path, ignore_errors=True)
+
+    def clear(self):
+        """Remove every entry."""
+        shutil.rmtree(self.directory, ignore_errors=True)
@@ -0,0 +1,181 @@
+"""
+Inference-only model loading for the live entry points.
+
+predict_sign.py and OmniSignApp only run a trained model forward, yet
+importing TensorFlow/Keras and rebuilding the model took several seconds
+before the first frame could be processed. load_inference_model() picks the
+lightest runtime that can run an artifact and imports it only then:
+
+- ``<model>.<mode>.tflite`` (quantize_model.py): TFLiteSignRecognizer on
+  the standalone LiteRT interpreter when installed - TensorFlow is never
+  imported
+- ``<model>.serving.savedmodel`` (quantize_model.py --saved-model): the
+  frozen batch-1 serving signature via tf.saved_model.load - TensorFlow,
+  but no Keras model to deserialize, build or retrace
+- anything else (.h5 / .keras): the Keras model, as before
+
+Exported recognizers share DualStreamSignRecognizer's predict() interface
+and a batch-1 forward() that StreamingRecognizer runs directly.
+benchmarks/bench_startup.py measures time-to-first-prediction per entry
+point and artifact.
+
+Usage:
+    model = load_inference_model("sign_language_model.dynamic.tflite")
+    recognizer = create_stream_recognizer(model, HOLISTIC_LAYOUT, 30)
+"""
+
+import json
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+from data_pipeline.keypoint_schema import HOLISTIC_LAYOUT, KeypointLayout
+from data_pipeline.normalization import StreamingStandardizer
+from modules.streaming_recognizer import StreamingRecognizer
+from modules.tflite_recognizer import TFLiteSignRecognizer, is_tflite_model
+
+
+def is_saved_model(path: Union[str, Path, None]) -> bool:
+    """Whether a model path points at a SavedModel directory."""
+    return path is not None and (Path(path) / 'saved_model.pb').exists()
+
+
+def is_exported_model(path: Union[str, Path, None]) -> bool:
+    """Whether a model path points at an exported inference-only artifact."""
+    return is_tflite_model(path) or is_saved_model(path)
+
+
+class SavedModelSignRecognizer:
+    """
+    Dual-stream recognizer backed by a frozen serving SavedModel.
+    """
+
+    def __init__(self, model_path: Union[str, Path]):
+        """
+        Load an artifact.
+
+        Args:
+            model_path (str or Path): Directory written by export_saved_model()
+        """
+        import tensorflow as tf
+
+        self.model_path = Path(model_path)
+        self.metadata = {}
+        metadata_file = self.model_path.with_suffix('.json')
+        if metadata_file.exists():
+            with open(metadata_file, 'r', encoding='utf-8') as f:
+                self.metadata = json.load(f)
+
+        self._loaded = tf.saved_model.load(str(self.model_path))
+        self._serve = self._loaded.signatures['serve']
+        # Inputs in [manual, non_manual] order (the manual stream is the narrower one)
+        specs = sorted(self._serve.structured_input_signature[1].items(),
+                       key=lambda item: item[1].shape[-1])
+        self._input_names = [name for name, _ in specs]
+        self.input_shapes: List[Tuple] = [(None,) + tuple(int(n) for n in spec.shape[1:])
+                                          for _, spec in specs]
+        output_spec = next(iter(self._serve.structured_outputs.values()))
+        self.num_classes = int(output_spec.shape[-1])
+        self.backend = 'tensorflow'
+
+    @property
+    def mode(self) -> str:
+        """Export mode recorded in the metadata."""
+        return self.metadata.get('mode', 'saved_model')
+
+    def forward(self, manual: np.ndarray, non_manual: np.ndarray) -> np.ndarray:
+        """
+        Probabilities for one window.
+
+        Args:
+            manual (np.ndarray): (1, sequence_length, manual_features)
+            non_manual (np.ndarray): (1, sequence_length, non_manual_features)
+
+        Returns:
+            np.ndarray: (num_classes,) class probabilities
+        """
+        outputs = self._serve(**{
+            self._input_names[0]: np.asarray(manual, np.float32),
+            self._input_names[1]: np.asarray(non_manual, np.float32),
+        })
+        return next(iter(outputs.values())).numpy()[0]
+
+    def predict(self, manual_input: np.ndarray, non_manual_input: np.ndarray,
+                batch_size: int = 32) -> np.ndarray:
+        """
+        Predictions for a batch (same interface as DualStreamSignRecognizer.predict).
+
+        Returns:
+            np.ndarray: (N, num_classes) class probabilities
+        """
+        return np.stack([self.forward(manual_input[i:i + 1], non_manual_input[i:i + 1])
+                         for i in range(len(manual_input))])
+
+
+def load_inference_model(model_path: Union[str, Path], num_threads: Optional[int] = None,
+                         graph_cache=None, layout: KeypointLayout = HOLISTIC_LAYOUT,
+                         sequence_length: int = 30):
+    """
+    Load a model for inference with the lightest runtime that can run it.
+
+    Args:
+        model_path (str or Path): .tflite artifact, serving SavedModel
+            directory, or Keras model file
+        num_threads (int, optional): TFLite interpreter threads
+        graph_cache (GraphCache, optional): Run a Keras model's traced forward
+            pass from this cache (modules/graph_cache.py), tracing and storing
+            it on a miss. Causal models are not cached: they run frame by
+            frame in NumPy (see create_stream_recognizer)
+        layout (KeypointLayout): Deployed keypoint layout (graph cache key)
+        sequence_length (int): Deployed frames per window (graph cache key)
+
+    Returns:
+        TFLiteSignRecognizer, SavedModelSignRecognizer or keras.Model
+    """
+    if is_tflite_model(model_path):
+        return TFLiteSignRecognizer(model_path, num_threads=num_threads)
+    if is_saved_model(model_path):
+        return SavedModelSignRecognizer(model_path)
+
+    key = None
+    if graph_cache is not None:
+        from modules.graph_cache import cache_key
+        key = cache_key(model_path, [(1, sequence_length, layout.manual_size),
+                                     (1, sequence_length, layout.non_manual_size)])
+        cached = graph_cache.load(key)
+        if cached is not None:
+            return cached
+
+    from tensorflow.keras.models import load_model
+    model = load_model(model_path)
+    if key is not None:
+        from models.causal_stream_model import is_causal_model
+        if not is_causal_model(model):
+            return graph_cache.store(key, model)
+    return model
+
+
+def model_input_shapes(model) -> List[Tuple]:
+    """Input shapes of a loaded model, [(None, T, manual), (None, T, non_manual)]."""
+    if hasattr(model, 'input_shapes'):
+        return model.input_shapes
+    return [tuple(tensor.shape) for tensor in model.inputs]
+
+
+def create_stream_recognizer(model, layout: KeypointLayout = HOLISTIC_LAYOUT,
+                             sequence_length: int = 30, stride: int = 1,
+                             normalizer: Optional[StreamingStandardizer] = None):
+    """
+    Live recognizer for a loaded model.
+
+    Causal Keras models advance one frame at a time with carried state
+    (IncrementalDualStreamStepper); every other model re-runs the sliding
+    window (StreamingRecognizer).
+    """
+    if not hasattr(model, 'forward'):
+        from models.causal_stream_model import IncrementalDualStreamStepper, is_causal_model
+        if is_causal_model(model):
+            return IncrementalDualStreamStepper(model, layout, sequence_length,
+                                                normalizer=normalizer, stride=stride)
+    return StreamingRecognizer(model, layout, sequence_length, stride=stride, normalizer=normalizer)
@@ -0,0 +1,423 @@
+"""
+Batched inference server shared by many kiosk processes.
+
+Each kiosk process used to load its own copy of the model and run it at
+batch size 1. InferenceServer loads the model once and serves windows
+from any number of local clients over a Unix socket, batching them
+dynamically: the first waiting request opens a batch, which is run as one
+forward pass as soon as it holds ``max_batch_size`` windows or the oldest
+request has waited ``max_delay_ms`` (or every connected client has a
+request in it). Each client gets back its own probabilities.
+
+    kiosk 1 --\\                                     /--> kiosk 1
+    kiosk 2 ---+--[unix socket]--> batcher --> model +--> kiosk 2
+    kiosk N --/     (one reader thread per client)  \\--> kiosk N
+
+Wire format (little endian, float32 payloads):
+
+- request:  op (u8), request id (u64), sequence_length (u32),
+  manual_size (u32), non_manual_size (u32), then the manual and the
+  non-manual stream of one window, each (sequence_length, size)
+- response: status (u8), request id (u64), payload bytes (u32), then
+  (num_classes,) probabilities, or a UTF-8 error / JSON info
+
+InferenceClient has the same batch-1 forward() as the exported
+recognizers, so StreamingRecognizer (and predict_sign.py, see
+OMNISIGN_INFERENCE_SERVER) can run on the server instead of a local model.
+Exported TFLite / SavedModel artifacts have a fixed batch of 1: the server
+accepts them but can only run their batches window by window - serve a
+Keras model to get batched forward passes.
+
+Usage:
+    with InferenceServer(model, "/tmp/omnisign-inference.sock", max_batch_size=32) as server:
+        ...  # Serving on background threads (see serve_model.py)
+
+    with InferenceClient("/tmp/omnisign-inference.sock") as client:
+        probabilities = client.predict_window(window)  # (sequence_length, layout.size)
+"""
+
+import json
+import os
+import queue
+import socket
+import stat
+import struct
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from data_pipeline.keypoint_schema import HOLISTIC_LAYOUT, KeypointLayout
+from modules.pipeline_runtime import StageStats
+
+DEFAULT_SOCKET = os.environ.get('OMNISIGN_INFERENCE_SERVER') or '/tmp/omnisign-inference.sock'
+
+_REQUEST = struct.Struct('<BQIII')   # op, request id, sequence_length, manual_size, non_manual_size
+_RESPONSE = struct.Struct('<BQI')    # status, request id, payload bytes
+OP_PREDICT, OP_INFO = 0, 1
+STATUS_OK, STATUS_ERROR = 0, 1
+
+
+def _recv_into(sock: socket.socket, buffer) -> None:
+    """Fill a writable buffer from the socket (ConnectionError on EOF)."""
+    view = memoryview(buffer).cast('B')
+    while view.nbytes:
+        received = sock.recv_into(view)
+        if not received:
+            raise ConnectionError("connection closed")
+        view = view[received:]
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    buffer = bytearray(size)
+    _recv_into(sock, buffer)
+    return bytes(buffer)
+
+
+class _Request:
+    __slots__ = ('client', 'request_id', 'window', 'received_at')
+
+    def __init__(self, client, request_id: int, window: np.ndarray):
+        self.client = client
+        self.request_id = request_id
+        self.window = window
+        self.received_at = time.perf_counter()
+
+
+class _Connection:
+    """Server side of one client; responses are sent under a lock."""
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.lock = threading.Lock()
+
+    def send(self, status: int, request_id: int, payload: bytes):
+        with self.lock:
+            self.sock.sendall(_RESPONSE.pack(status, request_id, len(payload)) + payload)
+
+
+class InferenceServer:
+    """
+    Unix-socket model server with dynamic batching.
+    """
+
+    def __init__(self, model, socket_path: str = DEFAULT_SOCKET,
+                 layout: KeypointLayout = HOLISTIC_LAYOUT, sequence_length: int = 30,
+                 max_batch_size: int = 32, max_delay_ms: float = 5.0, window: int = 10_000):
+        """
+        Initialize server (threads start with start() or ``with``).
+
+        Args:
+            model: Keras model taking [manual, non_manual] sequences (batched
+                forward passes), or an exported recognizer (batch-1 forward())
+            socket_path (str): Unix socket to listen on (replaced only if nothing
+                listens on it)
+            layout (KeypointLayout): Layout of the served windows
+            sequence_length (int): Frames per window
+            max_batch_size (int): Most windows per forward pass (1 disables batching)
+            max_delay_ms (float): Longest a request waits for its batch to fill
+            window (int): Number of recent requests / batches the stats cover
+        """
+        self.socket_path = socket_path
+        self.layout = layout
+        self.sequence_length = sequence_length
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay_ms / 1000
+        self.manual_size = layout.manual_size
+        self.non_manual_size = layout.non_manual_size
+
+        self._forward, self.num_classes = self._batched_forward(model)
+        self._manual_batch = np.zeros((max_batch_size, sequence_length, self.manual_size), np.float32)
+        self._non_manual_batch = np.zeros((max_batch_size, sequence_length, self.non_manual_size),
+                                          np.float32)
+        self._requests: queue.Queue = queue.Queue()
+        self._running = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._connections: List[_Connection] = []
+        self._listener: Optional[socket.socket] = None
+
+        self.wait_stats = StageStats(window)     # Arrival -> forward pass starts
+        self.forward_stats = StageStats(window)  # One batched forward pass
+        self.batch_sizes = Counter()
+
+    def _batched_forward(self, model):
+        """(forward(manual, non_manual) -> (N, num_classes) array, num_classes)."""
+        if hasattr(model, 'forward'):
+            # Exported recognizers: fixed batch of 1
+            return model.predict, int(model.num_classes)
+
+        import tensorflow as tf
+        signature = [
+            tf.TensorSpec((None, self.sequence_length, self.manual_size), tf.float32),
+            tf.TensorSpec((None, self.sequence_length, self.non_manual_size), tf.float32),
+        ]
+
+        @tf.function(input_signature=signature)
+        def forward(manual, non_manual):
+            return model([manual, non_manual], training=False)
+
+        return (lambda manual, non_manual: forward(manual, non_manual).numpy(),
+                int(model.outputs[0].shape[-1]))
+
+    # ---------------------------------------------------------------- threads
+
+    def start(self) -> 'InferenceServer':
+        """Warm up the forward pass, listen, and start the accept and batch threads."""
+        manual = np.zeros((1, self.sequence_length, self.manual_size), np.float32)
+        self._forward(manual, np.zeros((1, self.sequence_length, self.non_manual_size), np.float32))
+
+        self._remove_stale_socket()
+        self._listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._listener.bind(self.socket_path)
+        self._listener.listen(128)
+        self._listener.settimeout(0.2)
+
+        self._running.set()
+        self._threads = [threading.Thread(target=self._accept_loop, name='accept', daemon=True),
+                         threading.Thread(target=self._batch_loop, name='batcher', daemon=True)]
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def _remove_stale_socket(self):
+        """Remove the socket of a previous run; refuse anything else at the path."""
+        try:
+            mode = os.stat(self.socket_path).st_mode
+        except FileNotFoundError:
+            return
+        if not stat.S_ISSOCK(mode):
+            raise FileExistsError(f"{self.socket_path} exists and is not a socket")
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.socket_path)
+        except ConnectionRefusedError:
+            os.unlink(self.socket_path)  # Nobody listening: stale
+            return
+        finally:
+            probe.close()
+        raise RuntimeError(f"Another server is already listening on {self.socket_path}")
+
+    def stop(self, timeout: float = 2.0):
+        """Stop serving, close every connection and remove the socket."""
+        self._running.clear()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        for connection in list(self._connections):
+            connection.sock.close()
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+    def __enter__(self) -> 'InferenceServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def _accept_loop(self):
+        while self._running.is_set():
+            try:
+                sock, _ = self._listener.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            sock.settimeout(None)
+            connection = _Connection(sock)
+            self._connections.append(connection)
+            threading.Thread(target=self._client_loop, args=(connection,),
+                             name='client', daemon=True).start()
+
+    def _client_loop(self, connection: _Connection):
+        """Read one client's requests and queue them for the batcher."""
+        try:
+            while self._running.is_set():
+                op, request_id, length, manual_size, non_manual_size = _REQUEST.unpack(
+                    _recv_exact(connection.sock, _REQUEST.size))
+                if op == OP_INFO:
+                    connection.send(STATUS_OK, request_id, json.dumps(self.info()).encode())
+                    continue
+
+                # Check the header before trusting its sizes: after a bad one
+                # the payload cannot be skipped, so the connection is dropped
+                if (op != OP_PREDICT or length != self.sequence_length
+                        or manual_size != self.manual_size or non_manual_size != self.non_manual_size):
+                    connection.send(STATUS_ERROR, request_id, (
+                        f"expected op {OP_PREDICT} with a ({self.sequence_length}, "
+                        f"{self.manual_size} + {self.non_manual_size}) window, got op {op} with "
+                        f"({length}, {manual_size} + {non_manual_size})").encode())
+                    break
+
+                # Payload: the manual stream, then the non-manual stream
+                window = np.empty(length * (manual_size + non_manual_size), np.float32)
+                _recv_into(connection.sock, window)
+                self._requests.put(_Request(connection, request_id, window))
+        except (ConnectionError, OSError, ValueError, MemoryError):
+            pass
+        finally:
+            connection.sock.close()
+            if connection in self._connections:
+                self._connections.remove(connection)
+
+    def _batch_loop(self):
+        """Collect up to max_batch_size requests or until the deadline, run, reply."""
+        while self._running.is_set():
+            try:
+                first = self._requests.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            batch = [first]
+            deadline = first.received_at + self.max_delay
+            # Clients wait for their result before sending again: once every
+            # connected client is in the batch, nothing else can arrive in time
+            while len(batch) < min(self.max_batch_size, len(self._connections)):
+                remaining = deadline - time.perf_counter()
+                try:
+                    batch.append(self._requests.get(timeout=remaining) if remaining > 0
+                                 else self._requests.get_nowait())
+                except queue.Empty:
+                    break
+
+            manual = self._manual_batch[:len(batch)]
+            non_manual = self._non_manual_batch[:len(batch)]
+            split = self.sequence_length * self.manual_size
+            for index, request in enumerate(batch):
+                manual[index].reshape(-1)[:] = request.window[:split]
+                non_manual[index].reshape(-1)[:] = request.window[split:]
+            started = time.perf_counter()
+            try:
+                probabilities = self._forward(manual, non_manual)
+            except Exception as error:
+                for request in batch:
+                    self._reply(request, STATUS_ERROR, f"inference failed: {error}".encode())
+                continue
+            finished = time.perf_counter()
+
+            self.forward_stats.record(finished - started)
+            self.batch_sizes[len(batch)] += 1
+            for request, row in zip(batch, probabilities):
+                self.wait_stats.record(started - request.received_at)
+                self._reply(request, STATUS_OK, np.ascontiguousarray(row, np.float32).tobytes())
+
+    def _reply(self, request: _Request, status: int, payload: bytes):
+        try:
+            request.client.send(status, request.request_id, payload)
+        except OSError:
+            pass  # Client went away; its reader thread cleans up
+
+    # ------------------------------------------------------------------ stats
+
+    def info(self) -> Dict:
+        """Served shapes and batching statistics."""
+        batches = sum(self.batch_sizes.values())
+        requests = sum(size * count for size, count in self.batch_sizes.items())
+        return {
+            'input_shapes': [[None, self.sequence_length, self.manual_size],
+                             [None, self.sequence_length, self.non_manual_size]],
+            'num_classes': self.num_classes,
+            'max_batch_size': self.max_batch_size,
+            'max_delay_ms': self.max_delay * 1000,
+            'clients': len(self._connections),
+            'requests': requests,
+            'batches': batches,
+            'mean_batch_size': requests / batches if batches else 0.0,
+            'batch_sizes': {str(size): count for size, count in sorted(self.batch_sizes.items())},
+            'wait': self.wait_stats.summary(),
+            'forward': self.forward_stats.summary(),
+        }
+
+
+class InferenceClient:
+    """
+    Connection to an InferenceServer (one request in flight at a time).
+    """
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET, timeout: Optional[float] = None):
+        """
+        Connect and fetch the served shapes.
+
+        Args:
+            socket_path (str): Server socket
+            timeout (float, optional): Seconds to wait for a response
+        """
+        self.socket_path = socket_path
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        self.sock.connect(socket_path)
+        self._next_id = 0
+
+        info = self.info()
+        self.input_shapes: List[Tuple] = [tuple(shape) for shape in info['input_shapes']]
+        self.num_classes = int(info['num_classes'])
+        self.backend = 'inference_server'
+        _, self.sequence_length, self.manual_size = self.input_shapes[0]
+        self.non_manual_size = self.input_shapes[1][2]
+
+    def _request(self, op: int, payload: bytes = b'') -> bytes:
+        self._next_id += 1
+        header = _REQUEST.pack(op, self._next_id, self.sequence_length if payload else 0,
+                               self.manual_size if payload else 0,
+                               self.non_manual_size if payload else 0)
+        self.sock.sendall(header + payload)
+        status, request_id, length = _RESPONSE.unpack(_recv_exact(self.sock, _RESPONSE.size))
+        body = _recv_exact(self.sock, length)
+        if status != STATUS_OK:
+            raise RuntimeError(f"Inference server error: {body.decode(errors='replace')}")
+        if request_id != self._next_id:
+            raise RuntimeError(f"Response to request {request_id}, expected {self._next_id}")
+        return body
+
+    def info(self) -> Dict:
+        """Served shapes and the server's batching statistics."""
+        return json.loads(self._request(OP_INFO))
+
+    def forward(self, manual: np.ndarray, non_manual: np.ndarray) -> np.ndarray:
+        """
+        Probabilities for one window (same contract as the exported recognizers).
+
+        Args:
+            manual (np.ndarray): (1, sequence_length, manual_size) or (sequence_length, manual_size)
+            non_manual (np.ndarray): Non-manual stream of the same window
+
+        Returns:
+            np.ndarray: (num_classes,) class probabilities
+        """
+        payload = (np.ascontiguousarray(manual, np.float32).tobytes()
+                   + np.ascontiguousarray(non_manual, np.float32).tobytes())
+        expected = 4 * self.sequence_length * (self.manual_size + self.non_manual_size)
+        if len(payload) != expected:
+            raise ValueError(f"Expected a ({self.sequence_length}, {self.manual_size} + "
+                             f"{self.non_manual_size}) window, got {np.shape(manual)} + "
+                             f"{np.shape(non_manual)}")
+        return np.frombuffer(self._request(OP_PREDICT, payload), np.float32).copy()
+
+    def predict(self, manual_input: np.ndarray, non_manual_input: np.ndarray,
+                batch_size: int = 32) -> np.ndarray:
+        """
+        Predictions for a batch, one request per window (same interface as
+        DualStreamSignRecognizer.predict).
+
+        Returns:
+            np.ndarray: (N, num_classes) class probabilities
+        """
+        return np.stack([self.forward(manual_input[i], non_manual_input[i])
+                         for i in range(len(manual_input))])
+
+    def predict_window(self, window: np.ndarray, layout: KeypointLayout = HOLISTIC_LAYOUT) -> np.ndarray:
+        """Probabilities for one (sequence_length, layout.size) window."""
+        manual, non_manual = layout.split_streams(window)
+        return self.forward(manual, non_manual)
+
+    def close(self):
+        self.sock.close()
+
+    def __enter__(self) -> 'InferenceClient':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
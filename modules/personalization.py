@@ -15,6 +15,8 @@ from typing import Dict, Optional, Tuple, List
 from datetime import datetime
 import hashlib
 
+from data_pipeline.keypoint_schema import HOLISTIC_LAYOUT
+
 
 class SignerProfile:
     """
@@ -256,7 +258,8 @@ class PersonalizationEngine:
         characteristics['signing_speed'] = 1.0 + (motion_variance / 100)
         
         # Hand size (based on hand landmark magnitudes)
-        hand_magnitude = np.abs(all_samples[:, :, :84]).mean()
+        hand_stream, _ = HOLISTIC_LAYOUT.split_streams(all_samples)
+        hand_magnitude = np.abs(hand_stream).mean()
         characteristics['hand_size'] = hand_magnitude
         
         # Motion smoothness (based on temporal consistency)
@@ -388,7 +391,7 @@ if __name__ == "__main__":
     # Add calibration samples
     print("\nAdding calibration samples...")
     for i in range(10):
-        gesture_data = np.random.randn(30, 500)  # 30 frames, 500 features
+        gesture_data = np.random.randn(30, HOLISTIC_LAYOUT.size)  # 30 frames, 1704 features
         engine.add_calibration_sample(gesture_data, i % 5, confidence=0.95)
     
     # Estimate characteristics
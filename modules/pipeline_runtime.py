@@ -0,0 +1,327 @@
+"""
+Pipelined real-time runtime: capture -> stages -> consumer.
+
+Runs frame capture and each processing stage (landmark extraction,
+inference, ...) on its own thread, connected by small bounded queues, so
+the slowest stage no longer caps every other stage and the camera never
+blocks on the model:
+
+    capture --[q]--> landmarks --[q]--> inference --[q]--> consumer (render)
+
+- Frames waiting for the first stage are dropped oldest-first when the
+  queue is full (live sources), so stages always work on fresh frames.
+- Between stages the queues block (back-pressure), so stateful stages
+  such as the streaming recognizer see every frame that was processed.
+- The output queue also drops oldest-first; the consumer (usually the
+  main/UI thread, which must own cv2.imshow or Streamlit) reads the
+  latest result with latest() or every result with get().
+- Packets older than ``max_age`` seconds are discarded before a stage.
+
+Per-stage queue depth, queue wait, processing latency, throughput and drop
+counts are exported through stats() / report().
+
+Usage:
+    runtime = PipelineRuntime(read_frame, [("landmarks", detect), ("inference", infer)])
+    with runtime:
+        while True:
+            packet = runtime.latest(timeout=1.0)
+            if packet is None and runtime.finished:
+                break
+            ...
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+_END = object()  # End-of-stream marker passed down the queues
+
+
+class FramePacket:
+    """
+    One captured frame and everything stages attach to it.
+    """
+
+    __slots__ = ('seq', 'frame', 'data', 'captured_at')
+
+    def __init__(self, seq: int, frame: Any):
+        self.seq = seq
+        self.frame = frame
+        self.data = {}
+        self.captured_at = time.perf_counter()
+
+    @property
+    def age(self) -> float:
+        """Seconds since the frame was captured."""
+        return time.perf_counter() - self.captured_at
+
+
+class StageStats:
+    """
+    Rolling timings and counters for one stage.
+    """
+
+    def __init__(self, window: int = 120):
+        self.latencies = deque(maxlen=window)
+        self.waits = deque(maxlen=window)
+        self.processed = 0
+        self.dropped = 0
+        self._lock = threading.Lock()
+
+    def record(self, latency: float, wait: float = 0.0):
+        with self._lock:
+            self.latencies.append(latency)
+            self.waits.append(wait)
+            self.processed += 1
+
+    def drop(self, count: int = 1):
+        with self._lock:
+            self.dropped += count
+
+    def summary(self) -> Dict[str, float]:
+        with self._lock:
+            latencies = np.array(self.latencies) * 1000
+            waits = np.array(self.waits) * 1000
+            processed, dropped = self.processed, self.dropped
+        return {
+            'latency_ms': float(latencies.mean()) if latencies.size else 0.0,
+            'p50_ms': float(np.percentile(latencies, 50)) if latencies.size else 0.0,
+            'p95_ms': float(np.percentile(latencies, 95)) if latencies.size else 0.0,
+            'p99_ms': float(np.percentile(latencies, 99)) if latencies.size else 0.0,
+            'wait_ms': float(waits.mean()) if waits.size else 0.0,
+            'processed': processed,
+            'dropped': dropped,
+        }
+
+
+class PipelineRuntime:
+    """
+    Capture thread plus one thread per stage, joined by bounded queues.
+    """
+
+    def __init__(self, source: Callable[[], Optional[Any]],
+                 stages: Sequence[Tuple[str, Callable[[FramePacket], Optional[FramePacket]]]],
+                 queue_size: int = 1, drop_stale: bool = True,
+                 max_age: Optional[float] = None, window: int = 120):
+        """
+        Initialize runtime (threads start with start() or ``with``).
+
+        Args:
+            source (callable): Returns the next frame, or None at end of stream
+            stages: (name, fn) pairs run in order on their own threads; fn gets a
+                FramePacket and returns it (or None to discard it)
+            queue_size (int): Capacity of every inter-stage queue (1 keeps
+                latency lowest: at most one frame waits ahead of a busy stage)
+            drop_stale (bool): Drop the oldest captured frame when the first
+                stage is busy, and the oldest result when the consumer is
+                behind (live sources); False blocks instead (recorded sources
+                that must not lose frames)
+            max_age (float, optional): Discard packets older than this many
+                seconds before running a stage
+            window (int): Number of recent packets the stats average over
+                (benchmarks pass the stream length to cover the whole run)
+        """
+        self.source = source
+        self.stages = list(stages)
+        self.drop_stale = drop_stale
+        self.max_age = max_age
+        # queues[i] feeds stage i; queues[-1] feeds the consumer
+        self.queues = [queue.Queue(maxsize=queue_size) for _ in range(len(self.stages) + 1)]
+        self.stats_by_stage = {name: StageStats(window)
+                               for name in ['capture'] + [name for name, _ in self.stages]}
+        self.end_to_end = StageStats(window)
+        self._consumer_stats = {}
+        self._window = window
+        self._threads: List[threading.Thread] = []
+        self._running = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._started_at = None
+        self.finished = False
+
+    # ---------------------------------------------------------------- threads
+
+    def start(self) -> 'PipelineRuntime':
+        """Start the capture and stage threads."""
+        self._running.set()
+        self._started_at = time.perf_counter()
+        self._threads = [threading.Thread(target=self._capture_loop, name='capture', daemon=True)]
+        for index, (name, fn) in enumerate(self.stages):
+            self._threads.append(threading.Thread(
+                target=self._stage_loop, args=(index, name, fn), name=name, daemon=True
+            ))
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def stop(self, timeout: float = 2.0):
+        """Stop all threads and wait for them to exit."""
+        self._running.clear()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def __enter__(self) -> 'PipelineRuntime':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def _put(self, q: queue.Queue, item, drop_oldest: bool, stats: StageStats):
+        """Put item on q, either evicting the oldest entry or waiting for room."""
+        drop_oldest = drop_oldest and item is not _END
+        while self._running.is_set():
+            try:
+                if drop_oldest:
+                    q.put_nowait(item)
+                else:
+                    q.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                if drop_oldest:
+                    try:
+                        q.get_nowait()
+                        stats.drop()
+                    except queue.Empty:
+                        pass
+
+    def _fail(self, error: BaseException):
+        self._error = error
+        self._running.clear()
+
+    def _capture_loop(self):
+        stats = self.stats_by_stage['capture']
+        seq = 0
+        try:
+            while self._running.is_set():
+                start = time.perf_counter()
+                frame = self.source()
+                if frame is None:
+                    break
+                stats.record(time.perf_counter() - start)
+                self._put(self.queues[0], FramePacket(seq, frame), self.drop_stale, stats)
+                seq += 1
+        except BaseException as error:
+            self._fail(error)
+        self._put(self.queues[0], _END, False, stats)
+
+    def _stage_loop(self, index: int, name: str, fn: Callable):
+        stats = self.stats_by_stage[name]
+        inbox, outbox = self.queues[index], self.queues[index + 1]
+        is_last = index == len(self.stages) - 1
+        try:
+            while self._running.is_set():
+                wait_start = time.perf_counter()
+                try:
+                    packet = inbox.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if packet is _END:
+                    break
+                if self.max_age is not None and packet.age > self.max_age:
+                    stats.drop()
+                    continue
+
+                start = time.perf_counter()
+                packet = fn(packet)
+                stats.record(time.perf_counter() - start, start - wait_start)
+                if packet is not None:
+                    # The consumer only wants the newest result (live sources);
+                    # inner stages apply back-pressure
+                    self._put(outbox, packet, is_last and self.drop_stale, stats)
+        except BaseException as error:
+            self._fail(error)
+        self._put(outbox, _END, False, stats)
+
+    # --------------------------------------------------------------- consumer
+
+    def _check_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def get(self, timeout: Optional[float] = None) -> Optional[FramePacket]:
+        """
+        Next processed packet, in order.
+
+        Returns:
+            FramePacket or None: None on timeout or at end of stream (then
+                ``finished`` is True)
+        """
+        self._check_error()
+        if self.finished:
+            return None
+        try:
+            packet = self.queues[-1].get(timeout=timeout)
+        except queue.Empty:
+            self._check_error()
+            return None
+        if packet is _END:
+            self.finished = True
+            self._check_error()
+            return None
+        self.end_to_end.record(packet.age)
+        return packet
+
+    def latest(self, timeout: Optional[float] = None) -> Optional[FramePacket]:
+        """Newest processed packet, discarding older ones (counted as render drops)."""
+        packet = self.get(timeout)
+        while packet is not None and not self.queues[-1].empty():
+            newer = self.get(timeout=0)
+            if newer is None:
+                break
+            self._consumer('render').drop()
+            packet = newer
+        return packet
+
+    def _consumer(self, name: str) -> StageStats:
+        if name not in self._consumer_stats:
+            self._consumer_stats[name] = StageStats(self._window)
+        return self._consumer_stats[name]
+
+    def record(self, name: str, seconds: float):
+        """Record time the consumer spent in its own stage (e.g. 'render')."""
+        self._consumer(name).record(seconds)
+
+    # ------------------------------------------------------------------ stats
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Per-stage metrics.
+
+        Returns:
+            Dict[str, Dict]: stage -> latency_ms, p50/p95/p99_ms, wait_ms, processed,
+                dropped, queue_depth (items waiting for the stage) and fps;
+                plus 'end_to_end' (capture to consumer latency)
+        """
+        elapsed = max(time.perf_counter() - (self._started_at or time.perf_counter()), 1e-9)
+        stats = {}
+        for index, name in enumerate(self.stats_by_stage):
+            summary = self.stats_by_stage[name].summary()
+            # Capture has no input queue; stage i reads queues[i - 1]
+            summary['queue_depth'] = self.queues[index - 1].qsize() if index else 0
+            summary['fps'] = summary['processed'] / elapsed
+            stats[name] = summary
+        for name, consumer in self._consumer_stats.items():
+            summary = consumer.summary()
+            summary['queue_depth'] = self.queues[-1].qsize()
+            summary['fps'] = summary['processed'] / elapsed
+            stats[name] = summary
+        stats['end_to_end'] = self.end_to_end.summary()
+        return stats
+
+    def report(self) -> str:
+        """Multi-line table of stats()."""
+        lines = [f"{'stage':>12s} {'latency':>9s} {'p95':>8s} {'wait':>8s} "
+                 f"{'depth':>5s} {'fps':>6s} {'done':>6s} {'dropped':>7s}"]
+        for name, s in self.stats().items():
+            lines.append(
+                f"{name:>12s} {s['latency_ms']:7.1f}ms {s['p95_ms']:6.1f}ms {s['wait_ms']:6.1f}ms "
+                f"{s.get('queue_depth', 0):5d} {s.get('fps', 0.0):6.1f} "
+                f"{s['processed']:6d} {s['dropped']:7d}"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,274 @@
+"""
+MediaPipe quality tiers and adaptive tier control.
+
+Landmark detection is the most expensive per-frame stage, and what a kiosk
+can afford depends on its CPU. Three detector configurations, from best
+landmarks to cheapest:
+
+- 'full':     Holistic, model_complexity=1 (previous fixed setting)
+- 'lite':     Holistic, model_complexity=0 (lighter pose/ROI model)
+- 'face_off': Hands + Pose solutions only, no 468-point face mesh; the
+              face segment of the keypoint vector stays zero, so models
+              relying on non-manual markers lose accuracy on this tier
+
+A deployment picks its tier with the OMNISIGN_QUALITY_TIER environment
+variable (or per call). AdaptiveQualityController steps down a tier when
+the measured per-frame detector latency exceeds the frame budget, steps
+back up when there is headroom, and logs every change with a timestamp.
+TieredDetector wraps it behind the usual ``process(image)`` interface.
+
+Usage:
+    detector = TieredDetector(AdaptiveQualityController(target_fps=30),
+                              lambda tier: create_detector(tier))
+    results = detector.process(rgb_frame)  # Timed; may switch tier
+"""
+
+import os
+import time
+from collections import deque
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Callable, Dict, Optional, Sequence
+
+import numpy as np
+
+try:
+    from mediapipe.solutions import holistic as mp_holistic, hands as mp_hands, pose as mp_pose
+except (ImportError, AttributeError):
+    mp_holistic = mp_hands = mp_pose = None
+
+
+QUALITY_TIERS = {
+    'full': {'model_complexity': 1, 'face': True},
+    'lite': {'model_complexity': 0, 'face': True},
+    'face_off': {'model_complexity': 0, 'face': False},
+}
+TIER_ORDER = ('full', 'lite', 'face_off')  # Best quality first
+DEFAULT_TIER = os.environ.get('OMNISIGN_QUALITY_TIER', 'full')
+
+# Pose landmark indices of the wrists
+_LEFT_WRIST, _RIGHT_WRIST = 15, 16
+
+
+def check_tier(tier: str) -> str:
+    """Return tier, or raise ValueError if it is not a known quality tier."""
+    if tier not in QUALITY_TIERS:
+        raise ValueError(f"Unknown quality tier '{tier}', expected one of {TIER_ORDER}")
+    return tier
+
+
+class HandsPoseDetector:
+    """
+    Holistic-compatible detector built from the Hands and Pose solutions,
+    skipping the face mesh. Results expose left/right_hand_landmarks,
+    pose_landmarks and face_landmarks (always None).
+    """
+
+    def __init__(self, model_complexity: int = 0, min_detection_confidence: float = 0.5,
+                 min_tracking_confidence: float = 0.5, static_image_mode: bool = False):
+        self.hands = mp_hands.Hands(
+            static_image_mode=static_image_mode, max_num_hands=2,
+            model_complexity=model_complexity,
+            min_detection_confidence=min_detection_confidence,
+            min_tracking_confidence=min_tracking_confidence
+        )
+        self.pose = mp_pose.Pose(
+            static_image_mode=static_image_mode, model_complexity=model_complexity,
+            min_detection_confidence=min_detection_confidence,
+            min_tracking_confidence=min_tracking_confidence
+        )
+
+    def process(self, image: np.ndarray) -> SimpleNamespace:
+        """Detect hands and pose in an RGB image."""
+        hands = self.hands.process(image)
+        pose = self.pose.process(image)
+        left = right = None
+        for landmarks, handedness in zip(hands.multi_hand_landmarks or [],
+                                         hands.multi_handedness or []):
+            if pose.pose_landmarks:
+                # Assign like Holistic does: to the nearer pose wrist
+                wrist = landmarks.landmark[0]
+                left_wrist = pose.pose_landmarks.landmark[_LEFT_WRIST]
+                right_wrist = pose.pose_landmarks.landmark[_RIGHT_WRIST]
+                is_left = ((wrist.x - left_wrist.x) ** 2 + (wrist.y - left_wrist.y) ** 2 <
+                           (wrist.x - right_wrist.x) ** 2 + (wrist.y - right_wrist.y) ** 2)
+            else:
+                # Hands labels assume a mirrored image, so they are swapped
+                # relative to Holistic's subject-side hands
+                is_left = handedness.classification[0].label == 'Right'
+            if is_left:
+                left = landmarks
+            else:
+                right = landmarks
+        return SimpleNamespace(left_hand_landmarks=left, right_hand_landmarks=right,
+                               face_landmarks=None, pose_landmarks=pose.pose_landmarks)
+
+    def close(self):
+        self.hands.close()
+        self.pose.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def create_detector(tier: str = DEFAULT_TIER, min_detection_confidence: float = 0.5,
+                    min_tracking_confidence: float = 0.5, static_image_mode: bool = False):
+    """
+    Create the MediaPipe detector for a quality tier.
+
+    Returns:
+        Holistic or HandsPoseDetector, usable as a context manager
+
+    Raises:
+        ValueError: If the tier is unknown
+        RuntimeError: If MediaPipe is not available
+    """
+    config = QUALITY_TIERS[check_tier(tier)]
+    if mp_holistic is None:
+        raise RuntimeError("MediaPipe is not available")
+    if not config['face']:
+        return HandsPoseDetector(config['model_complexity'], min_detection_confidence,
+                                 min_tracking_confidence, static_image_mode)
+    return mp_holistic.Holistic(
+        static_image_mode=static_image_mode,
+        model_complexity=config['model_complexity'],
+        smooth_landmarks=True,
+        min_detection_confidence=min_detection_confidence,
+        min_tracking_confidence=min_tracking_confidence
+    )
+
+
+class AdaptiveQualityController:
+    """
+    Steps between quality tiers based on measured per-frame latency.
+    """
+
+    def __init__(self, initial_tier: str = DEFAULT_TIER, target_fps: float = 30.0,
+                 tiers: Sequence[str] = TIER_ORDER, window: int = 30,
+                 upgrade_ratio: float = 0.6, cooldown: float = 3.0,
+                 log_path: Optional[str] = None):
+        """
+        Initialize controller.
+
+        Args:
+            initial_tier (str): Tier to start in
+            target_fps (float): Frame rate whose frame time is the latency budget
+            tiers (Sequence[str]): Allowed tiers, best quality first
+            window (int): Frames averaged before deciding (reset on every change)
+            upgrade_ratio (float): Step up when mean latency is below this share
+                of the budget
+            cooldown (float): Minimum seconds between changes; doubled each time
+                an upgrade has to be reverted, to stop flapping
+            log_path (str, optional): Also append tier changes to this file
+        """
+        self.tiers = [check_tier(tier) for tier in tiers]
+        self.index = self.tiers.index(check_tier(initial_tier))
+        self.budget = 1.0 / target_fps
+        self.upgrade_ratio = upgrade_ratio
+        self.base_cooldown = self.cooldown = cooldown
+        self.log_path = log_path
+        self.events = []
+        self._latencies = deque(maxlen=window)
+        self._last_change = time.monotonic()
+        self._last_was_upgrade = False
+
+    @property
+    def tier(self) -> str:
+        return self.tiers[self.index]
+
+    def record(self, latency: float) -> Optional[str]:
+        """
+        Record one frame's latency (seconds).
+
+        Returns:
+            str or None: The new tier if this frame triggered a change
+        """
+        self._latencies.append(latency)
+        now = time.monotonic()
+        if len(self._latencies) < self._latencies.maxlen or now - self._last_change < self.cooldown:
+            return None
+
+        mean = float(np.mean(self._latencies))
+        if mean > self.budget and self.index < len(self.tiers) - 1:
+            if self._last_was_upgrade and now - self._last_change < 2 * self.cooldown:
+                self.cooldown *= 2  # The upgrade did not fit the budget: wait longer next time
+            return self._change(self.index + 1, mean, now, upgrade=False)
+        if mean < self.upgrade_ratio * self.budget and self.index > 0:
+            return self._change(self.index - 1, mean, now, upgrade=True)
+        if self._last_was_upgrade and now - self._last_change > 10 * self.cooldown:
+            self.cooldown = self.base_cooldown  # Upgrade held: forget past flapping
+        return None
+
+    def _change(self, index: int, mean: float, now: float, upgrade: bool) -> str:
+        event = {
+            'time': datetime.now().isoformat(timespec='milliseconds'),
+            'from': self.tier,
+            'to': self.tiers[index],
+            'mean_ms': 1000 * mean,
+            'budget_ms': 1000 * self.budget,
+        }
+        self.events.append(event)
+        line = (f"[{event['time']}] Quality tier {event['from']} -> {event['to']} "
+                f"(mean {event['mean_ms']:.1f} ms, budget {event['budget_ms']:.1f} ms)")
+        print(line)
+        if self.log_path:
+            with open(self.log_path, 'a', encoding='utf-8') as f:
+                f.write(line + "\n")
+
+        self.index = index
+        self._latencies.clear()
+        self._last_change = now
+        self._last_was_upgrade = upgrade
+        return self.tier
+
+
+class TieredDetector:
+    """
+    Detector that times every process() call and follows a controller's tier.
+
+    Detectors are created on first use of a tier and kept, so switching back
+    is instant (at the cost of keeping both models loaded).
+    """
+
+    def __init__(self, controller: AdaptiveQualityController,
+                 factory: Callable[[str], object] = create_detector):
+        """
+        Args:
+            controller (AdaptiveQualityController): Decides the tier
+            factory (callable): tier -> detector with a process(image) method
+        """
+        self.controller = controller
+        self.factory = factory
+        self._detectors: Dict[str, object] = {}
+
+    @property
+    def tier(self) -> str:
+        return self.controller.tier
+
+    def _detector(self, tier: str):
+        if tier not in self._detectors:
+            self._detectors[tier] = self.factory(tier)
+        return self._detectors[tier]
+
+    def process(self, image: np.ndarray):
+        """Run the current tier's detector and feed its latency to the controller."""
+        detector = self._detector(self.controller.tier)
+        start = time.perf_counter()
+        results = detector.process(image)
+        self.controller.record(time.perf_counter() - start)
+        return results
+
+    def close(self):
+        for detector in self._detectors.values():
+            if hasattr(detector, 'close'):
+                detector.close()
+        self._detectors.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
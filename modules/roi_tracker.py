@@ -0,0 +1,198 @@
+"""
+Region-of-interest tracking for landmark detection.
+
+The signer usually occupies a stable part of a 640x480 frame. RoiTracker
+crops the next frame to the region around the previous frame's pose,
+face and hand landmarks (plus a margin), optionally downscales the crop,
+runs the detector on it, and maps the landmarks back into full-frame
+normalized coordinates, so callers see ordinary full-frame results.
+
+- The region only changes when the landmarks leave its inner part or it
+  becomes much larger than needed, so the detector's own tracking and
+  smoothing are not disturbed by a crop that moves every frame.
+- When nothing is detected in the crop (track loss), the next frame is
+  processed full-frame; a full-frame pass is also forced every
+  ``refresh_every`` frames to pick up a second person or hand entering.
+
+Usage:
+    tracker = RoiTracker()
+    results = tracker.process(holistic, frame)   # BGR frame in, full-frame results out
+"""
+
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+
+# Landmark lists of Holistic results the region is built from and mapped back
+_RESULT_FIELDS = ('pose_landmarks', 'face_landmarks', 'left_hand_landmarks', 'right_hand_landmarks')
+# Upper-body pose points (head to hands); legs are usually out of frame
+_UPPER_BODY = range(0, 23)
+# Wrist and hand points of the pose: kept even at low visibility, since a hand
+# leaving the crop is still extrapolated there and pulls the region outwards
+_POSE_HANDS = range(15, 23)
+# Longer side crops are downscaled to by default: Holistic's models take
+# 224-256 px inputs, so larger crops mostly add resize and conversion time
+DEFAULT_MAX_SIDE = 320
+
+
+class RoiTracker:
+    """
+    Crops detection input to the signer and maps results back.
+    """
+
+    def __init__(self, margin: float = 0.15, min_size: float = 0.3,
+                 max_side: Optional[int] = DEFAULT_MAX_SIDE, shrink_ratio: float = 0.6,
+                 refresh_every: int = 90, min_visibility: float = 0.5):
+        """
+        Initialize tracker.
+
+        Args:
+            margin (float): Padding around the landmarks' bounding box, as a
+                fraction of the frame size
+            min_size (float): Minimum region width/height, as a fraction of the frame
+            max_side (int, optional): Downscale crops whose longer side exceeds
+                this many pixels (None: detect at full resolution); full-frame
+                passes are never downscaled
+            shrink_ratio (float): Re-fit the region when the needed box covers
+                less than this share of its area
+            refresh_every (int): Force a full-frame pass every N frames (0: never)
+            min_visibility (float): Pose points below this visibility are ignored
+        """
+        self.margin = margin
+        self.min_size = min_size
+        self.max_side = max_side
+        self.shrink_ratio = shrink_ratio
+        self.refresh_every = refresh_every
+        self.min_visibility = min_visibility
+        self.reset()
+
+    def reset(self):
+        """Forget the region; the next frame is processed full-frame."""
+        self.roi = None  # (x0, y0, x1, y1) in normalized full-frame coordinates
+        self.frames = 0
+        self.full_frames = 0
+        self.losses = 0
+        self._since_full = 0
+
+    # ----------------------------------------------------------- geometry
+
+    def crop(self, frame: np.ndarray) -> Tuple[np.ndarray, Tuple[float, float, float, float]]:
+        """
+        Cut the current region out of a frame.
+
+        Returns:
+            Tuple[image, roi]: Crop (possibly downscaled), or the unscaled full
+                frame when there is no region or a refresh is due, and the
+                region it covers
+        """
+        self.frames += 1
+        self._since_full += 1
+        if self.roi is None or (self.refresh_every and self._since_full >= self.refresh_every):
+            self.full_frames += 1
+            self._since_full = 0
+            roi = (0.0, 0.0, 1.0, 1.0)
+            image = frame
+        else:
+            roi = self.roi
+            h, w = frame.shape[:2]
+            x0, y0 = int(roi[0] * w), int(roi[1] * h)
+            x1, y1 = int(np.ceil(roi[2] * w)), int(np.ceil(roi[3] * h))
+            image = frame[y0:y1, x0:x1]
+            # Pixel-aligned region actually cut
+            roi = (x0 / w, y0 / h, x1 / w, y1 / h)
+
+            # Only crops are downscaled: full-frame passes (first frame, track
+            # loss, refresh) see the camera resolution, as without tracking
+            if self.max_side and max(image.shape[:2]) > self.max_side:
+                scale = self.max_side / max(image.shape[:2])
+                image = cv2.resize(image, (max(1, int(image.shape[1] * scale)),
+                                           max(1, int(image.shape[0] * scale))),
+                                   interpolation=cv2.INTER_AREA)
+        return image, roi
+
+    @staticmethod
+    def map_back(results, roi: Tuple[float, float, float, float]):
+        """Convert landmarks detected in a crop to full-frame normalized coordinates, in place."""
+        x0, y0, x1, y1 = roi
+        if (x0, y0, x1, y1) == (0.0, 0.0, 1.0, 1.0) or results is None:
+            return results
+        width, height = x1 - x0, y1 - y0
+        for field in _RESULT_FIELDS:
+            landmark_list = getattr(results, field, None)
+            if not landmark_list:
+                continue
+            for lm in landmark_list.landmark:
+                lm.x = x0 + lm.x * width
+                lm.y = y0 + lm.y * height
+                lm.z = lm.z * width  # z shares the x scale (image width)
+        return results
+
+    def _needed_box(self, results) -> Optional[np.ndarray]:
+        """Bounding box of the detected signer in full-frame coordinates, or None."""
+        points = []
+        pose = getattr(results, 'pose_landmarks', None)
+        if pose:
+            points.extend((lm.x, lm.y) for i, lm in enumerate(pose.landmark)
+                          if i in _POSE_HANDS or
+                          (i in _UPPER_BODY and lm.visibility >= self.min_visibility))
+        for field in _RESULT_FIELDS[1:]:
+            landmark_list = getattr(results, field, None)
+            if landmark_list:
+                points.extend((lm.x, lm.y) for lm in landmark_list.landmark)
+        if not points:
+            return None
+        points = np.clip(np.array(points), 0.0, 1.0)
+        return np.concatenate([points.min(axis=0), points.max(axis=0)])
+
+    def update(self, results):
+        """Choose the next frame's region from full-frame results."""
+        box = self._needed_box(results)
+        if box is None:
+            if self.roi is not None:
+                self.losses += 1
+            self.roi = None  # Track lost: full frame next time
+            return
+
+        if self.roi is not None:
+            roi = np.array(self.roi)
+            inner = roi + np.array([1, 1, -1, -1]) * self.margin / 2
+            inside = np.all(box[:2] >= inner[:2]) and np.all(box[2:] <= inner[2:])
+            needed_area = np.prod(box[2:] - box[:2] + 2 * self.margin)
+            if inside and needed_area >= self.shrink_ratio * np.prod(roi[2:] - roi[:2]):
+                return  # Still a good fit: keep the crop stable
+
+        lo, hi = box[:2] - self.margin, box[2:] + self.margin
+        # Grow small regions around their centre
+        short = hi - lo < self.min_size
+        centre = (lo + hi) / 2
+        lo = np.where(short, centre - self.min_size / 2, lo)
+        hi = np.where(short, centre + self.min_size / 2, hi)
+        self.roi = tuple(float(v) for v in np.concatenate([np.maximum(lo, 0.0), np.minimum(hi, 1.0)]))
+
+    # ----------------------------------------------------------- pipeline
+
+    def process(self, detector, frame: np.ndarray, to_rgb: bool = True):
+        """
+        Detect on the current region of a frame.
+
+        Args:
+            detector: Object with process(image) (Holistic, TieredDetector, ...)
+            frame (np.ndarray): Full frame (BGR if to_rgb)
+            to_rgb (bool): Convert the crop from BGR before detection
+
+        Returns:
+            Detector results with landmarks in full-frame coordinates
+        """
+        image, roi = self.crop(frame)
+        if to_rgb:
+            image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        results = self.map_back(detector.process(image), roi)
+        self.update(results)
+        return results
+
+    @property
+    def crop_share(self) -> float:
+        """Share of frames processed on a crop instead of the full frame."""
+        return 1 - self.full_frames / self.frames if self.frames else 0.0
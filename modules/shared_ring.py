@@ -0,0 +1,291 @@
+"""
+Shared-memory ring buffer for landmark frames between processes.
+
+Handing a (30, 1704) window from a capture process to a model process
+through multiprocessing.Queue pickles, pipes and unpickles about 200 KB
+per inference. SharedFrameRing keeps the last ``capacity`` fixed-shape
+frames in one multiprocessing.shared_memory block instead: the producer
+writes each frame once (one copy of ~7 KB), consumers in other processes
+read frames or whole windows straight out of the block.
+
+- Every frame gets a sequence number. Each slot records the sequence
+  number of the frame it holds, written after the frame data, so a reader
+  can tell whether the frame it copied was overwritten meanwhile.
+- A single producer never waits: a consumer that falls more than
+  ``capacity`` frames behind has been overrun. read() then skips ahead to
+  the oldest frame still held and counts the frames lost
+  (RingReader.overruns / RingReader.lost).
+- Like StreamingRecognizer's ring, each frame is stored twice (slots i and
+  i + capacity), so the latest window of up to ``capacity`` frames is
+  always one contiguous block: window(copy=False) returns a view into
+  shared memory without copying, valid until is_current() says otherwise.
+
+Readers poll (there is no cross-process condition variable): the sleep
+between checks starts at 50 us and doubles up to ``poll_interval``, so a
+reader waiting for a 30 fps camera wakes up a few dozen times per frame.
+Sequence checks rely on stores becoming visible in program order (as on
+x86).
+
+Usage:
+    ring = SharedFrameRing.create(capacity=64)        # capture process
+    ring.write(extract_keypoints(results))
+
+    ring = SharedFrameRing.attach(name)               # model process
+    reader = ring.reader()
+    seq, frame = reader.read(timeout=1.0)
+    end_seq, window = ring.window(30)
+"""
+
+import sys
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import Optional, Tuple
+
+import numpy as np
+
+from data_pipeline.keypoint_schema import HOLISTIC_LAYOUT
+
+_MAGIC = 0x4F4D4E4953474E31  # "OMNISGN1"
+_HEADER_FIELDS = 8  # magic, capacity, write_seq, ndim, shape[0..3]
+_MAX_DIMS = 4
+_WRITE_SEQ = 2
+
+
+class SharedFrameRing:
+    """
+    Single-producer, multi-consumer ring of float32 frames in shared memory.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        """Use create() or attach()."""
+        self.shm = shm
+        self.owner = owner
+        header = np.ndarray((_HEADER_FIELDS,), np.int64, shm.buf)
+        if header[0] != _MAGIC:
+            raise ValueError(f"Shared memory '{shm.name}' is not a SharedFrameRing")
+        self.capacity = int(header[1])
+        ndim = int(header[3])
+        self.frame_shape = tuple(int(n) for n in header[4:4 + ndim])
+
+        offset = header.nbytes
+        self._header = header
+        self._slot_seq = np.ndarray((self.capacity,), np.int64, shm.buf, offset)
+        offset += self._slot_seq.nbytes
+        self._timestamps = np.ndarray((self.capacity,), np.float64, shm.buf, offset)
+        offset += self._timestamps.nbytes
+        self._frames = np.ndarray((2 * self.capacity,) + self.frame_shape, np.float32, shm.buf, offset)
+
+    @staticmethod
+    def _size(capacity: int, frame_shape: Tuple[int, ...]) -> int:
+        return 8 * (_HEADER_FIELDS + 2 * capacity) + 4 * 2 * capacity * int(np.prod(frame_shape))
+
+    @classmethod
+    def create(cls, frame_shape: Tuple[int, ...] = (HOLISTIC_LAYOUT.size,), capacity: int = 64,
+               name: Optional[str] = None) -> 'SharedFrameRing':
+        """
+        Allocate a new ring (the producer side; unlink() it when done).
+
+        Args:
+            frame_shape (tuple): Shape of one float32 frame
+            capacity (int): Frames held (also the longest window)
+            name (str, optional): Shared memory name (default: generated)
+        """
+        if not 1 <= len(frame_shape) <= _MAX_DIMS:
+            raise ValueError(f"frame_shape must have 1-{_MAX_DIMS} dimensions, got {frame_shape}")
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got {capacity}")
+        shm = shared_memory.SharedMemory(name=name, create=True, size=cls._size(capacity, frame_shape))
+        header = np.ndarray((_HEADER_FIELDS,), np.int64, shm.buf)
+        header[:] = 0
+        header[1] = capacity
+        header[3] = len(frame_shape)
+        header[4:4 + len(frame_shape)] = frame_shape
+        np.ndarray((capacity,), np.int64, shm.buf, header.nbytes)[:] = -1  # Empty slots
+        header[0] = _MAGIC
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> 'SharedFrameRing':
+        """Open an existing ring by name (the consumer side)."""
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            shm = shared_memory.SharedMemory(name=name)
+            # The creating process owns the block: without this, the resource
+            # tracker unlinks it when the first attached process exits
+            resource_tracker.unregister(shm._name, 'shared_memory')
+        return cls(shm, owner=False)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    @property
+    def write_seq(self) -> int:
+        """Sequence number the next frame will get (= frames written)."""
+        return int(self._header[_WRITE_SEQ])
+
+    @property
+    def oldest_seq(self) -> int:
+        """Sequence number of the oldest frame still held."""
+        return max(0, self.write_seq - self.capacity)
+
+    def write(self, frame: np.ndarray, timestamp: Optional[float] = None) -> int:
+        """
+        Append one frame (producer only; never blocks).
+
+        Args:
+            frame (np.ndarray): frame_shape values
+            timestamp (float, optional): Capture time (default: time.perf_counter())
+
+        Returns:
+            int: The frame's sequence number
+        """
+        seq = self.write_seq
+        slot = seq % self.capacity
+        self._slot_seq[slot] = -1  # Being written
+        self._frames[slot] = frame
+        self._frames[slot + self.capacity] = frame
+        self._timestamps[slot] = time.perf_counter() if timestamp is None else timestamp
+        self._slot_seq[slot] = seq
+        self._header[_WRITE_SEQ] = seq + 1
+        return seq
+
+    def is_current(self, seq: int) -> bool:
+        """Whether frame `seq` is still held (not yet overwritten)."""
+        return seq >= 0 and int(self._slot_seq[seq % self.capacity]) == seq
+
+    def timestamp(self, seq: int) -> float:
+        """Capture time of a held frame."""
+        return float(self._timestamps[seq % self.capacity])
+
+    def window(self, length: int, copy: bool = True,
+               out: Optional[np.ndarray] = None) -> Optional[Tuple[int, np.ndarray]]:
+        """
+        Latest `length` frames, oldest first.
+
+        Args:
+            length (int): Frames (at most capacity)
+            copy (bool): Copy out of shared memory (into `out` if given);
+                False returns a zero-copy view - check is_current(end_seq -
+                length + 1) after using it
+            out (np.ndarray, optional): (length, *frame_shape) float32 buffer
+
+        Returns:
+            tuple or None: (sequence number of the newest frame, window), or
+                None until `length` frames were written or when the window
+                was overwritten while being copied
+        """
+        if not 1 <= length <= self.capacity:
+            raise ValueError(f"length must be in 1..{self.capacity}, got {length}")
+        end = self.write_seq - 1
+        first = end - length + 1
+        if first < 0:
+            return None
+        start = first % self.capacity
+        view = self._frames[start:start + length]
+        if not copy:
+            return end, view
+        if out is None:
+            out = np.empty_like(view)
+        out[:] = view
+        # The oldest frame is overwritten first: intact if it is still held
+        return (end, out) if self.is_current(first) else None
+
+    def reader(self, start: str = 'next', poll_interval: float = 0.002) -> 'RingReader':
+        """
+        Cursor for reading every frame in order.
+
+        Args:
+            start (str): 'next' (frames written from now on), 'oldest' (every
+                frame still held) or 'latest' (the newest frame first)
+            poll_interval (float): Longest sleep between checks while waiting
+        """
+        write_seq = self.write_seq
+        positions = {'next': write_seq,
+                     'oldest': self.oldest_seq,
+                     'latest': max(0, write_seq - 1)}
+        if start not in positions:
+            raise ValueError(f"start must be one of {tuple(positions)}, got '{start}'")
+        return RingReader(self, positions[start], poll_interval)
+
+    def close(self):
+        """Detach from the shared memory (views into it become invalid)."""
+        self._header = self._slot_seq = self._timestamps = self._frames = None
+        self.shm.close()
+
+    def unlink(self):
+        """Free the shared memory (creator only, after every process closed it)."""
+        if self.owner:
+            # Attached processes spawned from this one share its resource
+            # tracker and may have unregistered the name already
+            resource_tracker.register(self.shm._name, 'shared_memory')
+            self.shm.unlink()
+
+    def __enter__(self) -> 'SharedFrameRing':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        self.unlink()
+
+
+class RingReader:
+    """
+    One consumer's position in a SharedFrameRing.
+    """
+
+    def __init__(self, ring: SharedFrameRing, next_seq: int, poll_interval: float = 0.002):
+        self.ring = ring
+        self.next_seq = next_seq
+        self.poll_interval = poll_interval
+        self.overruns = 0  # Times the producer lapped this reader
+        self.lost = 0      # Frames skipped because of overruns
+
+    def _skip_to_oldest(self):
+        oldest = self.ring.oldest_seq
+        if oldest > self.next_seq:
+            self.overruns += 1
+            self.lost += oldest - self.next_seq
+            self.next_seq = oldest
+
+    @property
+    def pending(self) -> int:
+        """Frames written but not read yet."""
+        return self.ring.write_seq - self.next_seq
+
+    def read(self, timeout: Optional[float] = None,
+             out: Optional[np.ndarray] = None) -> Optional[Tuple[int, np.ndarray]]:
+        """
+        Next frame in sequence order, waiting for it if necessary.
+
+        Args:
+            timeout (float, optional): Seconds to wait (None waits forever, 0 polls once)
+            out (np.ndarray, optional): frame_shape float32 buffer to copy into
+
+        Returns:
+            tuple or None: (sequence number, frame copy), None on timeout
+        """
+        ring = self.ring
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        sleep = 0.00005
+        while True:
+            if self.next_seq < ring.write_seq:
+                if self.next_seq < ring.oldest_seq:
+                    self._skip_to_oldest()
+                seq = self.next_seq
+                slot = seq % ring.capacity
+                if out is None:
+                    frame = ring._frames[slot].copy()
+                else:
+                    frame = out
+                    frame[:] = ring._frames[slot]
+                if ring.is_current(seq):
+                    self.next_seq = seq + 1
+                    return seq, frame
+                self._skip_to_oldest()  # Overwritten while copying
+                continue
+            if deadline is not None and time.perf_counter() >= deadline:
+                return None
+            time.sleep(sleep)
+            sleep = min(2 * sleep, self.poll_interval)
@@ -0,0 +1,153 @@
+"""
+Sliding-window streaming inference for live sign recognition.
+
+Keeps the last ``sequence_length`` keypoint frames in a preallocated
+ring buffer and runs a compiled forward pass on the current window every
+``stride`` frames, instead of rebuilding a (1, 30, D) array from Python
+lists and calling Keras' ``Model.predict`` on every frame.
+
+The ring buffer stores each frame twice (at i and i + sequence_length),
+so the latest window is always one contiguous slice - no copy or
+np.roll is needed to put it in chronological order.
+"""
+
+import time
+
+import numpy as np
+from typing import List, Optional
+
+from data_pipeline.keypoint_schema import HOLISTIC_LAYOUT, KeypointLayout
+from data_pipeline.normalization import StreamingStandardizer
+
+
+class StreamingRecognizer:
+    """
+    Ring-buffered, strided inference over a dual-stream model.
+    """
+
+    def __init__(self, model, layout: KeypointLayout = HOLISTIC_LAYOUT,
+                 sequence_length: int = 30, stride: int = 1,
+                 normalizer: Optional[StreamingStandardizer] = None,
+                 jit_compile: bool = False):
+        """
+        Initialize recognizer.
+
+        Args:
+            model: Keras model taking [manual, non_manual] sequences, or an
+                exported recognizer (TFLiteSignRecognizer, SavedModelSignRecognizer)
+            layout (KeypointLayout): Layout of pushed frames
+            sequence_length (int): Frames per window
+            stride (int): Run inference every N frames (adjustable at runtime)
+            normalizer (StreamingStandardizer, optional): Training normalization,
+                applied to each frame as it is pushed
+            jit_compile (bool): XLA-compile the forward pass
+        """
+        self.model = model
+        self.layout = layout
+        self.sequence_length = sequence_length
+        self.normalizer = normalizer
+        self.stride = stride
+
+        self._ring = layout.allocate(2 * sequence_length)
+        self.frames_seen = 0
+        self._frames_since_inference = 0
+        self.last_probabilities = None
+
+        manual_slice = layout.manual_slice
+        non_manual_slice = layout.non_manual_slice
+
+        if hasattr(model, 'forward'):
+            # Exported recognizers already are a compiled batch-1 forward pass
+            # (and must not pull in TensorFlow here, see modules/inference_runtime.py)
+            self._forward = model.forward
+        else:
+            import tensorflow as tf
+            signature = [
+                tf.TensorSpec((1, sequence_length, layout.manual_size), tf.float32),
+                tf.TensorSpec((1, sequence_length, layout.non_manual_size), tf.float32),
+            ]
+
+            @tf.function(input_signature=signature, jit_compile=jit_compile)
+            def forward(manual, non_manual):
+                return model([manual, non_manual], training=False)[0]
+
+            self._forward = lambda manual, non_manual: forward(manual, non_manual).numpy()
+        self._manual_slice = manual_slice
+        self._non_manual_slice = non_manual_slice
+
+    @property
+    def stride(self) -> int:
+        return self._stride
+
+    @stride.setter
+    def stride(self, value: int):
+        if value < 1:
+            raise ValueError(f"stride must be >= 1, got {value}")
+        self._stride = int(value)
+
+    @property
+    def is_full(self) -> bool:
+        """Whether a full window has been collected."""
+        return self.frames_seen >= self.sequence_length
+
+    def window(self) -> np.ndarray:
+        """Latest (sequence_length, layout.size) frames, oldest first (a view)."""
+        start = self.frames_seen % self.sequence_length
+        return self._ring[start:start + self.sequence_length]
+
+    def reset(self):
+        """Forget buffered frames (e.g. when the signer leaves the frame)."""
+        self._ring.fill(0)
+        self.frames_seen = 0
+        self._frames_since_inference = 0
+        self.last_probabilities = None
+
+    def push(self, keypoints: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Add one frame and run inference if the window is full and due.
+
+        Args:
+            keypoints (np.ndarray): (layout.size,) frame in the recognizer's layout
+
+        Returns:
+            np.ndarray or None: Class probabilities when inference ran this frame
+        """
+        slot = self.frames_seen % self.sequence_length
+        frame = self._ring[slot]
+        frame[:] = keypoints
+        if self.normalizer is not None:
+            self.normalizer.transform(frame)
+        self._ring[slot + self.sequence_length] = frame
+
+        self.frames_seen += 1
+        self._frames_since_inference += 1
+        if not self.is_full or self._frames_since_inference < self._stride:
+            return None
+
+        self._frames_since_inference = 0
+        return self.predict_window()
+
+    def warm_up(self, steps: int = 2) -> List[float]:
+        """
+        Run the forward pass on an empty window before the first real frame
+        (the first call pays tracing / interpreter setup), then reset().
+
+        Returns:
+            list: Milliseconds per step
+        """
+        timings = []
+        for _ in range(steps):
+            start = time.perf_counter()
+            self.predict_window()
+            timings.append(1000 * (time.perf_counter() - start))
+        self.reset()
+        return timings
+
+    def predict_window(self) -> np.ndarray:
+        """Run the compiled forward pass on the current window."""
+        window = self.window()[np.newaxis]
+        probabilities = self._forward(
+            window[..., self._manual_slice], window[..., self._non_manual_slice]
+        )
+        self.last_probabilities = probabilities
+        return probabilities
@@ -0,0 +1,113 @@
+"""
+Inference on exported TFLite artifacts (see models/quantization.py).
+
+TFLiteSignRecognizer runs a ``<model>.<mode>.tflite`` artifact with the
+same predict() interface as DualStreamSignRecognizer, so OmniSignApp and
+predict_sign.py (through StreamingRecognizer) can use a quantized model in
+place of the Keras one. The interpreter has a fixed batch of 1; batches
+are predicted one window at a time.
+
+The standalone interpreter (``ai-edge-litert``, or the older
+``tflite-runtime``) is used when installed, so loading an artifact does not
+import TensorFlow; otherwise it falls back to ``tf.lite.Interpreter``.
+
+Usage:
+    recognizer = TFLiteSignRecognizer("sign_language_model.dynamic.tflite")
+    probabilities = recognizer.predict(manual_batch, non_manual_batch)
+"""
+
+import json
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+
+def is_tflite_model(path: Union[str, Path, None]) -> bool:
+    """Whether a model path points at an exported TFLite artifact."""
+    return path is not None and Path(path).suffix == '.tflite'
+
+
+def load_interpreter_class() -> Tuple[type, str]:
+    """
+    Lightest available TFLite interpreter.
+
+    Returns:
+        tuple: (Interpreter class, backend name)
+    """
+    try:
+        from ai_edge_litert.interpreter import Interpreter
+        return Interpreter, 'ai_edge_litert'
+    except ImportError:
+        pass
+    try:
+        from tflite_runtime.interpreter import Interpreter
+        return Interpreter, 'tflite_runtime'
+    except ImportError:
+        pass
+    import tensorflow as tf  # Full TensorFlow (several seconds to import)
+    return tf.lite.Interpreter, 'tensorflow'
+
+
+class TFLiteSignRecognizer:
+    """
+    Dual-stream recognizer backed by a TFLite interpreter.
+    """
+
+    def __init__(self, model_path: Union[str, Path], num_threads: Optional[int] = None):
+        """
+        Load an artifact.
+
+        Args:
+            model_path (str or Path): .tflite file written by export_tflite()
+            num_threads (int, optional): Interpreter threads (default: TFLite's choice)
+        """
+        self.model_path = Path(model_path)
+        self.metadata = {}
+        metadata_file = self.model_path.with_suffix('.json')
+        if metadata_file.exists():
+            with open(metadata_file, 'r', encoding='utf-8') as f:
+                self.metadata = json.load(f)
+
+        Interpreter, self.backend = load_interpreter_class()
+        self.interpreter = Interpreter(model_path=str(self.model_path), num_threads=num_threads)
+        self.interpreter.allocate_tensors()
+        # Inputs in [manual, non_manual] order (the manual stream is the narrower one)
+        inputs = sorted(self.interpreter.get_input_details(), key=lambda d: d['shape'][-1])
+        self._input_indices = [detail['index'] for detail in inputs]
+        self._output_index = self.interpreter.get_output_details()[0]['index']
+        self.input_shapes: List[Tuple] = [(None,) + tuple(int(n) for n in detail['shape'][1:])
+                                          for detail in inputs]
+        self.num_classes = int(self.interpreter.get_output_details()[0]['shape'][-1])
+
+    @property
+    def mode(self) -> str:
+        """Quantization mode recorded at export ('unknown' without metadata)."""
+        return self.metadata.get('mode', 'unknown')
+
+    def forward(self, manual: np.ndarray, non_manual: np.ndarray) -> np.ndarray:
+        """
+        Probabilities for one window.
+
+        Args:
+            manual (np.ndarray): (1, sequence_length, manual_features)
+            non_manual (np.ndarray): (1, sequence_length, non_manual_features)
+
+        Returns:
+            np.ndarray: (num_classes,) class probabilities
+        """
+        self.interpreter.set_tensor(self._input_indices[0], np.ascontiguousarray(manual, np.float32))
+        self.interpreter.set_tensor(self._input_indices[1], np.ascontiguousarray(non_manual, np.float32))
+        self.interpreter.invoke()
+        return self.interpreter.get_tensor(self._output_index)[0].copy()
+
+    def predict(self, manual_input: np.ndarray, non_manual_input: np.ndarray,
+                batch_size: int = 32) -> np.ndarray:
+        """
+        Predictions for a batch (same interface as DualStreamSignRecognizer.predict).
+
+        Returns:
+            np.ndarray: (N, num_classes) class probabilities
+        """
+        return np.stack([self.forward(manual_input[i:i + 1], non_manual_input[i:i + 1])
+                         for i in range(len(manual_input))])
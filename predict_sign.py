@@ -1,19 +1,53 @@
 import cv2
 import numpy as np
-from tensorflow.keras.models import load_model
 import pickle
-from collections import deque
+import os
+import time
+from contextlib import nullcontext
 from pathlib import Path
-from utils import mediapipe_detection, extract_keypoints, draw_landmarks, create_holistic
+from utils import (mediapipe_detection, extract_keypoints, draw_landmarks, create_holistic,
+                   create_adaptive_holistic)
+from data_pipeline.keypoint_schema import HOLISTIC_LAYOUT
+from data_pipeline.normalization import StreamingStandardizer, normalizer_path
+from modules.activity_gate import ActivityGate
+from modules.frame_source import DEFAULT_SOURCE, open_source
+from modules.graph_cache import GraphCache
+from modules.pipeline_runtime import PipelineRuntime
+from modules.quality_tiers import DEFAULT_TIER, TieredDetector
+from modules.roi_tracker import RoiTracker
+from modules.inference_runtime import create_stream_recognizer, load_inference_model, model_input_shapes
+from modules.inference_server import InferenceClient
 
 # Configuration
 SEQUENCE_LENGTH = 30
-KEYPOINT_DIM = 258
+KEYPOINT_DIM = HOLISTIC_LAYOUT.size
 CONFIDENCE_THRESHOLD = 0.7
+INFERENCE_STRIDE = 1  # Run the model every N frames; '[' / ']' adjust at runtime
+ACTIVITY_GATE = True  # Skip inference (and most detection) while nobody is signing
+LIGHT_IDLE_DETECTOR = True  # Cheapest detector tier (hands + pose) while idle
+QUALITY_TIER = DEFAULT_TIER  # 'full', 'lite' or 'face_off' (env OMNISIGN_QUALITY_TIER)
+ADAPTIVE_QUALITY = True  # Step the tier down/up to keep detection within the frame budget
+TARGET_FPS = 30
+ROI_TRACKING = False  # Detect on a crop around the signer, full frame on track loss
+                      # (off until benchmarks/bench_roi_tracking.py has been run on recorded clips)
+ROI_MAX_SIDE = 320  # Downscale crops to this longer side (None: full resolution)
+FRAME_SOURCE = DEFAULT_SOURCE  # Camera index, video file or landmark .npy / data dir (env OMNISIGN_SOURCE)
+GRAPH_CACHE = True  # Reuse the traced forward pass of a Keras model across restarts (env OMNISIGN_GRAPH_CACHE)
+MODEL_PATH = 'sign_language_model.h5'  # Or an exported artifact, e.g. sign_language_model.dynamic.tflite
+INFERENCE_SERVER = os.environ.get('OMNISIGN_INFERENCE_SERVER')  # serve_model.py socket; unset runs MODEL_PATH here
 
 # Load model and labels
 try:
-    model = load_model('sign_language_model.h5')
+    # Exported artifacts (.tflite, serving SavedModel) load without Keras,
+    # .tflite without TensorFlow at all (see modules/inference_runtime.py);
+    # Keras models are traced once and reloaded from the graph cache
+    if INFERENCE_SERVER:
+        # Shared, batched model process (serve_model.py); MODEL_PATH still
+        # provides the normalization statistics
+        model = InferenceClient(INFERENCE_SERVER)
+    else:
+        model = load_inference_model(MODEL_PATH, graph_cache=GraphCache() if GRAPH_CACHE else None,
+                                     layout=HOLISTIC_LAYOUT, sequence_length=SEQUENCE_LENGTH)
     with open('action_labels.pkl', 'rb') as f:
         ACTIONS = pickle.load(f)
 except Exception as e:
@@ -21,46 +55,125 @@ except Exception as e:
     print("Make sure you ran: python .\\train_model.py")
     exit(1)
 
+# Apply exactly the normalization the model was trained with
+normalizer = None
+if normalizer_path(MODEL_PATH).exists():
+    normalizer = StreamingStandardizer.load(normalizer_path(MODEL_PATH))
+else:
+    print(f"⚠️ No normalization statistics at {normalizer_path(MODEL_PATH)}; "
+          "predicting on raw keypoints")
+
+# The dual-stream model must have been trained on the shared keypoint layout
+expected_shapes = [
+    (None, SEQUENCE_LENGTH, HOLISTIC_LAYOUT.manual_size),
+    (None, SEQUENCE_LENGTH, HOLISTIC_LAYOUT.non_manual_size),
+]
+model_shapes = model_input_shapes(model)
+if model_shapes != expected_shapes:
+    print(f"❌ Model inputs {model_shapes} do not match keypoint layout "
+          f"'{HOLISTIC_LAYOUT.name}' {expected_shapes}")
+    print("Retrain with: python .\\train_model.py")
+    exit(1)
+
 print("=" * 60)
 print("REAL-TIME SIGN LANGUAGE RECOGNITION")
 print("=" * 60)
 print(f"Model loaded! Recognizing: {', '.join(ACTIONS)}")
-print("Press 'Q' to quit")
+print("Press 'Q' to quit, '[' / ']' to change the inference stride")
 print("=" * 60)
 
-# Initialize
-sequence_buffer = deque(maxlen=SEQUENCE_LENGTH)
+# Initialize: causal models advance one frame at a time with carried state,
+# bidirectional models re-run the full sliding window
+recognizer = create_stream_recognizer(model, HOLISTIC_LAYOUT, SEQUENCE_LENGTH,
+                                      stride=INFERENCE_STRIDE, normalizer=normalizer)
+# Pay tracing / interpreter setup now, not on the first sign
+warm_up_ms = recognizer.warm_up()
+print(f"Model warmed up: first pass {warm_up_ms[0]:.0f} ms, then {warm_up_ms[-1]:.0f} ms")
+gate = ActivityGate(HOLISTIC_LAYOUT) if ACTIVITY_GATE else None
+last_results = None
 prediction_text = ""
 confidence_text = ""
 
-cap = cv2.VideoCapture(0)
+cap = open_source(FRAME_SOURCE)
 if not cap.isOpened():
-    print("❌ Webcam not found!")
+    print(f"❌ Frame source '{FRAME_SOURCE}' could not be opened (webcam not found?)")
     exit(1)
+# Landmark replay: stored landmarks stand in for MediaPipe (no cropping possible)
+replay_detector = cap.detector()
+roi_tracker = RoiTracker(max_side=ROI_MAX_SIDE) if ROI_TRACKING and replay_detector is None else None
+
+
+def read_frame():
+    ret, frame = cap.read()
+    return frame if ret else None
+
+
+def detect_landmarks(packet):
+    global last_results
+    packet.data['active'] = True
+    if gate is not None and not gate.should_detect():
+        # Idle: detect on every few frames only, keep drawing the last results
+        packet.data['results'] = last_results
+        packet.data['active'] = False
+        return packet
+
+    # Lighter detector configuration until hands reappear
+    detector = holistic if gate is None or gate.active or light_holistic is None else light_holistic
+    packet.frame, results = mediapipe_detection(packet.frame, detector, roi_tracker)
+    packet.data['results'] = last_results = results
+    packet.data['keypoints'] = extract_keypoints(results)  # Fresh array: packets overlap in flight
+    if gate is not None:
+        packet.data['active'] = gate.update(packet.data['keypoints'])
+        packet.data['went_idle'] = gate.just_went_idle
+        if gate.just_woke and detector is not holistic:
+            # The light detector saw no face: detect the waking frame again
+            # before it becomes the first frame of the sign
+            packet.frame, results = mediapipe_detection(packet.frame, holistic, roi_tracker)
+            packet.data['results'] = last_results = results
+            packet.data['keypoints'] = extract_keypoints(results)
+    return packet
 
-cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+
+def run_inference(packet):
+    if packet.data.get('went_idle'):
+        recognizer.reset()  # The next sign starts from an empty window
+    if packet.data['active']:
+        # Make prediction every INFERENCE_STRIDE frames once the window is full
+        packet.data['predictions'] = recognizer.push(packet.data['keypoints'])
+    return packet
+
+
+# Capture, landmarks and inference each run on their own thread; this
+# (main) thread only renders the newest result, so the camera never waits
+# on the model and stale frames are dropped instead of queueing up
+runtime = PipelineRuntime(read_frame, [("landmarks", detect_landmarks),
+                                       ("inference", run_inference)])
+
+if replay_detector is not None:
+    detector, light_detector = replay_detector, nullcontext()
+else:
+    detector = (create_adaptive_holistic(QUALITY_TIER, TARGET_FPS) if ADAPTIVE_QUALITY
+                else create_holistic(tier=QUALITY_TIER))
+    light_detector = (create_holistic(tier='face_off') if gate is not None and LIGHT_IDLE_DETECTOR
+                      else nullcontext())
 
 try:
-    with create_holistic() as holistic:
+    with detector as holistic, light_detector as light_holistic, runtime:
         while True:
             try:
-                ret, frame = cap.read()
-                if not ret:
-                    print("Failed to read frame")
-                    break
-
-                image, results = mediapipe_detection(frame, holistic)
-                draw_landmarks(image, results)
-
-                # Extract keypoints
-                keypoints = extract_keypoints(results)
-                sequence_buffer.append(keypoints)
+                packet = runtime.latest(timeout=1.0)
+                if packet is None:
+                    if runtime.finished:
+                        print("Failed to read frame")
+                        break
+                    continue
 
-                # Make prediction when buffer is full
-                if len(sequence_buffer) == SEQUENCE_LENGTH:
-                    X = np.array([list(sequence_buffer)])
-                    predictions = model.predict(X, verbose=0)[0]
+                # Results of frames skipped by latest() are still in the recognizer
+                predictions = recognizer.last_probabilities
+                if not packet.data['active']:
+                    prediction_text = "Idle"
+                    confidence_text = "-"
+                elif predictions is not None:
                     action_idx = np.argmax(predictions)
                     confidence = predictions[action_idx]
 
@@ -71,6 +184,10 @@ try:
                         prediction_text = "Uncertain"
                         confidence_text = f"{confidence * 100:.1f}%"
 
+                render_start = time.perf_counter()
+                image = packet.frame
+                draw_landmarks(image, packet.data['results'])
+
                 # Display prediction
                 h, w = image.shape[:2]
                 cv2.rectangle(image, (10, 30), (400, 120), (0, 0, 0), -1)
@@ -102,22 +219,51 @@ try:
                     2,
                 )
 
-                # Display buffer status
+                # Display buffer status, stride and per-stage latency / queue depth
                 cv2.putText(
                     image,
-                    f"Buffer: {len(sequence_buffer)}/{SEQUENCE_LENGTH}",
+                    f"Buffer: {min(recognizer.frames_seen, SEQUENCE_LENGTH)}/{SEQUENCE_LENGTH}"
+                    f"  Stride: {recognizer.stride}",
                     (w - 250, 30),
                     cv2.FONT_HERSHEY_SIMPLEX,
                     0.6,
                     (100, 100, 255),
                     1,
                 )
+                cv2.putText(
+                    image,
+                    f"Quality: {getattr(holistic, 'tier', QUALITY_TIER)}",
+                    (w - 250, 50),
+                    cv2.FONT_HERSHEY_SIMPLEX,
+                    0.6,
+                    (100, 100, 255),
+                    1,
+                )
+                stats = runtime.stats()
+                cv2.putText(
+                    image,
+                    " ".join(f"{name[:3]} {s['latency_ms']:.0f}ms q{s['queue_depth']}"
+                             for name, s in stats.items() if name != "end_to_end")
+                    + f"  lag {stats['end_to_end']['latency_ms']:.0f}ms"
+                    + f"  {stats['landmarks']['fps']:.0f} FPS",
+                    (10, h - 15),
+                    cv2.FONT_HERSHEY_SIMPLEX,
+                    0.5,
+                    (255, 255, 255),
+                    1,
+                )
 
                 cv2.imshow("Sign Language Recognition", image)
 
                 key = cv2.waitKey(1) & 0xFF
+                runtime.record("render", time.perf_counter() - render_start)
+
                 if key == ord("q") or key == 27:  # Q or ESC
                     break
+                elif key == ord("["):
+                    recognizer.stride = max(1, recognizer.stride - 1)
+                elif key == ord("]"):
+                    recognizer.stride += 1
 
             except KeyboardInterrupt:
                 print("\nInterrupted by user")
@@ -126,6 +272,17 @@ try:
 except KeyboardInterrupt:
     print("\nClosing...")
 finally:
+    runtime.stop()
     cap.release()
     cv2.destroyAllWindows()
+    print(f"Pipeline stages (stride {recognizer.stride}):")
+    print(runtime.report())
+    if isinstance(detector, TieredDetector):
+        print(f"Quality tier changes: {len(detector.controller.events)} "
+              f"(final tier {detector.tier})")
+    if roi_tracker is not None:
+        print(f"ROI tracking: {roi_tracker.crop_share * 100:.0f}% of detections on a crop, "
+              f"{roi_tracker.losses} track losses")
+    if gate is not None:
+        print(f"Activity gate: idle {gate.idle_fraction * 100:.0f}% of detected frames")
     print("✅ Closed.")
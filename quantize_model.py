@@ -0,0 +1,176 @@
+"""
+Export a trained recognizer to quantized TFLite artifacts and report the trade-off
+
+Loads the trained Keras model, exports every requested quantization mode
+next to it (see models/quantization.py), and compares each artifact with
+the float Keras model on the held-out test split (the stratified split
+train_model.py uses):
+
+- accuracy and its delta to the Keras model, and agreement with the Keras
+  model's predicted class
+- artifact size
+- per-window latency at batch 1 (median over --repeats calls), the way
+  predict_sign.py runs the model
+
+'int8' is calibrated on windows sampled from the training split,
+normalized with the model's training statistics. --saved-model also exports
+the unconverted batch-1 serving SavedModel (<model>.serving.savedmodel),
+which loads without rebuilding the Keras model (see
+modules/inference_runtime.py). The report is printed and saved as
+<model>.quantization.json.
+
+Usage:
+    python quantize_model.py
+    python quantize_model.py --model sign_language_model.h5 --modes dynamic int8 --threads 1
+    python quantize_model.py --modes dynamic --saved-model
+"""
+
+import argparse
+import json
+import pickle
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project to path
+PROJECT_ROOT = Path(__file__).parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from data_pipeline.data_loader import DataLoader
+from data_pipeline.keypoint_schema import HOLISTIC_LAYOUT
+from data_pipeline.normalization import StreamingStandardizer, normalizer_path
+from models.quantization import (QUANTIZATION_MODES, export_saved_model, export_tflite,
+                                 representative_windows, saved_model_path, tflite_path)
+from modules.inference_runtime import SavedModelSignRecognizer
+from modules.tflite_recognizer import TFLiteSignRecognizer
+
+DEFAULT_ACTIONS = ["Hello", "How are you", "I need help", "Thank you", "Goodbye"]
+
+
+def median_latency_ms(forward, manual: np.ndarray, non_manual: np.ndarray, repeats: int) -> float:
+    """Median wall time of forward() on one window, after one warm-up call."""
+    forward(manual, non_manual)
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        forward(manual, non_manual)
+        times.append(time.perf_counter() - start)
+    return 1000 * float(np.median(times))
+
+
+def load_split(args, actions):
+    """Normalized (calibration windows, test windows, test labels)."""
+    loader = DataLoader(args.data_path, actions, convert_legacy=True)
+    X, y = loader.load_data()
+    X = np.asarray(X, np.float32)
+
+    stats_file = normalizer_path(args.model)
+    if stats_file.exists():
+        loader.normalizer = StreamingStandardizer.load(stats_file)
+        X = loader.normalize(X, fit=False)
+    else:
+        print(f"⚠️ No normalization statistics at {stats_file}; using raw keypoints")
+
+    try:
+        train_idx, _, test_idx = loader.split_indices(y)
+    except ValueError as error:
+        # Too few sequences per class for a stratified split
+        print(f"⚠️ Could not split the data ({error}); calibrating and evaluating on all of it")
+        train_idx = test_idx = np.arange(len(y))
+    return X[train_idx], X[test_idx], y[test_idx]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export quantized TFLite models and compare them")
+    parser.add_argument("--model", default="sign_language_model.h5")
+    parser.add_argument("--data-path", default="Sign_Language_Data")
+    parser.add_argument("--actions", nargs="+",
+                        help="Classes in model output order (default: action_labels.pkl)")
+    parser.add_argument("--modes", nargs="+", choices=QUANTIZATION_MODES, default=list(QUANTIZATION_MODES))
+    parser.add_argument("--calibration-samples", type=int, default=100)
+    parser.add_argument("--threads", type=int, default=1, help="TFLite interpreter threads")
+    parser.add_argument("--saved-model", action="store_true",
+                        help="Also export the frozen serving SavedModel")
+    parser.add_argument("--repeats", type=int, default=50, help="Timed calls per model")
+    args = parser.parse_args()
+
+    if not Path(args.model).exists():
+        print(f"❌ Model not found: {args.model} (train it with: python train_model.py)")
+        sys.exit(1)
+
+    actions = args.actions
+    if actions is None and Path("action_labels.pkl").exists():
+        with open("action_labels.pkl", "rb") as f:
+            actions = pickle.load(f)
+    actions = actions or DEFAULT_ACTIONS
+
+    import tensorflow as tf
+    model = tf.keras.models.load_model(args.model)
+    X_calibration, X_test, y_test = load_split(args, actions)
+    manual_test, non_manual_test = HOLISTIC_LAYOUT.split_streams(X_test)
+    window = [manual_test[:1], non_manual_test[:1]]
+
+    print("=" * 60)
+    print(f"Quantizing {args.model}: {len(X_calibration)} calibration / {len(X_test)} test windows")
+    print("=" * 60)
+
+    # Reference: the Keras model, batch 1 through a traced function (as StreamingRecognizer)
+    forward = tf.function(lambda manual, non_manual: model([manual, non_manual], training=False))
+    reference = model.predict([manual_test, non_manual_test], verbose=0).argmax(axis=1)
+    rows = [{
+        'mode': 'keras',
+        'size_mb': Path(args.model).stat().st_size / 1e6,
+        'latency_ms': median_latency_ms(forward, *window, args.repeats),
+        'accuracy': float((reference == y_test).mean()),
+        'agreement': 1.0,
+    }]
+
+    representative = representative_windows(X_calibration, args.calibration_samples)
+    exports = [(mode, lambda mode=mode: export_tflite(model, tflite_path(args.model, mode), mode,
+                                                      representative, args.model),
+                lambda path: TFLiteSignRecognizer(path, num_threads=args.threads))
+               for mode in args.modes]
+    if args.saved_model:
+        exports.append(('saved_model',
+                        lambda: export_saved_model(model, saved_model_path(args.model), args.model),
+                        SavedModelSignRecognizer))
+
+    for mode, export, load in exports:
+        start = time.perf_counter()
+        path = export()
+        export_seconds = time.perf_counter() - start
+
+        recognizer = load(path)
+        predicted = recognizer.predict(manual_test, non_manual_test).argmax(axis=1)
+        size = (path.stat().st_size if path.is_file()
+                else sum(f.stat().st_size for f in path.rglob('*') if f.is_file()))
+        rows.append({
+            'mode': mode,
+            'path': str(path),
+            'size_mb': size / 1e6,
+            'latency_ms': median_latency_ms(recognizer.forward, *window, args.repeats),
+            'accuracy': float((predicted == y_test).mean()),
+            'agreement': float((predicted == reference).mean()),
+            'export_seconds': export_seconds,
+        })
+        print(f"[OK] {mode:8s} -> {path} ({export_seconds:.1f}s)")
+
+    keras_row = rows[0]
+    print(f"\n{'model':>11s} {'size':>9s} {'latency':>10s} {'speedup':>8s} "
+          f"{'accuracy':>9s} {'delta':>7s} {'agree':>6s}")
+    for row in rows:
+        print(f"{row['mode']:>11s} {row['size_mb']:7.2f}MB {row['latency_ms']:8.2f}ms "
+              f"{keras_row['latency_ms'] / row['latency_ms']:7.1f}x {row['accuracy'] * 100:8.1f}% "
+              f"{(row['accuracy'] - keras_row['accuracy']) * 100:+6.1f}% {row['agreement'] * 100:5.1f}%")
+
+    report_file = Path(args.model).with_suffix('.quantization.json')
+    with open(report_file, 'w', encoding='utf-8') as f:
+        json.dump({'model': args.model, 'test_windows': len(X_test), 'threads': args.threads,
+                   'results': rows}, f, indent=2)
+    print(f"\nReport saved to {report_file}")
+
+
+if __name__ == "__main__":
+    main()
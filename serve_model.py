@@ -0,0 +1,77 @@
+"""
+Shared inference server for the kiosks on one machine
+
+Loads the trained model once and serves every local kiosk process over a
+Unix socket (see modules/inference_server.py), running their windows in
+dynamically sized batches. Point predict_sign.py at it with
+OMNISIGN_INFERENCE_SERVER=<socket>.
+
+Serve a Keras model (.h5 / .keras) to get batched forward passes; exported
+.tflite / SavedModel artifacts have a fixed batch of 1.
+
+Usage:
+    python serve_model.py --model sign_language_model.h5
+    python serve_model.py --socket /run/omnisign.sock --max-batch-size 16 --max-delay-ms 10
+    OMNISIGN_INFERENCE_SERVER=/tmp/omnisign-inference.sock python predict_sign.py
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project to path
+PROJECT_ROOT = Path(__file__).parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from data_pipeline.keypoint_schema import HOLISTIC_LAYOUT
+from modules.inference_runtime import load_inference_model
+from modules.inference_server import DEFAULT_SOCKET, InferenceServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the sign recognizer to local kiosk processes")
+    parser.add_argument("--model", default="sign_language_model.h5")
+    parser.add_argument("--untrained", type=int, metavar="NUM_CLASSES",
+                        help="Serve an untrained DualStreamSignRecognizer instead (benchmarks)")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET, help="Unix socket to listen on")
+    parser.add_argument("--max-batch-size", type=int, default=32, help="1 disables batching")
+    parser.add_argument("--max-delay-ms", type=float, default=5.0,
+                        help="Longest a request waits for its batch to fill")
+    parser.add_argument("--sequence-length", type=int, default=30)
+    parser.add_argument("--stats-interval", type=float, default=30.0,
+                        help="Seconds between statistics lines (0 disables them)")
+    args = parser.parse_args()
+
+    if args.untrained:
+        from models.dual_stream_model import DualStreamSignRecognizer
+        model, _ = DualStreamSignRecognizer(num_classes=args.untrained,
+                                            sequence_length=args.sequence_length).build_model()
+        name = f"untrained model ({args.untrained} classes)"
+    elif Path(args.model).exists():
+        model = load_inference_model(args.model)
+        name = args.model
+    else:
+        print(f"❌ Model not found: {args.model} (train it with: python train_model.py)")
+        sys.exit(1)
+
+    server = InferenceServer(model, args.socket, HOLISTIC_LAYOUT, args.sequence_length,
+                             max_batch_size=args.max_batch_size, max_delay_ms=args.max_delay_ms)
+    with server:
+        print(f"[OK] Serving {name} on {args.socket} "
+              f"(max batch {args.max_batch_size}, max delay {args.max_delay_ms:g} ms)", flush=True)
+        try:
+            while True:
+                time.sleep(args.stats_interval or 3600)
+                if args.stats_interval:
+                    info = server.info()
+                    print(f"{info['clients']} clients, {info['requests']} requests in "
+                          f"{info['batches']} batches (mean size {info['mean_batch_size']:.1f}), "
+                          f"wait p99 {info['wait']['p99_ms']:.1f} ms, "
+                          f"forward p50 {info['forward']['p50_ms']:.1f} ms", flush=True)
+        except KeyboardInterrupt:
+            print("\nStopping server")
+
+
+if __name__ == "__main__":
+    main()
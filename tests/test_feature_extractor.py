@@ -0,0 +1,38 @@
+"""
+Tests for data_pipeline/feature_extractor.py on recorded landmark sources.
+
+Usage:
+    python -m pytest tests/test_feature_extractor.py
+"""
+
+import sys
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+# Add project to path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from data_pipeline.feature_extractor import MediaPipeFeatureExtractor
+from data_pipeline.keypoint_schema import HOLISTIC_LAYOUT
+
+
+def test_extract_from_webcam_replays_stored_landmarks(tmp_path, monkeypatch):
+    # No display: the preview window is not under test
+    monkeypatch.setattr(cv2, "imshow", lambda *args: None)
+    monkeypatch.setattr(cv2, "waitKey", lambda *args: -1)
+    monkeypatch.setattr(cv2, "destroyAllWindows", lambda: None)
+
+    session = np.random.default_rng(0).uniform(0.1, 0.9, (10, HOLISTIC_LAYOUT.size))
+    session = session.astype(HOLISTIC_LAYOUT.dtype)
+    path = tmp_path / "session.npy"
+    np.save(path, session)
+
+    sequence = MediaPipeFeatureExtractor().extract_from_webcam(
+        duration_seconds=1, num_frames=10, source=str(path))
+
+    assert sequence.shape == (10, HOLISTIC_LAYOUT.size)
+    assert np.abs(sequence).sum() > 0
+    np.testing.assert_allclose(sequence, session, atol=1e-6)
@@ -0,0 +1,51 @@
+"""
+Tests for modules/shared_ring.py: reader positions and overrun accounting.
+
+Usage:
+    python -m pytest tests/test_shared_ring.py
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project to path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from modules.shared_ring import SharedFrameRing
+
+
+@pytest.fixture
+def ring():
+    with SharedFrameRing.create(frame_shape=(4,), capacity=8) as ring:
+        yield ring
+
+
+def write_frames(ring, count):
+    for _ in range(count):
+        ring.write(np.full(4, ring.write_seq, np.float32))
+
+
+def test_oldest_reader_on_full_ring_reports_no_overrun(ring):
+    write_frames(ring, 10)
+    reader = ring.reader('oldest')
+
+    seq, frame = reader.read(timeout=0)
+
+    assert seq == 2 == ring.oldest_seq
+    assert frame[0] == 2
+    assert (reader.overruns, reader.lost) == (0, 0)
+
+
+def test_lapped_reader_skips_to_oldest_and_counts_lost_frames(ring):
+    reader = ring.reader('next')
+    write_frames(ring, 20)
+
+    seq, frame = reader.read(timeout=0)
+
+    assert seq == 12 == ring.oldest_seq
+    assert frame[0] == 12
+    assert (reader.overruns, reader.lost) == (1, 12)
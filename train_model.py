@@ -11,15 +11,19 @@ import numpy as np
 import tensorflow as tf
 from tensorflow import keras
 import matplotlib.pyplot as plt
-from typing import Tuple
+from typing import Tuple, Optional
 
 # Add project to path
 PROJECT_ROOT = Path(__file__).parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from models.dual_stream_model import DualStreamSignRecognizer
+from models.causal_stream_model import CausalDualStreamSignRecognizer
 from models.ctc_training import CTCTrainingPipeline
+from data_pipeline.augmentation import StreamingAugmenter
 from data_pipeline.data_loader import DataLoader
+from data_pipeline.keypoint_schema import HOLISTIC_LAYOUT
+from data_pipeline.normalization import normalizer_path
 
 
 class OmniSignTrainer:
@@ -29,7 +33,10 @@ class OmniSignTrainer:
     
     def __init__(self, data_path: str = "Sign_Language_Data",
                 actions: list = None,
-                checkpoint_dir: str = "checkpoints"):
+                checkpoint_dir: str = "checkpoints",
+                memmap_dir: Optional[str] = None,
+                causal: bool = False,
+                convert_legacy: bool = False):
         """
         Initialize trainer.
         
@@ -37,6 +44,13 @@ class OmniSignTrainer:
             data_path (str): Path to training data
             actions (list): List of actions to recognize
             checkpoint_dir (str): Directory for checkpoints
+            memmap_dir (str, optional): Keep the dataset memory-mapped in this
+                directory instead of loading it into RAM
+            causal (bool): Train the causal/stateful variant, which predict_sign.py
+                runs one frame at a time
+            convert_legacy (bool): Convert frames saved in a legacy keypoint
+                layout (258/1662 dims) instead of rejecting them; or convert the
+                data once with migrate_data.py --convert-legacy
         """
         
         if actions is None:
@@ -46,17 +60,30 @@ class OmniSignTrainer:
         
         self.data_path = data_path
         self.checkpoint_dir = checkpoint_dir
+        self.memmap_dir = memmap_dir
+        self.causal = causal
+        self.convert_legacy = convert_legacy
         self.num_classes = len(self.actions)
         
-        # Model parameters
+        # Model parameters (stream widths come from the shared keypoint layout)
+        self.layout = HOLISTIC_LAYOUT
         self.sequence_length = 30
-        self.manual_features = 168
-        self.non_manual_features = 332
+        self.manual_features = self.layout.manual_size
+        self.non_manual_features = self.layout.non_manual_size
         
         # Training parameters
         self.batch_size = 32
         self.epochs = 50
         self.learning_rate = 1e-3
+        self.input_mode = "numpy"  # or "tf.data" to prefetch batches on a background thread
+        self.run_eagerly = False   # True to debug train/eval steps eagerly
+        self.jit_compile = False   # True to XLA-compile the train/eval steps
+        
+        # Augmentation, applied per batch while training
+        self.augmentation_factor = 2
+        self.seed = 42
+        self.augmenter = StreamingAugmenter(self.layout, seed=self.seed)
+        self.loader = None
         
         print("OmniSign Trainer Initialized")
         print(f"  Actions: {self.actions}")
@@ -76,36 +103,37 @@ class OmniSignTrainer:
         print("LOADING AND PREPARING DATA")
         print("="*60)
         
-        # Initialize loader
-        loader = DataLoader(
+        # Initialize loader (kept for batch generation during training)
+        loader = self.loader = DataLoader(
             data_path=self.data_path,
             actions=self.actions,
-            no_sequences=30,
-            sequence_length=self.sequence_length
+            sequence_length=self.sequence_length,
+            convert_legacy=self.convert_legacy
         )
         
         # Load data
         print("\n1. Loading data...")
-        X, y = loader.load_data()
+        if self.memmap_dir:
+            X, y = loader.load_memmap(self.memmap_dir)
+        else:
+            X, y = loader.load_data()
         
         if X.shape[0] == 0:
             print("No data found. Creating dummy data for demonstration...")
-            X = np.random.randn(150, self.sequence_length, 500)
+            X = np.random.randn(150, self.sequence_length, self.layout.size)
             y = np.repeat(np.arange(self.num_classes), 30)
         
-        # Normalize
+        # Normalize (chunked, memmap to memmap, in memory-mapped mode)
         print("\n2. Normalizing data...")
         X_normalized = loader.normalize(X, fit=True)
+        # Batches are augmented in raw coordinates, then standardized again
+        self.augmenter.normalizer = loader.normalizer
         print(f"   Range: [{X_normalized.min():.4f}, {X_normalized.max():.4f}]")
         
-        # Augment
-        print("\n3. Augmenting data (2x)...")
-        X_augmented, y_augmented = loader.augment_data(X_normalized, y, augmentation_factor=2)
-        
-        # Split
-        print("\n4. Splitting data...")
+        # Split (training batches are augmented on the fly, see train())
+        print("\n3. Splitting data...")
         X_train, X_val, X_test, y_train, y_val, y_test = loader.split_data(
-            X_augmented, y_augmented, train_ratio=0.7, val_ratio=0.15
+            X_normalized, y, train_ratio=0.7, val_ratio=0.15
         )
         
         return X_train, X_val, X_test, y_train, y_val, y_test
@@ -122,7 +150,8 @@ class OmniSignTrainer:
         print("BUILDING MODEL")
         print("="*60)
         
-        recognizer = DualStreamSignRecognizer(
+        recognizer_class = CausalDualStreamSignRecognizer if self.causal else DualStreamSignRecognizer
+        recognizer = recognizer_class(
             num_classes=self.num_classes,
             manual_features=self.manual_features,
             non_manual_features=self.non_manual_features,
@@ -142,19 +171,15 @@ class OmniSignTrainer:
         Split data into manual and non-manual streams.
         
         Args:
-            X (np.ndarray): Combined features (N, sequence_length, 500)
+            X (np.ndarray): Combined features (N, sequence_length, layout.size)
             
         Returns:
-            Tuple: (manual_stream, non_manual_stream)
+            Tuple: (manual_stream, non_manual_stream) - views into X
         """
         
         # Manual stream: hand landmarks (168 dims)
-        manual_stream = X[:, :, :self.manual_features]
-        
-        # Non-manual stream: facial + body landmarks
-        non_manual_stream = X[:, :, self.manual_features:self.manual_features + self.non_manual_features]
-        
-        return manual_stream, non_manual_stream
+        # Non-manual stream: facial + body landmarks (1536 dims)
+        return self.layout.split_streams(X)
     
     def train(self, X_train: np.ndarray, X_val: np.ndarray,
              y_train: np.ndarray, y_val: np.ndarray) -> keras.Model:
@@ -184,8 +209,25 @@ class OmniSignTrainer:
         print(f"  Manual stream: {X_train_manual.shape}")
         print(f"  Non-manual stream: {X_train_non_manual.shape}")
         
+        # Shuffled batches, augmented per sample as they are drawn
+        loader = self.loader or DataLoader(self.data_path, self.actions,
+                                           sequence_length=self.sequence_length)
+        
+        def train_batches(epoch: int):
+            for X_batch, y_batch in loader.create_batches(
+                    X_train, y_train, self.batch_size, shuffle=True,
+                    augmenter=self.augmenter,
+                    augmentation_factor=self.augmentation_factor,
+                    seed=self.seed + epoch):
+                yield list(self.prepare_dual_stream_inputs(X_batch)), y_batch
+        
+        steps_per_epoch = -(-len(y_train) * self.augmentation_factor // self.batch_size)
+        print(f"  Augmentation: {self.augmentation_factor}x per epoch (streamed)")
+        
         # Create training pipeline
-        pipeline = CTCTrainingPipeline(training_model, self.num_classes, self.checkpoint_dir)
+        pipeline = CTCTrainingPipeline(training_model, self.num_classes, self.checkpoint_dir,
+                                       run_eagerly=self.run_eagerly,
+                                       jit_compile=self.jit_compile)
         
         # Train
         print("\nStarting training...")
@@ -195,7 +237,10 @@ class OmniSignTrainer:
             epochs=self.epochs,
             batch_size=self.batch_size,
             learning_rate=self.learning_rate,
-            early_stopping_patience=10
+            early_stopping_patience=10,
+            train_batches=train_batches,
+            steps_per_epoch=steps_per_epoch,
+            input_mode=self.input_mode
         )
         
         # Save history
@@ -284,7 +329,7 @@ class OmniSignTrainer:
     
     def save_model(self, model: keras.Model, filename: str = "omnisign_model.h5"):
         """
-        Save trained model.
+        Save trained model, with its normalization statistics alongside.
         
         Args:
             model: Trained model
@@ -293,6 +338,11 @@ class OmniSignTrainer:
         
         model.save(filename)
         print(f"\nModel saved to {filename}")
+        
+        if self.loader is not None and self.loader.normalizer.is_fitted:
+            stats_file = normalizer_path(filename)
+            self.loader.normalizer.save(stats_file)
+            print(f"Normalization statistics saved to {stats_file}")
 
 
 def main():
@@ -305,7 +355,8 @@ def main():
     # Initialize trainer
     trainer = OmniSignTrainer(
         data_path="Sign_Language_Data",
-        actions=["Hello", "How are you", "I need help", "Thank you", "Goodbye"]
+        actions=["Hello", "How are you", "I need help", "Thank you", "Goodbye"],
+        convert_legacy=True  # The shipped data has 258-dim frames from older recordings
     )
     
     # Load data
@@ -1,9 +1,14 @@
 
 import cv2
-import numpy as np
 import random
 import time
 
+from data_pipeline.keypoint_schema import HOLISTIC_LAYOUT
+from modules.quality_tiers import (
+    DEFAULT_TIER, AdaptiveQualityController, TieredDetector, create_detector
+)
+from modules.frame_source import ReplayDetector
+
 # Try to import MediaPipe, but provide fallback if it fails
 try:
     import mediapipe as mp
@@ -46,7 +51,7 @@ class MockResults:
 
 class MockHolistic:
     """Simulates the MediaPipe Holistic model interface."""
-    def __init__(self, min_detection_confidence=0.5, min_tracking_confidence=0.5):
+    def __init__(self, min_detection_confidence=0.5, min_tracking_confidence=0.5, **kwargs):
         pass
     
     def __enter__(self):
@@ -60,24 +65,57 @@ class MockHolistic:
         return MockResults()
 
     # Allow direct instantiation for 'with' block compatibility if needed
-    def Holistic(self, min_detection_confidence=0.5, min_tracking_confidence=0.5):
+    def Holistic(self, min_detection_confidence=0.5, min_tracking_confidence=0.5, **kwargs):
         return self
 
 # Use MockHolistic if real one is missing
 if not mp_holistic:
     mp_holistic = MockHolistic()
 
-def mediapipe_detection(image, model):
+def create_holistic(min_detection_confidence=0.5, min_tracking_confidence=0.5,
+                    tier=DEFAULT_TIER):
+    """
+    Create the MediaPipe detector for a quality tier ('full', 'lite',
+    'face_off'; see modules/quality_tiers.py), or the Mock when MediaPipe is
+    missing. Usable as a context manager.
+    """
+    if not HAS_MEDIAPIPE:
+        return mp_holistic.Holistic(
+            min_detection_confidence=min_detection_confidence,
+            min_tracking_confidence=min_tracking_confidence
+        )
+    return create_detector(tier, min_detection_confidence, min_tracking_confidence)
+
+def create_adaptive_holistic(initial_tier=DEFAULT_TIER, target_fps=30.0, log_path=None,
+                             min_detection_confidence=0.5, min_tracking_confidence=0.5):
+    """
+    Create a detector that steps down a quality tier when detection exceeds
+    the frame budget and back up when there is headroom (tier changes are
+    printed with timestamps and optionally appended to log_path).
+    """
+    controller = AdaptiveQualityController(initial_tier, target_fps, log_path=log_path)
+    return TieredDetector(controller, lambda tier: create_holistic(
+        min_detection_confidence, min_tracking_confidence, tier
+    ))
+
+def mediapipe_detection(image, model, roi_tracker=None):
     """
-    Process image with MediaPipe Holistic model (or Mock).
+    Process image with MediaPipe Holistic model (or Mock, or the
+    ReplayDetector of a landmark replay source).
+
+    With a RoiTracker (modules/roi_tracker.py) the model only sees the crop
+    around the signer; landmarks are returned in full-frame coordinates.
     """
     if model is None:
         return image, None
         
     # Check if it's the real MediaPipe model or our Mock
     if hasattr(model, 'process'):
+        is_real = HAS_MEDIAPIPE and not isinstance(model, (MockHolistic, ReplayDetector))
+        if roi_tracker is not None:
+            return image, roi_tracker.process(model, image, to_rgb=is_real)
          # If it's real mediapipe, needs RGB
-        if HAS_MEDIAPIPE and not isinstance(model, MockHolistic):
+        if is_real:
             image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
             image.flags.writeable = False
             results = model.process(image)
@@ -91,38 +129,18 @@ def mediapipe_detection(image, model):
             
     return image, None
 
-def extract_keypoints(results):
-    """
-    Extracts keypoints or returns zeros if results are None/Mock.
+def extract_keypoints(results, out=None):
     """
-    if not results:
-         return np.zeros(1662)
+    Extracts keypoints in the shared HOLISTIC_LAYOUT (1704 dims),
+    or zeros if results are None/Mock with nothing detected.
 
-    # 1. Pose Landmarks (33 * 4 = 132)
-    if results.pose_landmarks:
-        pose = np.array([[res.x, res.y, res.z, res.visibility] for res in results.pose_landmarks.landmark]).flatten()
-    else:
-        pose = np.zeros(33 * 4)
-        
-    # 2. Face Landmarks (468 * 3 = 1404)
-    if results.face_landmarks:
-        face = np.array([[res.x, res.y, res.z] for res in results.face_landmarks.landmark]).flatten()
-    else:
-        face = np.zeros(468 * 3)
-        
-    # 3. Left Hand Landmarks (21 * 3 = 63)
-    if results.left_hand_landmarks:
-        lh = np.array([[res.x, res.y, res.z] for res in results.left_hand_landmarks.landmark]).flatten()
-    else:
-        lh = np.zeros(21 * 3)
-
-    # 4. Right Hand Landmarks (21 * 3 = 63)
-    if results.right_hand_landmarks:
-        rh = np.array([[res.x, res.y, res.z] for res in results.right_hand_landmarks.landmark]).flatten()
-    else:
-        rh = np.zeros(21 * 3)
-        
-    return np.concatenate([pose, face, lh, rh])
+    Layout: left hand (21 * 4), right hand (21 * 4), face (468 * 3), pose (33 * 4).
+    Pass a preallocated float32 ``out`` buffer to avoid allocating per frame.
+    """
+    if out is None:
+        out = HOLISTIC_LAYOUT.allocate()
+    HOLISTIC_LAYOUT.fill_from_results(results, out)
+    return out
 
 def draw_styled_landmarks(image, results):
     """
@@ -179,3 +197,5 @@ def draw_styled_landmarks(image, results):
             cx, cy = int(lm.x * w), int(lm.y * h)
             cv2.circle(image, (cx, cy), 5, (0, 255, 0), -1)
 
+# Shorter alias used by the real-time scripts
+draw_landmarks = draw_styled_landmarks